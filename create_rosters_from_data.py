@@ -11,7 +11,8 @@ from pathlib import Path
 # Add current directory to path
 sys.path.insert(0, ".")
 
-from wrestling_simulator import Roster, Wrestler
+from wrestling_simulator import Roster
+from wrestling_simulator.schema import SCHEMA
 
 
 def load_wrestler_names(file_path):
@@ -30,35 +31,21 @@ def load_wrestler_names(file_path):
 
 def create_roster_from_names(name, wrestler_names, gender, count=8):
     """Create a roster with wrestlers from the given name list."""
-    roster = Roster(auto_fill=False)
-    roster.roster = []
-
     selected_names = random.sample(wrestler_names, min(count, len(wrestler_names)))
 
+    records = []
     for name in selected_names:
-        strength = random.randint(50, 100)
-        power = random.randint(50, 100)
-        speed = random.randint(30, 100)
-        health = random.randint(100, 200)
-        stamina = random.randint(50, 100)
-        grapple = random.randint(1, 20)
-
-        agility = random.randint(10, 100)
-
-        wrestler = Wrestler(
-            name=name,
-            gender=gender,
-            strength=strength,
-            power=power,
-            speed=speed,
-            agility=agility,
-            health=health,
-            stamina=stamina,
-            grapple=grapple,
+        # "mixed" rosters draw each wrestler's gender individually
+        sex = gender if gender != "mixed" else random.choice(["male", "female"])
+        # Data-folder wrestlers are a little tougher than the full schema range
+        records.append(
+            SCHEMA.random_record(
+                name, sex, strength=(50, 100), health=(100, 200), stamina=(50, 100)
+            )
         )
-        roster.roster.append(wrestler)
 
-    return roster
+    # Validates every record in one pass and reports all problems together
+    return Roster.from_records(records)
 
 
 def main():
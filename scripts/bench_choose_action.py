@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark action selection in Wrestler.chooseAction.
+
+Compares the per-turn cost of the old selection (a fresh list of bound
+methods and weights passed to random.choices) with the precomputed
+cumulative-weight tables in wrestling_simulator.core.actions, first for the
+choice alone and then for whole turns with the action played.
+
+Usage:
+    python scripts/bench_choose_action.py
+    python scripts/bench_choose_action.py --turns 500000 --repeat 7
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wrestling_simulator.core.actions import (  # noqa: E402
+    choose_action,
+    health_bucket,
+)
+from wrestling_simulator.core.commentary import silenced  # noqa: E402
+from wrestling_simulator.core.wrestler import Wrestler  # noqa: E402
+
+
+def old_choice(self, opponent):
+    """The selection chooseAction made before the tables."""
+    func_list = [self.attack, self.grappleOpponent, self.pinOpponent]
+    if opponent.health <= (opponent.max_health // 2):
+        weights = [0.4, 0.7, 1.5]
+    else:
+        weights = [1.9, 1.5, 0.3]
+    return random.choices(func_list, weights=weights, k=1)[0]
+
+
+def old_choose_action(self, opponent):
+    old_choice(self, opponent)(opponent)
+
+
+def table_choice(self, opponent):
+    return choose_action(health_bucket(opponent.health, opponent.max_health))
+
+
+def per_call_ns(function, calls, repeat):
+    """Best time per call over ``repeat`` runs of ``calls`` calls, in ns."""
+    return min(timeit.repeat(function, number=calls, repeat=repeat)) / calls * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Wrestler.chooseAction.")
+    parser.add_argument("--turns", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    player = Wrestler("Bench A", "male", 70, 70, 70, 150, 70, 10, 70)
+    opponent = Wrestler("Bench B", "male", 70, 70, 70, 150, 70, 10, 70)
+
+    def turns_of(choose_action_method):
+        def turn():
+            if opponent.health <= 0 or opponent.is_defeated:
+                player.recover()
+                opponent.recover()
+            choose_action_method(player, opponent)
+
+        return turn
+
+    cases = [
+        ("choice only, random.choices", lambda: old_choice(player, opponent)),
+        ("choice only, action tables", lambda: table_choice(player, opponent)),
+        ("whole turn, random.choices", turns_of(old_choose_action)),
+        ("whole turn, chooseAction", turns_of(Wrestler.chooseAction)),
+    ]
+    results = []
+    with silenced():
+        for label, function in cases:
+            random.seed(1)
+            player.recover()
+            opponent.recover()
+            results.append((label, per_call_ns(function, args.turns, args.repeat)))
+
+    width = max(len(label) for label, _ in results)
+    for label, ns in results:
+        print(f"{label:<{width}}  {ns:8.1f} ns")
+    before, after = results[2][1], results[3][1]
+    saving = before - after
+    print(f"\nSaving per turn: {saving:.1f} ns ({saving / before:.0%})")
+
+
+if __name__ == "__main__":
+    main()
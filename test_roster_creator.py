@@ -16,9 +16,9 @@ def test_roster_creation():
 
     try:
         # Import the roster creation functions
-        from create_all_rosters import (
+        from wrestling_simulator.core.roster_builder import build_custom
+        from wrestling_simulator.utils.file_utils import (
             load_wrestler_names_from_file,
-            create_custom_roster,
         )
 
         # Test loading names from file
@@ -29,29 +29,23 @@ def test_roster_creation():
 
         # Test creating a custom roster
         print("\n2. Testing custom roster creation...")
-        success = create_custom_roster(
-            "sample_wrestlers.txt", "test_roster", "balanced", 6, "mixed"
-        )
-
-        if success:
-            print("   ✓ Custom roster created successfully!")
+        build_custom(names, "test_roster", "balanced", 6, "mixed")
+        print("   ✓ Custom roster created successfully!")
 
-            # Check if the file was created
-            roster_file = "rosters/test_roster.pickle"
-            if os.path.exists(roster_file):
-                print(f"   ✓ Roster file exists: {roster_file}")
+        # Check if the file was created
+        roster_file = "rosters/test_roster.pickle"
+        if os.path.exists(roster_file):
+            print(f"   ✓ Roster file exists: {roster_file}")
 
-                # Test loading the roster
-                import pickle
+            # Test loading the roster
+            import pickle
 
-                with open(roster_file, "rb") as f:
-                    roster_data = pickle.load(f)
-                print(f"   ✓ Roster contains {len(roster_data)} wrestlers")
-                print(f"   ✓ First wrestler: {roster_data[0]['name']}")
-            else:
-                print("   ❌ Roster file was not created")
+            with open(roster_file, "rb") as f:
+                roster_data = pickle.load(f)
+            print(f"   ✓ Roster contains {len(roster_data)} wrestlers")
+            print(f"   ✓ First wrestler: {roster_data[0].name}")
         else:
-            print("   ❌ Failed to create custom roster")
+            print("   ❌ Roster file was not created")
 
         print("\n✅ All tests completed!")
 
@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from wrestling_simulator.core.actions import (
+    ACTION_NAMES,
+    ACTION_WEIGHTS,
+    FRESH,
+    HURT,
+    PIN_ACTION,
+    choose_action,
+    health_bucket,
+)
+from wrestling_simulator.core.commentary import silenced
+from wrestling_simulator.core.metrics import (
+    disable_metrics,
+    enable_metrics,
+    metrics_snapshot,
+    reset_metrics,
+)
+from wrestling_simulator.core.wrestler import Wrestler
+
+
+class TestActions(unittest.TestCase):
+    def test_same_draws_as_random_choices(self):
+        for bucket in (HURT, FRESH):
+            random.seed(bucket)
+            weights = ACTION_WEIGHTS[bucket]
+            expected = [random.choices(range(3), weights)[0] for _ in range(5000)]
+            random.seed(bucket)
+            self.assertEqual([choose_action(bucket) for _ in range(5000)], expected)
+
+    def test_health_bucket(self):
+        self.assertEqual(health_bucket(75, 150), HURT)
+        self.assertEqual(health_bucket(76, 150), FRESH)
+        self.assertEqual(health_bucket(0, 151), HURT)
+
+    def test_own_generator(self):
+        rng = random.Random(3)
+        first = [choose_action(HURT, rng.random) for _ in range(100)]
+        rng.seed(3)
+        self.assertEqual(first, [choose_action(HURT, rng.random) for _ in range(100)])
+        self.assertEqual(choose_action(HURT, lambda: 0.999999), PIN_ACTION)
+        self.assertEqual(choose_action(FRESH, lambda: 0.0), 0)
+
+    def test_choose_action_follows_tables(self):
+        player = Wrestler("A", "male", 70, 70, 70, 150, 70, 10, 70)
+        opponent = Wrestler("B", "male", 70, 70, 70, 150, 70, 10, 70)
+        opponent.health = 40
+        random.seed(4)
+        state = random.getstate()
+        expected = choose_action(HURT)
+        random.setstate(state)
+        reset_metrics()
+        enable_metrics()
+        try:
+            with silenced():
+                player.chooseAction(opponent)
+            actions = metrics_snapshot()["actions"]
+        finally:
+            disable_metrics()
+            reset_metrics()
+        self.assertEqual(actions[ACTION_NAMES[expected]], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import random
+import unittest
+
+from wrestling_simulator.core.battle_royal import ActiveSet, BattleRoyal
+from wrestling_simulator.core.commentary import redirected, silenced
+from wrestling_simulator.core.wrestler import Wrestler
+
+
+def make_wrestlers(count):
+    return [
+        Wrestler(
+            f"Wrestler{i}",
+            "male",
+            40 + i % 12 * 5,
+            70,
+            60,
+            150,
+            50 + i % 10 * 5,
+            10,
+            75,
+        )
+        for i in range(count)
+    ]
+
+
+class TestActiveSet(unittest.TestCase):
+    def test_add_remove_and_sample(self):
+        active = ActiveSet(10)
+        for index in range(10):
+            active.add(index)
+        active.remove(3)
+        active.remove(9)
+        active.remove(0)
+        self.assertEqual(len(active), 7)
+        self.assertEqual(sorted(active), [1, 2, 4, 5, 6, 7, 8])
+        self.assertNotIn(3, active)
+        for index in active:
+            self.assertEqual(active.members[active.position[index]], index)
+        for _ in range(200):
+            first, second = active.sample_pair()
+            self.assertNotEqual(first, second)
+            self.assertIn(first, active)
+            self.assertIn(second, active)
+        with self.assertRaises(KeyError):
+            active.remove(3)
+
+
+class TestBattleRoyal(unittest.TestCase):
+    def setUp(self):
+        random.seed(11)
+
+    def play(self, entrants, **options):
+        battle_royal = BattleRoyal(make_wrestlers(entrants), **options)
+        with silenced():
+            winner = battle_royal.play()
+        return battle_royal, winner
+
+    def test_everyone_but_the_winner_is_eliminated(self):
+        battle_royal, winner = self.play(30)
+        self.assertEqual(battle_royal.entered, 30)
+        self.assertEqual(len(battle_royal.eliminations), 29)
+        eliminated = {e.wrestler for e in battle_royal.eliminations}
+        self.assertNotIn(winner, eliminated)
+        self.assertEqual(len(eliminated), 29)
+        self.assertEqual(sum(battle_royal.elimination_counts), 29)
+        for elimination in battle_royal.eliminations:
+            self.assertIsNot(elimination.wrestler, elimination.eliminated_by)
+
+    def test_staggered_entry(self):
+        battle_royal, _ = self.play(30, entry_interval=5)
+        entries = list(battle_royal.entry_turn)
+        self.assertEqual(entries[:2], [0, 0])
+        self.assertEqual(entries, sorted(entries))
+        for earlier, later in zip(entries[1:], entries[2:]):
+            self.assertLessEqual(later - earlier, 5)
+
+    def test_standings(self):
+        battle_royal, winner = self.play(12)
+        standings = battle_royal.standings()
+        self.assertEqual(len(standings), 12)
+        self.assertIs(standings[0]["wrestler"], winner)
+        self.assertIs(standings[1]["wrestler"], battle_royal.eliminations[-1].wrestler)
+        self.assertEqual(len(battle_royal.standings(top=3)), 3)
+        for row in standings:
+            self.assertGreaterEqual(row["time_in_ring"], 0)
+
+    def test_commentary(self):
+        lines = []
+        battle_royal = BattleRoyal(make_wrestlers(4), shuffle=False)
+        with redirected(lines.append):
+            winner = battle_royal.play()
+        self.assertEqual(lines[0], "Wrestler0 enters the ring at number 1!")
+        self.assertEqual(lines[-1], f"{winner.name} wins the battle royal!!!")
+        self.assertEqual(sum("has been eliminated" in line for line in lines), 3)
+
+    def test_large_field(self):
+        battle_royal, _ = self.play(2000)
+        self.assertEqual(len(battle_royal.eliminations), 1999)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            BattleRoyal(make_wrestlers(1))
+        with self.assertRaises(ValueError):
+            BattleRoyal(make_wrestlers(10), entry_interval=0)
+        with self.assertRaises(ValueError):
+            BattleRoyal(make_wrestlers(10), starting=11)
+        battle_royal, _ = self.play(4)
+        with self.assertRaises(ValueError):
+            battle_royal.play()
+        with self.assertRaises(ValueError):
+            BattleRoyal(make_wrestlers(4)).standings()
+
+
+if __name__ == "__main__":
+    unittest.main()
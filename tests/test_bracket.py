@@ -0,0 +1,105 @@
+import unittest
+
+from wrestling_simulator.core.bracket import (
+    Bracket,
+    bracket_size,
+    pair_slots,
+    seed_positions,
+)
+from wrestling_simulator.core.wrestler import Wrestler
+
+
+def make_wrestlers(count):
+    return [
+        Wrestler(f"Wrestler{i}", "male", 40 + i * 5, 70, 60, 150, 50 + i * 5, 10, 75)
+        for i in range(count)
+    ]
+
+
+class TestBracket(unittest.TestCase):
+    def test_bracket_size(self):
+        self.assertEqual(bracket_size(4), 4)
+        self.assertEqual(bracket_size(5), 8)
+        self.assertEqual(bracket_size(9), 16)
+
+    def test_seed_positions(self):
+        self.assertEqual(seed_positions(8), [0, 7, 3, 4, 1, 6, 2, 5])
+        with self.assertRaises(ValueError):
+            seed_positions(6)
+
+    def test_top_seeds_get_byes(self):
+        wrestlers = make_wrestlers(5)
+        bracket = Bracket(wrestlers)
+        self.assertEqual(bracket.size, 8)
+        self.assertEqual(bracket.byes, 3)
+        self.assertEqual(bracket.rounds, 3)
+        # The strongest wrestler is the last one built
+        self.assertEqual(bracket.seed_of(wrestlers[-1]), 1)
+        byes = [first for first, second in bracket.first_round() if second is None]
+        self.assertEqual(byes, [bracket.seeds[0], bracket.seeds[1], bracket.seeds[2]])
+
+    def test_unseeded_keeps_order(self):
+        wrestlers = make_wrestlers(4)
+        bracket = Bracket(wrestlers, seeded=False)
+        self.assertEqual(
+            bracket.first_round(),
+            [(wrestlers[0], wrestlers[3]), (wrestlers[1], wrestlers[2])],
+        )
+
+    def test_tree_layout(self):
+        bracket = Bracket(make_wrestlers(8))
+        self.assertEqual(list(bracket.round_nodes(1)), [4, 5, 6, 7])
+        self.assertEqual(list(bracket.round_nodes(3)), [1])
+        self.assertEqual(bracket.pairings(1), bracket.first_round())
+        self.assertEqual(bracket.pairings(2), [(None, None), (None, None)])
+        with self.assertRaises(ValueError):
+            bracket.round_nodes(4)
+
+    def test_path_queries(self):
+        bracket = Bracket(make_wrestlers(8))
+        top, second, eighth = bracket.seeds[0], bracket.seeds[1], bracket.seeds[7]
+        self.assertEqual(bracket.leaf(top), 8)
+        self.assertEqual(bracket.match_node(top, 1), 4)
+        self.assertEqual(bracket.match_node(top, 3), 1)
+        self.assertEqual(bracket.meeting_round(top, eighth), 1)
+        self.assertEqual(bracket.meeting_round(top, second), 3)
+        self.assertIs(bracket.next_opponent(top), eighth)
+
+    def test_record_winner_advances(self):
+        bracket = Bracket(make_wrestlers(4))
+        top = bracket.seeds[0]
+        node = bracket.match_node(top, 1)
+        bracket.record_winner(node, top)
+        self.assertEqual(bracket.current_node(top), node)
+        self.assertEqual(bracket.next_opponent_slot(top), node ^ 1)
+        self.assertIsNone(bracket.next_opponent(top))  # other semi not played
+        with self.assertRaises(ValueError):
+            bracket.record_winner(node ^ 1, top)
+        for semi in bracket.round_nodes(1):
+            bracket.record_winner(semi, bracket.contestants(semi)[0])
+        bracket.record_winner(1, top)
+        self.assertIs(bracket.champion, top)
+
+    def test_bytes_round_trip(self):
+        bracket = Bracket(make_wrestlers(5))
+        node = bracket.match_node(bracket.seeds[0], 1)
+        bracket.record_winner(node, bracket.seeds[0])
+        restored = Bracket.from_bytes(bracket.to_bytes(), bracket.seeds)
+        self.assertEqual(list(restored.tree), list(bracket.tree))
+        self.assertEqual(restored.slots, bracket.slots)
+        self.assertEqual(restored.current_node(bracket.seeds[0]), node)
+        with self.assertRaises(ValueError):
+            Bracket.from_bytes(bracket.to_bytes(), bracket.seeds[:4])
+        with self.assertRaises(ValueError):
+            Bracket.from_bytes(b"XXXX" + bracket.to_bytes()[4:], bracket.seeds)
+
+    def test_pair_slots(self):
+        self.assertEqual(pair_slots([1, 2, 3, 4]), [(1, 2), (3, 4)])
+
+    def test_too_few_entrants(self):
+        with self.assertRaises(ValueError):
+            Bracket(make_wrestlers(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import io
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+from wrestling_simulator.cli.main import load_named_roster, main
+from wrestling_simulator.core.roster import Roster
+from wrestling_simulator.core.wrestler import Wrestler
+
+
+class TestCommands(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmpdir.name)
+        os.makedirs("rosters")
+        roster = Roster(auto_fill=False)
+        roster.roster = [
+            Wrestler(
+                f"Wrestler{i}", "male", 40 + i * 5, 70, 60, 150, 50 + i * 5, 10, 75
+            )
+            for i in range(8)
+        ]
+        roster.save_roster("eight.pickle")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmpdir.cleanup()
+
+    def run_cli(self, *argv):
+        out = io.StringIO()
+        with redirect_stdout(out), redirect_stderr(io.StringIO()):
+            status = main(list(argv))
+        return status, out.getvalue()
+
+    def test_list(self):
+        status, out = self.run_cli("list", "--format", "json")
+        self.assertEqual(status, 0)
+        self.assertEqual(json.loads(out), [{"roster": "eight.pickle", "wrestlers": 8}])
+
+    def test_run(self):
+        status, out = self.run_cli("run", "eight", "--no-pace", "--format", "json")
+        self.assertEqual(status, 0)
+        [row] = json.loads(out)
+        self.assertIn(row["champion"], [f"Wrestler{i}" for i in range(8)])
+        self.assertEqual(row["matches"], 7)
+
+    def test_simulate_is_reproducible(self):
+        args = ("simulate", "eight", "-n", "20", "-p", "4", "--seed", "5")
+        _, first = self.run_cli(*args, "--format", "csv")
+        _, second = self.run_cli(*args, "--format", "csv")
+        self.assertEqual(first, second)
+        lines = first.splitlines()
+        self.assertEqual(lines[0], "wrestler,titles,share")
+        self.assertEqual(sum(int(line.split(",")[1]) for line in lines[1:]), 20)
+
+    def test_simulate_workers_match_in_process(self):
+        args = ("simulate", "eight", "-n", "12", "--seed", "9", "--format", "json")
+        _, in_process = self.run_cli(*args)
+        _, pooled = self.run_cli(*args, "--workers", "2")
+        self.assertEqual(json.loads(in_process), json.loads(pooled))
+
+    def test_odds(self):
+        status, out = self.run_cli(
+            "odds", "eight", "Wrestler7", "Wrestler0", "--format", "json"
+        )
+        self.assertEqual(status, 0)
+        rows = json.loads(out)
+        self.assertAlmostEqual(sum(r["win_probability"] for r in rows), 1.0)
+        self.assertGreater(rows[0]["win_probability"], 0.5)
+
+    def test_matrix(self):
+        status, out = self.run_cli("matrix", "eight")
+        self.assertEqual(status, 0)
+        lines = out.splitlines()
+        self.assertTrue(lines[0].startswith("wrestler,opponent,strength,"))
+        self.assertEqual(len(lines), 1 + 8 * 7)
+        status, _ = self.run_cli(
+            "matrix", "eight", "--stat", "power", "--format", "markdown", "-o", "p.md"
+        )
+        self.assertEqual(status, 0)
+        with open("p.md") as f:
+            self.assertEqual(len(f.read().splitlines()), 2 + 8)
+        self.assertEqual(self.run_cli("matrix", "eight", "--stat", "luck")[0], 1)
+
+    def test_build_rosters(self):
+        with open("names.txt", "w") as f:
+            f.write("# my names\nAlpha\nBravo\nCharlie\n")
+        status, out = self.run_cli(
+            "build-rosters",
+            "-f",
+            "names.txt",
+            "-o",
+            "mine",
+            "-c",
+            "2",
+            "--seed",
+            "1",
+            "--format",
+            "json",
+        )
+        self.assertEqual(status, 0)
+        self.assertEqual(json.loads(out)[0]["wrestlers"], 2)
+        roster = Roster(auto_fill=False)
+        roster.load_roster("rosters/mine.pickle")
+        self.assertEqual([w.name for w in roster.roster], ["Alpha", "Bravo"])
+        args = ("build-rosters", "-f", "names.txt", "-o", "bad", "-t", "giant")
+        self.assertEqual(self.run_cli(*args)[0], 1)
+
+    def test_migrate_rosters(self):
+        with open("rosters/old.pickle", "wb") as f:
+            record = dict(name="Old", gender="male", strength=70, power=70, speed=70)
+            record.update(health=150, stamina=70, grapple=10, technique=70)
+            pickle.dump([record], f)
+        status, out = self.run_cli("migrate-rosters", "--format", "json")
+        self.assertEqual(status, 0)
+        rows = {row["roster"]: row["status"] for row in json.loads(out)}
+        self.assertEqual(rows, {"eight.pickle": "migrated", "old.pickle": "migrated"})
+        self.assertIsInstance(load_named_roster("old").roster[0], Wrestler)
+
+    def test_merge_rosters(self):
+        args = ("merge-rosters", "twice", "eight", "rosters/eight.pickle")
+        status, out = self.run_cli(*args, "--format", "json")
+        self.assertEqual(status, 0)
+        [row] = json.loads(out)
+        self.assertEqual(row["roster"], "twice.pickle")
+        self.assertEqual((row["read"], row["written"], row["duplicates"]), (16, 8, 8))
+        self.assertEqual(len(load_named_roster("twice").roster), 8)
+
+    def test_errors(self):
+        self.assertEqual(self.run_cli("run", "missing")[0], 1)
+        self.assertEqual(self.run_cli("odds", "eight", "Nobody", "Wrestler0")[0], 1)
+        self.assertEqual(self.run_cli("run", "eight", "-p", "50", "--no-pace")[0], 1)
+        self.assertEqual(self.run_cli("simulate", "eight", "-p", "16")[0], 1)
+        with self.assertRaises(SystemExit):
+            self.run_cli("dance")
+
+    @mock.patch("wrestling_simulator.cli.main.interactive_menu")
+    def test_no_arguments_opens_menu(self, menu):
+        self.assertEqual(main([]), 0)
+        menu.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
-from core.wrestler import Wrestler
-from core.roster import Roster
+from wrestling_simulator.core.wrestler import Wrestler
+from wrestling_simulator.core.roster import Roster
+
 
 class TestWrestler(unittest.TestCase):
     def setUp(self):
@@ -13,7 +14,7 @@ class TestWrestler(unittest.TestCase):
             health=150,
             power=85,
             grapple=12,
-            stamina=90
+            stamina=90,
         )
         self.wrestler2 = Wrestler(
             name="John Cena",
@@ -24,7 +25,7 @@ class TestWrestler(unittest.TestCase):
             health=140,
             power=80,
             grapple=10,
-            stamina=85
+            stamina=85,
         )
 
     def test_initial_stats(self):
@@ -60,6 +61,7 @@ class TestWrestler(unittest.TestCase):
         self.assertGreater(self.wrestler1.stamina_level, 50)
         self.assertGreater(self.wrestler1.health, 100)
 
+
 class TestRoster(unittest.TestCase):
     def test_roster_creation_from_names(self):
         names = ["The Rock", "John Cena"]
@@ -67,5 +69,6 @@ class TestRoster(unittest.TestCase):
         self.assertEqual(len(roster.roster), 2)
         self.assertIsInstance(roster.roster[0], Wrestler)
 
+
 if __name__ == "__main__":
     unittest.main()
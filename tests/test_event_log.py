@@ -0,0 +1,119 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from wrestling_simulator.core.commentary import redirected, say
+from wrestling_simulator.core.events import EVENTS, recording
+from wrestling_simulator.core.match import play_match
+from wrestling_simulator.core.wrestler import Wrestler
+from wrestling_simulator.storage.event_log import (
+    EventLogWriter,
+    read_matches,
+    replay,
+    summarize,
+)
+
+
+def make_wrestlers(count):
+    return [
+        Wrestler(f"Wrestler{i}", "male", 40 + i * 5, 70, 60, 150, 50 + i * 5, 10, 75)
+        for i in range(count)
+    ]
+
+
+class TestEventLog(unittest.TestCase):
+    def setUp(self):
+        random.seed(5)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "matches.wel")
+        self.wrestlers = make_wrestlers(6)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def record(self, count, max_turns=300):
+        lines, results = [], []
+        with EventLogWriter(self.path) as log, recording(log):
+            with redirected(lines.append):
+                for _ in range(count):
+                    first, second = random.sample(self.wrestlers, 2)
+                    first.recover()
+                    second.recover()
+                    say(f"It's {first.name} vs {second.name}!!!")  # as Tournament does
+                    results.append(play_match(first, second, max_turns=max_turns))
+        return lines, results
+
+    def test_round_trip(self):
+        _, results = self.record(50)
+        matches = list(read_matches(self.path))
+        self.assertEqual(len(matches), 50)
+        for match, result in zip(matches, results):
+            self.assertEqual(match.winner, result.winner.name)
+            self.assertEqual(match.turns, result.turns)
+            self.assertIn(match.winner, (match.wrestler1, match.wrestler2))
+            self.assertEqual(len(match.events), result.turns)
+        self.assertIsNone(EVENTS.recorder)
+
+    def test_replay_reproduces_commentary(self):
+        lines, _ = self.record(20)
+        replayed = []
+        with redirected(replayed.append):
+            for match in read_matches(self.path):
+                replay(match)
+        self.assertTrue(any("damage" in line for line in lines))
+        self.assertEqual(replayed, lines)
+
+    def test_read_in_small_chunks(self):
+        self.record(20)
+        whole = list(read_matches(self.path))
+        self.assertEqual(list(read_matches(self.path, chunk_size=3)), whole)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        with open(self.path, "wb") as f:
+            f.write(data[:-1])
+        with self.assertRaises(ValueError):
+            list(read_matches(self.path, chunk_size=7))
+
+    def test_decisions_are_recorded(self):
+        _, results = self.record(10, max_turns=2)
+        matches = list(read_matches(self.path))
+        decided = [m for m, r in zip(matches, results) if r.decision]
+        self.assertTrue(decided)
+        self.assertEqual(summarize(matches)["decisions"], len(decided))
+
+    def test_summarize(self):
+        _, results = self.record(30)
+        totals = summarize(read_matches(self.path))
+        self.assertEqual(totals["matches"], 30)
+        self.assertEqual(totals["turns"], sum(r.turns for r in results))
+        self.assertEqual(
+            totals["attack"] + totals["grappleOpponent"] + totals["pinOpponent"],
+            totals["turns"],
+        )
+
+    def test_compact(self):
+        self.record(200)
+        self.assertLess(os.path.getsize(self.path), 200 * 40)
+
+    @mock.patch("wrestling_simulator.storage.event_log.time.sleep")
+    def test_paced_replay(self, sleep):
+        self.record(1)
+        match = next(read_matches(self.path))
+        with redirected(lambda line: None):
+            replay(match, speed=2.0)
+        self.assertEqual(sleep.call_count, len(match.events) + 1)
+        sleep.assert_any_call(0.75)
+        with self.assertRaises(ValueError):
+            replay(match, speed=0)
+
+    def test_bad_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a log")
+        with self.assertRaises(ValueError):
+            list(read_matches(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import csv
+import gzip
+import os
+import random
+import tempfile
+import unittest
+from array import array
+
+from wrestling_simulator.core.commentary import silenced
+from wrestling_simulator.core.events import recording
+from wrestling_simulator.core.match import play_match
+from wrestling_simulator.core.roster import Roster
+from wrestling_simulator.core.tournament import Tournament
+from wrestling_simulator.core.wrestler import Wrestler
+from wrestling_simulator.storage.export import (
+    COLUMN_NAMES,
+    EXPORT_COLUMNS,
+    ColumnarExporter,
+    CsvExporter,
+    iter_chunks,
+    open_exporter,
+    read_columns,
+)
+
+
+def make_wrestlers(count):
+    return [
+        Wrestler(f"Wrestler{i}", "male", 40 + i * 5, 70, 60, 150, 50 + i * 5, 10, 75)
+        for i in range(count)
+    ]
+
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        random.seed(11)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.wrestlers = make_wrestlers(6)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def play(self, exporter, count):
+        results = []
+        with silenced():
+            for _ in range(count):
+                first, second = random.sample(self.wrestlers, 2)
+                first.recover()
+                second.recover()
+                result = play_match(first, second, max_turns=300)
+                exporter.record(first, second, result, round=1)
+                results.append((first, second, result))
+        return results
+
+    def test_damage_totals_match_events(self):
+        class Totals:
+            def begin_match(self, player1, player2):
+                self.players, self.dealt, self.clamped = (player1, player2), {}, False
+
+            def event(self, code, actor, damage):
+                target = self.players[actor is self.players[0]]
+                self.dealt[actor] = self.dealt.get(actor, 0) + int(damage)
+                self.clamped |= damage > 0 and target.health == 0
+
+            def end_match(self, winner, turns, ending):
+                pass
+
+        totals = Totals()
+        checked = 0
+        with silenced(), recording(totals):
+            for _ in range(50):
+                first, second = random.sample(self.wrestlers, 2)
+                first.recover()
+                second.recover()
+                result = play_match(first, second, max_turns=300)
+                if totals.clamped:
+                    continue
+                checked += 1
+                self.assertEqual(
+                    result.winner_damage, totals.dealt.get(result.winner, 0)
+                )
+                self.assertEqual(result.loser_damage, totals.dealt.get(result.loser, 0))
+        self.assertGreater(checked, 25)
+
+    def test_gzip_csv_round_trip(self):
+        path = self.path("matches.csv.gz")
+        with open_exporter(path, chunk_rows=7) as exporter:
+            self.assertIsInstance(exporter, CsvExporter)
+            results = self.play(exporter, 30)
+        with gzip.open(path, "rt", newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 30)
+        self.assertEqual(tuple(rows[0]), COLUMN_NAMES)
+        for row, (first, second, result) in zip(rows, results):
+            self.assertEqual(row["wrestler1"], first.name)
+            self.assertEqual(row["winner"], result.winner.name)
+            self.assertEqual(int(row["turns"]), result.turns)
+            self.assertEqual(int(row["wrestler2_power"]), second.power)
+            self.assertEqual(int(row["wrestler1_health"]), first.max_health)
+            dealt_by_winner = row["damage1" if result.winner is first else "damage2"]
+            self.assertEqual(int(dealt_by_winner), result.winner_damage)
+
+    def test_columnar_round_trip_in_chunks(self):
+        path = self.path("matches.wcol")
+        with open_exporter(path, chunk_rows=8) as exporter:
+            self.assertIsInstance(exporter, ColumnarExporter)
+            results = self.play(exporter, 30)
+        self.assertEqual([len(c["turns"]) for c in iter_chunks(path)], [8, 8, 8, 6])
+        columns = read_columns(path)
+        self.assertEqual(tuple(columns), COLUMN_NAMES)
+        self.assertEqual(columns["winner"], [r.winner.name for _, _, r in results])
+        self.assertEqual(list(columns["turns"]), [r.turns for _, _, r in results])
+        self.assertEqual(list(columns["decision"]), [r.decision for _, _, r in results])
+        self.assertEqual(list(columns["round"]), [1] * 30)
+        self.assertEqual(
+            list(columns["wrestler1_strength"]), [f.strength for f, _, _ in results]
+        )
+
+    def test_columnar_is_compact(self):
+        path = self.path("matches.wcol")
+        with ColumnarExporter(path) as exporter:
+            self.play(exporter, 200)
+        per_row = sum(array(code).itemsize for _, code in EXPORT_COLUMNS)
+        self.assertLess(per_row, 64)
+        self.assertLess(os.path.getsize(path), 200 * per_row + 1024)
+
+    def test_tournament_exporter(self):
+        random.seed(2)
+        roster = Roster.from_names([f"W{i}" for i in range(8)], "Balanced", "male")
+        path = self.path("tournaments.csv")
+        with CsvExporter(path) as exporter:
+            for _ in range(2):
+                tournament = Tournament(roster, 8, paced=False, exporter=exporter)
+                with silenced():
+                    tournament.tournamentPlay()
+                for wrestler in roster.roster:
+                    wrestler.recover()
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 14)
+        self.assertEqual({row["tournament"] for row in rows}, {"1", "2"})
+        self.assertEqual([row["round"] for row in rows[:7]], list("1111223"))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            CsvExporter(self.path("bad.csv"), chunk_rows=0)
+        with open(self.path("bad.wcol"), "wb") as f:
+            f.write(b"nope")
+        with self.assertRaises(ValueError):
+            read_columns(self.path("bad.wcol"))
+
+
+if __name__ == "__main__":
+    unittest.main()
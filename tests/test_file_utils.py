@@ -0,0 +1,35 @@
+import os
+import tempfile
+import unittest
+
+from wrestling_simulator.utils.file_utils import AtomicFile, write_atomic
+
+
+class TestAtomicFile(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "out.bin")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_file_appears_on_commit(self):
+        write_atomic(self.path, b"old")
+        with AtomicFile(self.path) as f:
+            f.write(b"new")
+            with open(self.path, "rb") as current:
+                self.assertEqual(current.read(), b"old")
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), b"new")
+        self.assertEqual(os.listdir(self.tmpdir.name), ["out.bin"])
+
+    def test_error_discards_the_file(self):
+        with self.assertRaises(RuntimeError):
+            with AtomicFile(self.path) as f:
+                f.write(b"partial")
+                raise RuntimeError("interrupted")
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+from multiprocessing import shared_memory
+from unittest import mock
+
+from wrestling_simulator.core.formats import BoutRunner, RoundRobin, SwissTournament
+from wrestling_simulator.core.shared_roster import SharedRoster
+from wrestling_simulator.core.wrestler import Wrestler
+
+
+def make_wrestlers(count):
+    return [
+        Wrestler(f"Wrestler{i}", "male", 40 + i * 5, 70, 60, 150, 50 + i * 5, 10, 75)
+        for i in range(count)
+    ]
+
+
+class TestRoundRobin(unittest.TestCase):
+    def test_every_pair_meets_once(self):
+        round_robin = RoundRobin(make_wrestlers(6))
+        pairs = list(round_robin.pairings())
+        self.assertEqual(len(pairs), 15)
+        self.assertEqual(len({frozenset(pair) for pair in pairs}), 15)
+
+    def test_standings_account_for_every_bout(self):
+        standings = RoundRobin(make_wrestlers(6)).play()
+        self.assertEqual(sum(wins for _, wins, _ in standings), 15)
+        for _, wins, losses in standings:
+            self.assertEqual(wins + losses, 5)
+        records = [(wins, -losses) for _, wins, losses in standings]
+        self.assertEqual(records, sorted(records, reverse=True))
+
+    def test_parallel_workers(self):
+        standings = RoundRobin(make_wrestlers(6), workers=2).play()
+        self.assertEqual(sum(wins for _, wins, _ in standings), 15)
+
+    def test_too_few_wrestlers(self):
+        with self.assertRaises(ValueError):
+            RoundRobin(make_wrestlers(1))
+
+
+class TestBoutRunner(unittest.TestCase):
+    def test_pool_failure_frees_shared_roster(self):
+        created = []
+        create = SharedRoster.create
+
+        def spy(wrestlers):
+            created.append(create(wrestlers))
+            return created[-1]
+
+        with (
+            mock.patch.object(SharedRoster, "create", side_effect=spy),
+            mock.patch(
+                "wrestling_simulator.core.formats.Pool", side_effect=OSError("no pool")
+            ),
+        ):
+            with self.assertRaises(OSError):
+                BoutRunner(make_wrestlers(4), workers=2)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=created[0].name)
+
+
+class TestSwiss(unittest.TestCase):
+    def test_no_rematches(self):
+        swiss = SwissTournament(make_wrestlers(8), rounds=3)
+        swiss.play()
+        for i, opponents in enumerate(swiss.opponents):
+            self.assertEqual(len(opponents), 3)
+            self.assertEqual(len(set(opponents)), 3)
+            self.assertNotIn(i, opponents)
+
+    def test_pairs_within_score_groups(self):
+        swiss = SwissTournament(make_wrestlers(8), rounds=3)
+        with BoutRunner(swiss.wrestlers) as runner:
+            swiss.play_round(runner)
+        pairs, bye = swiss.pair_round()
+        self.assertIsNone(bye)
+        for i, j in pairs:
+            self.assertEqual(swiss.scores[i], swiss.scores[j])
+
+    def test_odd_field_gets_byes(self):
+        swiss = SwissTournament(make_wrestlers(7), rounds=3)
+        standings = swiss.play()
+        self.assertEqual(len(swiss._byes), 3)  # a different wrestler each round
+        self.assertEqual(sum(score for _, score, _ in standings), 3 * 3 + 3)
+
+    def test_invalid_rounds(self):
+        with self.assertRaises(ValueError):
+            SwissTournament(make_wrestlers(4), rounds=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import io
+import unittest
+
+from wrestling_simulator.core.head_to_head import HeadToHead
+from wrestling_simulator.core.wrestler import Wrestler
+from wrestling_simulator.utils.tables import TableWriter
+
+
+def make_wrestlers(count):
+    return [
+        Wrestler(f"Wrestler{i}", "male", 40 + i * 5, 70, 60, 150, 50 + i * 5, 10, 75)
+        for i in range(count)
+    ]
+
+
+class TestHeadToHead(unittest.TestCase):
+    def setUp(self):
+        self.wrestlers = make_wrestlers(5)
+        self.h2h = HeadToHead(self.wrestlers)
+
+    def test_advantages_match_stats(self):
+        first, last = self.wrestlers[0], self.wrestlers[4]
+        self.assertEqual(self.h2h.advantage("strength", last, first), 20)
+        self.assertEqual(self.h2h.advantage("speed", "Wrestler4", "Wrestler0"), 0)
+        self.assertEqual(list(self.h2h.advantage_row("power", 2)), [10, 5, 0, -5, -10])
+        self.assertAlmostEqual(
+            self.h2h.advantage("overall", 4, 0),
+            last.get_overall_rating() - first.get_overall_rating(),
+        )
+        self.assertEqual(list(self.h2h.stats_won(4)), [2, 2, 2, 2, 0])
+
+    def test_win_probabilities_are_complementary(self):
+        for i in range(5):
+            for j in range(5):
+                self.assertAlmostEqual(
+                    self.h2h.win_probability(i, j) + self.h2h.win_probability(j, i), 1
+                )
+        self.assertGreater(self.h2h.win_probability("Wrestler4", "Wrestler0"), 0.5)
+
+    def test_callable_source(self):
+        h2h = HeadToHead(self.wrestlers, lambda a, b: 0.25)
+        self.assertEqual(h2h.win_probability(0, 3), 0.25)
+        self.assertEqual(h2h.win_probability(3, 0), 0.75)
+
+    def test_pairs_cover_every_ordered_pair(self):
+        rows = list(self.h2h.pairs())
+        self.assertEqual(len(rows), 5 * 4)
+        self.assertEqual(len(rows[0]), len(self.h2h.pair_columns()))
+        self.assertEqual(len({row[:2] for row in rows}), 20)
+        row = rows[0]
+        self.assertEqual(row[:2], ("Wrestler0", "Wrestler1"))
+        self.assertEqual(row[2], -5)  # strength
+        self.assertEqual(row[-1], self.h2h.win_probability(0, 1))
+
+    def test_write_pairs_and_matrix(self):
+        out = io.StringIO()
+        self.assertEqual(self.h2h.write_pairs(out), 20)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], ",".join(self.h2h.pair_columns()))
+        self.assertEqual(len(lines), 21)
+        out = io.StringIO()
+        self.h2h.write_matrix(out, "strength", "markdown")
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[1], "|---|---|---|---|---|---|")
+        self.assertEqual(lines[2], "| Wrestler0 | 0 | -5 | -10 | -15 | -20 |")
+
+    def test_shared_names_keep_their_own_rows(self):
+        self.wrestlers[3].name = "Wrestler1"
+        h2h = HeadToHead(self.wrestlers)
+        self.assertEqual(h2h.index(self.wrestlers[1]), 1)
+        self.assertEqual(h2h.index(self.wrestlers[3]), 3)
+        self.assertEqual(h2h.advantage("strength", self.wrestlers[3], 1), 10)
+        with self.assertRaises(ValueError):
+            h2h.index("Wrestler1")
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            HeadToHead(self.wrestlers[:1])
+        with self.assertRaises(ValueError):
+            self.h2h.advantage_row("luck", 0)
+        with self.assertRaises(ValueError):
+            self.h2h.index("Nobody")
+        with self.assertRaises(ValueError):
+            self.h2h.index(9)
+
+
+class TestTableWriter(unittest.TestCase):
+    def test_csv(self):
+        out = io.StringIO()
+        writer = TableWriter(out, ["name", "p"], precision=2)
+        writer.writerows(iter([("A, Jr.", 0.125), ("B", 1)]))
+        self.assertEqual(out.getvalue(), 'name,p\r\n"A, Jr.",0.12\r\nB,1\r\n')
+        self.assertEqual(writer.rows, 2)
+
+    def test_markdown_escapes_pipes(self):
+        out = io.StringIO()
+        TableWriter(out, ["name"], "markdown").writerow(["A|B"])
+        self.assertEqual(out.getvalue(), "| name |\n|---|\n| A\\|B |\n")
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            TableWriter(io.StringIO(), ["a"], "html")
+        with self.assertRaises(ValueError):
+            TableWriter(io.StringIO(), ["a", "b"]).writerow([1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# Cold `import wrestling_simulator` has to stay well under the ~30ms the
+# package took when it eagerly imported core, pickle and the CLI.
+IMPORT_TIME_BUDGET_US = 15000
+RUNS = 3
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_profile(statement):
+    """Runs `statement` in a fresh interpreter and returns its -X importtime rows."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        check=True,
+    )
+    rows = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        rows[name.strip()] = int(cumulative)
+    return rows
+
+
+class TestImportTime(unittest.TestCase):
+    def test_cold_import_within_budget(self):
+        timings = sorted(
+            import_profile("import wrestling_simulator")["wrestling_simulator"]
+            for _ in range(RUNS)
+        )
+        median = timings[RUNS // 2]
+        self.assertLess(
+            median,
+            IMPORT_TIME_BUDGET_US,
+            f"import wrestling_simulator took {median}us (budget "
+            f"{IMPORT_TIME_BUDGET_US}us)",
+        )
+
+    def test_package_import_is_lazy(self):
+        rows = import_profile("import wrestling_simulator")
+        for module in (
+            "wrestling_simulator.core.roster",
+            "wrestling_simulator.core.tournament",
+            "wrestling_simulator.cli.main",
+            "pickle",
+        ):
+            self.assertNotIn(module, rows)
+
+    def test_lazy_attributes_resolve(self):
+        import wrestling_simulator
+        from wrestling_simulator.core.roster import Roster
+        from wrestling_simulator.utils.validation import validate_tournament_size
+
+        self.assertIs(wrestling_simulator.Roster, Roster)
+        self.assertIs(
+            wrestling_simulator.utils.validate_tournament_size,
+            validate_tournament_size,
+        )
+        with self.assertRaises(AttributeError):
+            wrestling_simulator.NotAThing
+
+
+if __name__ == "__main__":
+    unittest.main()
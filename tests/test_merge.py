@@ -0,0 +1,114 @@
+import os
+import pickle
+import tempfile
+import tracemalloc
+import unittest
+
+from wrestling_simulator.core.roster import Roster
+from wrestling_simulator.core.wrestler import Wrestler
+from wrestling_simulator.storage.merge import (
+    RosterWriter,
+    iter_wrestlers,
+    merge_rosters,
+    wrestler_key,
+)
+
+
+def make_wrestler(name, strength=70, gender="male"):
+    return Wrestler(name, gender, strength, 70, 60, 150, 60, 10, 75)
+
+
+class TestMerge(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def dump(self, name, data):
+        with open(self.path(name), "wb") as f:
+            pickle.dump(data, f)
+        return self.path(name)
+
+    def load(self, path):
+        roster = Roster(auto_fill=False)
+        roster.load_roster(path)
+        return roster.roster
+
+    def test_writer_output_loads(self):
+        path = self.path("out.pickle")
+        with RosterWriter(path) as writer:
+            for i in range(5):
+                writer.write(make_wrestler(f"W{i}", 50 + i))
+        self.assertEqual(writer.count, 5)
+        wrestlers = self.load(path)
+        self.assertEqual([w.name for w in wrestlers], [f"W{i}" for i in range(5)])
+        self.assertEqual(wrestlers[4].strength, 54)
+
+        with RosterWriter(self.path("empty.pickle")):
+            pass
+        self.assertEqual(self.load(self.path("empty.pickle")), [])
+
+    def test_merge_dedupes_across_formats(self):
+        first = self.dump(
+            "first.pickle", [make_wrestler("Edge"), make_wrestler("Christian")]
+        )
+        record = {
+            "name": "Edge",
+            "gender": "male",
+            "strength": 70,
+            "speed": 70,
+            "technique": 60,  # a legacy dict file; agility under its old name
+            "health": 150,
+            "power": 60,
+            "grapple": 10,
+            "stamina": 75,
+        }
+        lita = dict(record, name="Lita", gender="female")
+        second = self.dump("second.pickle", [record, lita, dict(record, strength=90)])
+        output = self.path("merged.pickle")
+        result = merge_rosters([first, second, first], output)
+        self.assertEqual((result.sources, result.read, result.written), (3, 7, 4))
+        self.assertEqual((result.duplicates, result.conflicts), (3, 1))
+        merged = self.load(output)
+        self.assertEqual(
+            [(w.name, w.strength) for w in merged],
+            [("Edge", 70), ("Christian", 70), ("Lita", 70), ("Edge", 90)],
+        )
+        self.assertEqual(len({wrestler_key(w) for w in merged}), 4)
+
+    def test_invalid_source_writes_nothing(self):
+        good = self.dump("good.pickle", [make_wrestler("A")])
+        bad = self.dump("bad.pickle", [{"name": "B", "gender": "male"}])
+        output = self.path("merged.pickle")
+        with self.assertRaises(ValueError) as raised:
+            merge_rosters([good, bad], output)
+        self.assertIn("bad.pickle", str(raised.exception))
+        files = sorted(os.listdir(self.tmpdir.name))
+        self.assertEqual(files, ["bad.pickle", "good.pickle"])
+        with self.assertRaises(ValueError):
+            merge_rosters([], output)
+
+    def test_sources_are_streamed(self):
+        paths = [
+            self.dump(f"{k}.pickle", [make_wrestler(f"R{k}W{i}") for i in range(400)])
+            for k in range(10)
+        ]
+        tracemalloc.start()
+        try:
+            for _ in iter_wrestlers(paths):
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            list(iter_wrestlers(paths))
+            _, peak_all = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak * 3, peak_all)
+
+
+if __name__ == "__main__":
+    unittest.main()
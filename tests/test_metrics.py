@@ -0,0 +1,83 @@
+import unittest
+from unittest import mock
+
+from wrestling_simulator.core.metrics import (
+    METRICS,
+    enable_metrics,
+    disable_metrics,
+    reset_metrics,
+    metrics_snapshot,
+    summarize_turns,
+)
+from wrestling_simulator.core.tournament import Tournament
+from wrestling_simulator.core.roster import Roster
+from wrestling_simulator.core.wrestler import Wrestler
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        reset_metrics()
+        self.wrestler1 = Wrestler("Wrestler 1", "male", 80, 70, 60, 150, 90, 10, 75)
+        self.wrestler2 = Wrestler("Wrestler 2", "male", 80, 70, 60, 150, 80, 10, 75)
+
+    def tearDown(self):
+        disable_metrics()
+        reset_metrics()
+
+    def test_disabled_by_default_records_nothing(self):
+        self.assertFalse(METRICS.enabled)
+        self.wrestler1.chooseAction(self.wrestler2)
+        snapshot = metrics_snapshot()
+        self.assertEqual(sum(snapshot["actions"].values()), 0)
+
+    def test_choose_action_counts_and_times(self):
+        enable_metrics()
+        for _ in range(20):
+            self.wrestler2.health = self.wrestler2.max_health
+            self.wrestler2.reset()
+            self.wrestler1.chooseAction(self.wrestler2)
+        snapshot = metrics_snapshot()
+        self.assertEqual(sum(snapshot["actions"].values()), 20)
+        for action, count in snapshot["actions"].items():
+            timing = snapshot["timings"][action]
+            self.assertEqual(timing["count"], count)
+            self.assertEqual(sum(timing["histogram"].values()), count)
+
+    def test_grapple_and_pin_outcomes(self):
+        enable_metrics()
+        self.wrestler1.grappleOpponent(self.wrestler2)
+        self.wrestler2.health = 30
+        self.assertTrue(self.wrestler1.pinOpponent(self.wrestler2))
+        snapshot = metrics_snapshot()
+        self.assertEqual(snapshot["grapple"]["attempts"], 1)
+        self.assertEqual(snapshot["pin"]["attempts"], 1)
+        self.assertEqual(snapshot["pin"]["pinfalls"], 1)
+
+    @mock.patch("wrestling_simulator.core.tournament.time.sleep")
+    def test_match_length_recorded(self, _sleep):
+        roster = Roster(auto_fill=False)
+        roster.roster = [self.wrestler1, self.wrestler2]
+        with mock.patch("wrestling_simulator.core.tournament.validate_tournament_size"):
+            tournament = Tournament(roster, 2)
+        enable_metrics()
+        tournament.match(self.wrestler1, self.wrestler2)
+        snapshot = metrics_snapshot()
+        self.assertEqual(snapshot["matches"]["count"], 1)
+        self.assertEqual(
+            sum(snapshot["actions"].values()),
+            sum(turns * n for turns, n in snapshot["matches"]["turns"].items()),
+        )
+
+    def test_summarize_turns_percentiles(self):
+        counts = {turns: 1 for turns in range(1, 101)}
+        summary = summarize_turns(counts)
+        self.assertEqual(summary["count"], 100)
+        self.assertEqual(summary["mean"], 50.5)
+        self.assertEqual(summary["p50"], 50)
+        self.assertEqual(summary["p99"], 99)
+        self.assertEqual(summary["max"], 100)
+        self.assertEqual(summarize_turns({})["count"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import json
+import os
+import pickle
+import tempfile
+import unittest
+
+from wrestling_simulator.core.roster import Roster
+from wrestling_simulator.core.wrestler import Wrestler
+from wrestling_simulator.storage.migration import (
+    CURRENT,
+    FORMAT_RECORDS,
+    FORMAT_WRESTLERS,
+    INVALID,
+    MIGRATED,
+    PROGRESS_LOG,
+    SKIPPED,
+    UNREADABLE,
+    detect_format,
+    migrate_directory,
+    migrate_file,
+    read_progress,
+)
+
+
+def legacy_record(i, **changes):
+    record = {
+        "name": f"Legacy{i}",
+        "gender": "female",
+        "strength": 70,
+        "power": 80,
+        "speed": 60,
+        "health": 150,
+        "stamina": 75,
+        "grapple": 10,
+        "technique": 65,
+    }
+    record.update(changes)
+    return record
+
+
+class TestMigration(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dir = self.tmpdir.name
+        self.dump("dicts.pickle", [legacy_record(i) for i in range(4)])
+        wrestlers = [
+            Wrestler(f"Obj{i}", "male", 50 + i, 70, 60, 140, 60, 10, 70)
+            for i in range(3)
+        ]
+        wrestlers[0].health = 12  # match state is not carried over
+        self.dump("objects.pickle", wrestlers, protocol=2)
+        self.dump("bad.pickle", [legacy_record(0, strength=500), legacy_record(1)])
+        with open(self.path("broken.pickle"), "wb") as f:
+            f.write(b"not a pickle")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def dump(self, name, data, protocol=pickle.DEFAULT_PROTOCOL):
+        with open(self.path(name), "wb") as f:
+            pickle.dump(data, f, protocol=protocol)
+
+    def load(self, name):
+        roster = Roster(auto_fill=False)
+        roster.load_roster(self.path(name))
+        return roster.roster
+
+    def test_detect_format(self):
+        self.assertEqual(detect_format([]), FORMAT_WRESTLERS)
+        self.assertEqual(detect_format([{"name": "A"}]), FORMAT_RECORDS)
+        with self.assertRaises(ValueError):
+            detect_format({"name": "A"})
+        with self.assertRaises(ValueError):
+            detect_format([{"name": "A"}, "B"])
+
+    def test_migrate_file(self):
+        result = migrate_file(self.path("dicts.pickle"))
+        self.assertEqual((result.format, result.status), (FORMAT_RECORDS, MIGRATED))
+        wrestlers = self.load("dicts.pickle")
+        self.assertTrue(all(isinstance(w, Wrestler) for w in wrestlers))
+        self.assertEqual(wrestlers[0].agility, 65)  # from "technique"
+        self.assertEqual(migrate_file(self.path("dicts.pickle")).status, CURRENT)
+
+        migrate_file(self.path("objects.pickle"))
+        wrestler = self.load("objects.pickle")[0]
+        self.assertEqual((wrestler.health, wrestler.max_health), (140, 140))
+
+    def test_invalid_files_are_untouched(self):
+        with open(self.path("bad.pickle"), "rb") as f:
+            before = f.read()
+        result = migrate_file(self.path("bad.pickle"))
+        self.assertEqual(result.status, INVALID)
+        self.assertIn("strength=500", result.message)
+        with open(self.path("bad.pickle"), "rb") as f:
+            self.assertEqual(f.read(), before)
+        self.assertEqual(migrate_file(self.path("broken.pickle")).status, UNREADABLE)
+
+    def test_directory_is_idempotent(self):
+        first = {
+            os.path.basename(r.path): r.status for r in migrate_directory(self.dir)
+        }
+        self.assertEqual(
+            first,
+            {
+                "bad.pickle": INVALID,
+                "broken.pickle": UNREADABLE,
+                "dicts.pickle": MIGRATED,
+                "objects.pickle": MIGRATED,
+            },
+        )
+        progress = read_progress(self.path(PROGRESS_LOG))
+        self.assertEqual(progress["dicts.pickle"]["wrestlers"], 4)
+
+        self.dump("new.pickle", [legacy_record(9)])
+        with open(self.path(PROGRESS_LOG), "a") as f:
+            f.write('{"path": "half a line')  # an interrupted write
+        second = {
+            os.path.basename(r.path): r.status
+            for r in migrate_directory(self.dir, workers=2)
+        }
+        self.assertEqual(second["dicts.pickle"], SKIPPED)
+        self.assertEqual(second["objects.pickle"], SKIPPED)
+        self.assertEqual(second["new.pickle"], MIGRATED)
+        self.assertEqual(second["bad.pickle"], INVALID)  # retried every run
+
+    def test_output_dir(self):
+        out = os.path.join(self.dir, "out")
+        results = migrate_directory(self.dir, output_dir=out, workers=2)
+        self.assertEqual(len(results), 4)
+        with open(os.path.join(out, "objects.pickle"), "rb") as f:
+            self.assertEqual(len(pickle.load(f)), 3)
+        self.assertFalse(os.path.exists(os.path.join(out, "bad.pickle")))
+        with open(os.path.join(out, PROGRESS_LOG)) as f:
+            self.assertEqual(len([json.loads(line) for line in f]), 4)
+        statuses = {r.status for r in migrate_directory(self.dir, output_dir=out)}
+        self.assertEqual(statuses, {SKIPPED, INVALID, UNREADABLE})
+
+    def test_errors(self):
+        with self.assertRaises(FileNotFoundError):
+            migrate_directory(self.path("missing"))
+        with self.assertRaises(ValueError):
+            migrate_directory(self.dir, workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+
+from wrestling_simulator.core.bracket import BYE, Bracket
+from wrestling_simulator.core.odds import (
+    function_matrix,
+    monte_carlo_matrix,
+    propagate,
+    rating_matrix,
+    tournament_odds,
+)
+from wrestling_simulator.core.roster import Roster
+from wrestling_simulator.core.wrestler import Wrestler
+
+
+def make_wrestlers(count):
+    return [
+        Wrestler(f"Wrestler{i}", "male", 40 + i * 5, 70, 60, 150, 50 + i * 5, 10, 75)
+        for i in range(count)
+    ]
+
+
+def favourite_matrix(count, p):
+    """The lower index always wins with probability p."""
+    return [
+        [0.5 if i == j else (p if i < j else 1 - p) for j in range(count)]
+        for i in range(count)
+    ]
+
+
+class TestPropagate(unittest.TestCase):
+    def test_four_slot_bracket(self):
+        # 0 v 1 and 2 v 3, every favourite (lower index) wins with p = 0.75
+        matrix = favourite_matrix(4, 0.75)
+        reach = propagate([0, 1, 2, 3], matrix)
+        self.assertEqual(list(reach[0]), [0.75, 0.25, 0.75, 0.25])
+        # Entrant 0 beats 2 with 0.75 and 3 with 0.75
+        self.assertAlmostEqual(reach[1][0], 0.75 * 0.75)
+        self.assertAlmostEqual(sum(reach[1]), 1.0)
+
+    def test_bye_advances(self):
+        matrix = [[0.5, 0.9, 0.9], [0.1, 0.5, 0.5], [0.1, 0.5, 0.5]]
+        reach = propagate([0, BYE, 1, 2], matrix)
+        self.assertEqual(reach[0][0], 1.0)
+        self.assertEqual(reach[0][1], 0.0)
+        self.assertAlmostEqual(reach[1][0], 0.9)
+
+    def test_decided_results_are_fixed(self):
+        matrix = favourite_matrix(4, 0.9)
+        winners = [-1] * 8
+        winners[3] = 3  # the underdog won the second semi
+        reach = propagate([0, 1, 2, 3], matrix, winners)
+        self.assertEqual(list(reach[0])[2:], [0.0, 1.0])
+        self.assertAlmostEqual(reach[1][0], 0.9 * 0.9)
+
+
+class TestTournamentOdds(unittest.TestCase):
+    def setUp(self):
+        self.roster = Roster()
+        self.roster.roster = make_wrestlers(6)
+
+    def test_rating_odds(self):
+        odds = tournament_odds(self.roster)
+        champion_odds = [p for _, p in odds.favourites()]
+        self.assertAlmostEqual(sum(champion_odds), 1.0)
+        self.assertEqual(champion_odds, sorted(champion_odds, reverse=True))
+        # The top seed has a bye, so is sure to win round 1
+        top = odds.bracket.seeds[0]
+        self.assertEqual(odds.advancement(top)[0], 1.0)
+        self.assertEqual(len(odds.table()), 6)
+        self.assertEqual(odds.champion_probability(top), odds.advancement(top)[-1])
+
+    def test_callable_source(self):
+        odds = tournament_odds(self.roster, source=lambda a, b: 0.5)
+        for _, p in odds.favourites():
+            self.assertGreater(p, 0.0)
+        with self.assertRaises(ValueError):
+            tournament_odds(self.roster, source=lambda a, b: 2.0)
+
+    def test_unknown_source(self):
+        with self.assertRaises(ValueError):
+            tournament_odds(self.roster, source="crystal_ball")
+
+    def test_recorded_results(self):
+        bracket = Bracket(self.roster.roster)
+        top = bracket.seeds[0]
+        bracket.record_winner(bracket.match_node(top, 1), top)
+        node = bracket.next_opponent_slot(top)
+        underdog = bracket.contestants(node)[1]
+        bracket.record_winner(node, underdog)
+        odds = tournament_odds(self.roster, bracket)
+        self.assertEqual(odds.advancement(underdog)[0], 1.0)
+        favourite = bracket.contestants(node)[0]
+        self.assertEqual(odds.advancement(favourite), [0.0, 0.0, 0.0])
+
+
+class TestMatrices(unittest.TestCase):
+    def test_matrices_are_complementary(self):
+        wrestlers = make_wrestlers(4)
+        for matrix in (
+            rating_matrix(wrestlers),
+            function_matrix(wrestlers, lambda a, b: 0.3),
+            monte_carlo_matrix(wrestlers, samples=10),
+        ):
+            for i in range(4):
+                for j in range(4):
+                    self.assertAlmostEqual(matrix[i][j] + matrix[j][i], 1.0)
+
+    def test_invalid_samples(self):
+        with self.assertRaises(ValueError):
+            monte_carlo_matrix(make_wrestlers(2), samples=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from unittest import mock
+
+from wrestling_simulator.core.ratings import EloRatings, GlickoRatings
+from wrestling_simulator.core.roster import Roster
+from wrestling_simulator.core.tournament import Tournament
+from wrestling_simulator.core.wrestler import Wrestler
+
+
+class TestRatings(unittest.TestCase):
+    def setUp(self):
+        self.roster = Roster(auto_fill=False)
+        self.roster.roster = [
+            Wrestler("Wrestler1", "male", 80, 70, 60, 150, 90, 10, 75),
+            Wrestler("Wrestler2", "female", 75, 80, 85, 140, 85, 15, 80),
+            Wrestler("Wrestler3", "male", 85, 65, 70, 160, 95, 12, 70),
+            Wrestler("Wrestler4", "female", 70, 90, 80, 130, 80, 18, 85),
+        ]
+
+    def test_elo_update_is_zero_sum(self):
+        elo = EloRatings.for_roster(self.roster)
+        elo.update(0, 1)
+        self.assertAlmostEqual(elo.ratings[0], 1516.0)
+        self.assertAlmostEqual(elo.ratings[1], 1484.0)
+        self.assertAlmostEqual(sum(elo.ratings), 4 * 1500.0)
+
+    def test_consume_matches_individual_updates(self):
+        results = [(0, 1), (2, 0), (2, 3), (1, 3)]
+        streamed = EloRatings.for_roster(self.roster)
+        stepped = EloRatings.for_roster(self.roster)
+        self.assertEqual(streamed.consume(iter(results)), 4)
+        for winner, loser in results:
+            stepped.update(winner, loser)
+        self.assertEqual(list(streamed.ratings), list(stepped.ratings))
+
+    def test_leaderboard_orders_by_rating(self):
+        elo = EloRatings.for_roster(self.roster)
+        elo.replay([2, 2, 1], [0, 3, 0])
+        board = elo.leaderboard()
+        self.assertIs(board[0][0], self.roster.roster[2])
+        self.assertEqual([r for _, r in board], sorted(elo.ratings, reverse=True))
+        self.assertEqual(len(elo.power_ranking(top=2)), 2)
+
+    def test_glicko_shrinks_deviation(self):
+        glicko = GlickoRatings.for_roster(self.roster)
+        glicko.update(0, 1)
+        self.assertGreater(glicko.ratings[0], 1500.0)
+        self.assertLess(glicko.ratings[1], 1500.0)
+        self.assertLess(glicko.rd[0], 350.0)
+        shrunk = glicko.rd[0]
+        glicko.new_period()
+        self.assertGreater(glicko.rd[0], shrunk)
+
+    def test_unknown_wrestler(self):
+        elo = EloRatings.for_roster(self.roster)
+        stranger = Wrestler("Stranger", "male", 80, 70, 60, 150, 90, 10, 75)
+        with self.assertRaises(ValueError):
+            elo.rating(stranger)
+
+    @mock.patch("wrestling_simulator.core.tournament.time.sleep")
+    def test_tournament_feeds_ratings(self, _sleep):
+        elo = EloRatings.for_roster(self.roster)
+        Tournament(self.roster, 4, ratings=elo).tournamentPlay()
+        self.assertEqual(sum(elo.games), 6)  # three matches, two wrestlers each
+        self.assertAlmostEqual(sum(elo.ratings), 4 * 1500.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
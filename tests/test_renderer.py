@@ -0,0 +1,128 @@
+import io
+import random
+import unittest
+from unittest import mock
+
+from wrestling_simulator.cli.renderer import (
+    ColumnRenderer,
+    FrameRenderer,
+    replay_side_by_side,
+)
+from wrestling_simulator.core.commentary import COMMENTARY, say
+from wrestling_simulator.core.roster import Roster
+from wrestling_simulator.core.tournament import Tournament
+from wrestling_simulator.storage.event_log import RecordedMatch
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestFrameRenderer(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.clock = FakeClock()
+
+    def test_batches_lines_into_rate_limited_frames(self):
+        renderer = FrameRenderer(self.stream, fps=10, max_lines=0, clock=self.clock)
+        with mock.patch.object(self.stream, "write", wraps=self.stream.write) as write:
+            renderer("first")  # the first line opens a frame right away
+            for i in range(50):
+                renderer(f"line {i}")
+            self.assertEqual(write.call_count, 1)
+            self.clock.now = 0.1
+            renderer("last")
+            self.assertEqual(write.call_count, 2)
+        self.assertEqual(renderer.frames, 2)
+        self.assertEqual(self.stream.getvalue().splitlines()[-1], "last")
+        self.assertEqual(len(self.stream.getvalue().splitlines()), 52)
+
+    def test_drop_keeps_newest_lines(self):
+        renderer = FrameRenderer(
+            self.stream, max_lines=4, overflow="drop", clock=self.clock
+        )
+        renderer._pending = [f"line {i}" for i in range(10)]
+        renderer.flush()
+        self.assertEqual(
+            self.stream.getvalue().splitlines(),
+            ["... 7 lines skipped ...", "line 7", "line 8", "line 9"],
+        )
+        self.assertEqual(renderer.dropped, 7)
+
+    def test_condense_keeps_headlines(self):
+        renderer = FrameRenderer(self.stream, max_lines=3, clock=self.clock)
+        lines = ["It's A vs B!!!"] + ["A attacks B for 3 damage!"] * 20
+        fitted = renderer.fit(lines + ["The winner is A!!!"])
+        self.assertEqual(
+            fitted,
+            ["It's A vs B!!!", "The winner is A!!!", "... 20 more lines of action ..."],
+        )
+
+    def test_context_manager_installs_and_restores_sink(self):
+        previous = COMMENTARY.sink
+        with FrameRenderer(self.stream, max_lines=0, clock=self.clock) as renderer:
+            self.assertIs(COMMENTARY.sink, renderer)
+            say("one")
+            say("two")
+        self.assertIs(COMMENTARY.sink, previous)
+        self.assertEqual(self.stream.getvalue(), "one\ntwo\n")
+
+    def test_paced_tournament_flushes_before_each_pause(self):
+        random.seed(3)
+        roster = Roster.from_names([f"W{i}" for i in range(4)], "Balanced", "male")
+        tournament = Tournament(roster, 4)
+        renderer = FrameRenderer(self.stream, fps=1, max_lines=0, clock=self.clock)
+        with renderer, mock.patch("time.sleep"):
+            with mock.patch.object(renderer, "flush", wraps=renderer.flush) as flush:
+                tournament.tournamentPlay()
+        self.assertGreater(flush.call_count, 10)
+        self.assertIn("Tournament Winner", self.stream.getvalue())
+        self.assertEqual(renderer.dropped, 0)
+
+    def test_rejects_bad_settings(self):
+        with self.assertRaises(ValueError):
+            FrameRenderer(self.stream, fps=0)
+        with self.assertRaises(ValueError):
+            FrameRenderer(self.stream, overflow="truncate")
+        with self.assertRaises(ValueError):
+            ColumnRenderer(0, self.stream)
+
+
+class TestColumnRenderer(unittest.TestCase):
+    def test_replay_side_by_side(self):
+        matches = [
+            RecordedMatch("A", "B", [(0, 0, 5.0), (3, 0, 0.0)], "A", 2, 0),
+            RecordedMatch("C", "D", [(0, 1, 2.5)], "C", 1, 1),
+        ]
+        stream = io.StringIO()
+        renderer = ColumnRenderer(2, stream, width=83, height=6, clock=FakeClock())
+        replay_side_by_side(matches, renderer)
+        frame = stream.getvalue().splitlines()[-6:]
+        self.assertEqual(renderer.column_width, 40)
+        self.assertTrue(frame[0].startswith("It's A vs B!!!"))
+        self.assertIn(" | It's C vs D!!!", frame[0])
+        self.assertIn("D attacks C for 2.5 damage!", frame[1])
+        self.assertIn("The winner by decision is C!!!", frame[3])
+        self.assertEqual(frame[5], "The winner is A!!!")
+        self.assertNotIn("\x1b[", stream.getvalue())
+
+    def test_long_lines_are_cut_and_old_lines_scroll_off(self):
+        stream = io.StringIO()
+        renderer = ColumnRenderer(
+            1, stream, width=10, height=2, redraw=True, clock=FakeClock()
+        )
+        sink = renderer.channel(0)
+        sink("a very long line")
+        for line in ("one", "two", "three"):
+            sink(line)
+        renderer.flush()
+        self.assertEqual(stream.getvalue().splitlines()[:1], ["a very lo~"])
+        self.assertTrue(stream.getvalue().endswith("\x1b[2F\x1b[Jtwo\nthree\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
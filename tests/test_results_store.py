@@ -0,0 +1,119 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from wrestling_simulator.core.roster import Roster
+from wrestling_simulator.core.tournament import Tournament
+from wrestling_simulator.core.wrestler import Wrestler
+from wrestling_simulator.storage.results_store import ResultsStore
+
+
+class TestResultsStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.store = ResultsStore(os.path.join(self.tmpdir, "results.db"), batch_size=3)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_wal_mode(self):
+        mode = self.store.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_head_to_head_both_orders(self):
+        self.store.record_match("A", "B", "A", 12)
+        self.store.record_match("B", "A", "B", 20)
+        self.store.record_match("A", "C", "C", 8)
+        matches = self.store.head_to_head("A", "B")
+        self.assertEqual([m.winner for m in matches], ["A", "B"])
+        self.assertEqual(self.store.head_to_head("A", "Nobody"), [])
+
+    def test_history_and_record(self):
+        self.store.record_matches(
+            [
+                (None, None, "A", "B", "A", 12, 1),
+                (None, None, "C", "A", "C", 9, 2),
+                (None, None, "B", "C", "B", 15, 3),
+            ]
+        )
+        history = self.store.wrestler_history("A")
+        self.assertEqual([m.seed for m in history], [2, 1])  # most recent first
+        self.assertEqual(self.store.wrestler_record("A"), (1, 1))
+        self.assertEqual(len(self.store.wrestler_history("A", limit=1)), 1)
+
+    def test_buffered_matches_are_flushed(self):
+        self.store.record_match("A", "B", "A", 12)
+        count = self.store.conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+        self.assertEqual(count, 0)  # still buffered below batch_size
+        self.store.flush()
+        count = self.store.conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+        self.assertEqual(count, 1)
+
+    def test_history_queries_use_indexes(self):
+        plan = self.store.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM matches WHERE wrestler1 = ? "
+            "UNION ALL SELECT id FROM matches WHERE wrestler2 = ?",
+            (1, 1),
+        ).fetchall()
+        details = " ".join(row[-1] for row in plan)
+        self.assertNotIn("SCAN", details)
+        self.assertIn("matches_by_pair", details)
+        self.assertIn("matches_by_wrestler2", details)
+
+    @mock.patch("wrestling_simulator.core.tournament.time.sleep")
+    def test_tournament_records_results(self, _sleep):
+        roster = Roster(auto_fill=False)
+        roster.roster = [
+            Wrestler("Wrestler1", "male", 80, 70, 60, 150, 90, 10, 75),
+            Wrestler("Wrestler2", "female", 75, 80, 85, 140, 85, 15, 80),
+            Wrestler("Wrestler3", "male", 85, 65, 70, 160, 95, 12, 70),
+            Wrestler("Wrestler4", "female", 70, 90, 80, 130, 80, 18, 85),
+        ]
+        tournament = Tournament(roster, 4, results_store=self.store)
+        tournament.tournamentPlay()
+        matches = self.store.conn.execute(
+            "SELECT round FROM matches WHERE tournament_id = ? ORDER BY id",
+            (tournament.tournament_id,),
+        ).fetchall()
+        self.assertEqual([row[0] for row in matches], [1, 1, 2])
+        winner = self.store.conn.execute(
+            "SELECT winner FROM tournaments WHERE id = ?", (tournament.tournament_id,)
+        ).fetchone()[0]
+        self.assertIn(winner, [w.name for w in roster.roster])
+        slots = self.store.conn.execute("SELECT COUNT(*) FROM brackets").fetchone()[0]
+        self.assertEqual(slots, 6)
+
+    def test_tournament_seed_replays_results(self):
+        roster = Roster(auto_fill=False)
+        roster.roster = [
+            Wrestler(f"Wrestler{i}", "male", 70 + i, 70, 70, 150, 70, 10, 70)
+            for i in range(8)
+        ]
+        tournament = Tournament(roster, 8, results_store=self.store, paced=False)
+        tournament.tournamentPlay()
+        seed = self.store.conn.execute(
+            "SELECT seed FROM tournaments WHERE id = ?", (tournament.tournament_id,)
+        ).fetchone()[0]
+        self.assertIsNotNone(seed)
+        played = [
+            (m.winner, m.turns, m.seed)
+            for m in self.store.wrestler_history(tournament.bracket.champion.name)
+        ]
+        self.assertEqual({match_seed for _, _, match_seed in played}, {seed})
+
+        for wrestler in roster.roster:
+            wrestler.recover()
+        replay = Tournament(roster, 8, results_store=self.store, paced=False, seed=seed)
+        replay.tournamentPlay()
+        self.assertIs(replay.bracket.champion, tournament.bracket.champion)
+        replayed = self.store.wrestler_history(replay.bracket.champion.name)
+        self.assertEqual(
+            [(m.winner, m.turns, m.seed) for m in replayed[: len(played)]], played
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -147,6 +147,40 @@ class TestRoster(unittest.TestCase):
         self.assertEqual(new_roster.roster[0].name, "Test Wrestler 1")
         self.assertEqual(new_roster.roster[1].name, "Test Wrestler 2")
 
+    def test_from_records(self):
+        records = [
+            {
+                "name": f"Record {i}",
+                "gender": "female",
+                "strength": 80,
+                "speed": 70,
+                "agility": 60,
+                "health": 150,
+                "power": 90,
+                "grapple": 10,
+                "stamina": 75,
+                "technique": 99,  # extra keys are ignored
+            }
+            for i in range(3)
+        ]
+        roster = Roster.from_records(records)
+        self.assertEqual(
+            [w.name for w in roster.roster], ["Record 0", "Record 1", "Record 2"]
+        )
+        self.assertEqual(roster.roster[0].max_health, 150)
+
+        records[1]["strength"] = 10
+        del records[2]["agility"]
+        with self.assertRaises(ValueError) as cm:
+            Roster.from_records(records)
+        self.assertIn("row 1: strength=10", str(cm.exception))
+        self.assertIn("row 2: agility is missing", str(cm.exception))
+
+        # Without the table check, only the wrestler's own first error is seen
+        with self.assertRaises(ValueError) as cm:
+            Roster.from_records(records, validate=False)
+        self.assertIn("Invalid strength value: 10", str(cm.exception))
+
 
 if __name__ == "__main__":
     unittest.main()
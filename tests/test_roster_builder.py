@@ -0,0 +1,95 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from wrestling_simulator.core.roster import Roster
+from wrestling_simulator.core.roster_builder import (
+    MIXED,
+    THEMED_ROSTERS,
+    build_all,
+    build_custom,
+    build_records,
+    theme_names,
+    type_ranges,
+)
+from wrestling_simulator.core.wrestler import Wrestler
+
+
+class TestRosterBuilder(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.themes = THEMED_ROSTERS[:4]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def read(self, directory, theme):
+        with open(os.path.join(directory, theme.filename), "rb") as f:
+            return f.read()
+
+    def test_same_seed_same_files_for_any_worker_count(self):
+        build_all(self.path("one"), self.themes, workers=1, seed=3)
+        build_all(self.path("two"), self.themes, workers=2, seed=3)
+        for theme in self.themes:
+            self.assertEqual(
+                self.read(self.path("one"), theme), self.read(self.path("two"), theme)
+            )
+
+    def test_files_hold_wrestlers(self):
+        built = build_all(self.tmpdir.name, self.themes, seed=1)
+        self.assertEqual([theme for theme, _ in built], list(self.themes))
+        for theme, roster in built:
+            with open(self.path(theme.filename), "rb") as f:
+                wrestlers = pickle.load(f)
+            self.assertTrue(all(isinstance(w, Wrestler) for w in wrestlers))
+            self.assertEqual([w.name for w in wrestlers], theme_names(theme))
+            self.assertEqual(len(wrestlers), theme.size)
+            loaded = Roster(auto_fill=False)
+            loaded.load_roster(self.path(theme.filename))
+            self.assertEqual(len(loaded.roster), theme.size)
+
+    def test_type_ranges_respected(self):
+        ranges = type_ranges("Powerhouse")
+        records = build_records([f"W{i}" for i in range(50)], MIXED, "powerhouse", 4)
+        for record in records:
+            self.assertIn(record["gender"], ("male", "female"))
+            for stat, (low, high) in ranges.items():
+                self.assertTrue(low <= record[stat] <= high, (stat, record[stat]))
+
+    def test_seed_leaves_global_stream_alone(self):
+        import random
+
+        random.seed(8)
+        expected = random.random()
+        random.seed(8)
+        build_records(["A", "B"], "male", seed=1)
+        self.assertEqual(random.random(), expected)
+
+    def test_build_custom(self):
+        names = [f"Custom{i}" for i in range(5)]
+        path, roster = build_custom(
+            names, "mine", "speedster", 3, "female", self.tmpdir.name, seed=2
+        )
+        self.assertEqual(path, self.path("mine.pickle"))
+        self.assertEqual([w.name for w in roster.roster], names[:3])
+        self.assertTrue(all(w.gender == "female" for w in roster.roster))
+        with open(path, "rb") as f:
+            self.assertEqual(len(pickle.load(f)), 3)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            type_ranges("wizard")
+        with self.assertRaises(ValueError):
+            build_records(["A"], "robot")
+        with self.assertRaises(ValueError):
+            build_all(self.tmpdir.name, self.themes, workers=0)
+        with self.assertRaises(ValueError):
+            build_custom(["A"], "x", count=0, directory=self.tmpdir.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import random
+import unittest
+
+from wrestling_simulator.constants import MAX_GRAPPLE, MIN_HEALTH
+from wrestling_simulator.core.wrestler import Wrestler
+from wrestling_simulator.schema import SCHEMA
+from wrestling_simulator.utils.validation import validate_columns, validate_records
+
+
+class TestStatSchema(unittest.TestCase):
+    def test_fields_follow_constructor_order(self):
+        self.assertEqual(
+            SCHEMA.names,
+            ("strength", "speed", "agility", "health", "power", "grapple", "stamina"),
+        )
+        self.assertEqual(SCHEMA.field("max_health").name, "health")
+        self.assertEqual(SCHEMA.field("health").low, MIN_HEALTH)
+        with self.assertRaises(ValueError):
+            SCHEMA.field("technique")
+
+    def test_column_typecode_fits_every_range(self):
+        self.assertEqual(SCHEMA.typecode, "h")
+        self.assertEqual(SCHEMA.itemsize, 2)
+
+    def test_random_values_build_wrestlers(self):
+        random.seed(3)
+        for _ in range(200):
+            Wrestler("Random", "male", *SCHEMA.random_values())
+
+    def test_random_record(self):
+        random.seed(4)
+        records = [
+            SCHEMA.random_record("Powerhouse", "female", strength=(90, 100))
+            for _ in range(100)
+        ]
+        self.assertTrue(validate_records(records).ok)
+        self.assertTrue(all(r["strength"] >= 90 for r in records))
+        with self.assertRaises(ValueError):
+            SCHEMA.random_record("Too Strong", "male", strength=(90, 101))
+        with self.assertRaises(ValueError):
+            SCHEMA.random_record("Unknown", "male", technique=(1, 2))
+
+    def test_random_columns(self):
+        columns = SCHEMA.random_columns(5000)
+        self.assertEqual(set(columns), set(SCHEMA.names))
+        self.assertTrue(validate_columns(columns).ok)
+        self.assertEqual(columns["grapple"].typecode, SCHEMA.typecode)
+        self.assertEqual(max(columns["grapple"]), MAX_GRAPPLE)
+
+    def test_messages(self):
+        grapple = SCHEMA.field("grapple")
+        self.assertEqual(
+            grapple.prompt(), "enter the wrestler's grapple(min:1,max:20):"
+        )
+        with self.assertRaises(ValueError) as cm:
+            Wrestler("Test", "male", 80, 70, 60, 150, 90, 25, 75)
+        self.assertEqual(str(cm.exception), grapple.error(25))
+
+
+if __name__ == "__main__":
+    unittest.main()
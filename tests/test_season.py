@@ -0,0 +1,108 @@
+import os
+import random
+import tempfile
+import unittest
+
+from wrestling_simulator.core.roster import Roster
+from wrestling_simulator.core.season import Season
+from wrestling_simulator.core.wrestler import Wrestler
+
+
+def make_roster(count=10):
+    roster = Roster()
+    roster.roster = [
+        Wrestler(f"Wrestler{i}", "male", 40 + i * 5, 70, 60, 150, 50 + i * 5, 10, 75)
+        for i in range(count)
+    ]
+    return roster
+
+
+def table(season):
+    return [
+        (row["wrestler"].name, row["wins"], row["losses"], row["titles"])
+        + (row["rating"],)
+        for row in season.standings()
+    ]
+
+
+class TestSeason(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "season.pkl")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_run_accumulates_results(self):
+        random.seed(1)
+        season = Season(make_roster(), 5, event_size=6)
+        summaries = []
+        season.run(summaries.append)
+        self.assertEqual([summary.week for summary in summaries], [1, 2, 3, 4, 5])
+        # 6 entrants in an 8-slot bracket play 5 matches
+        self.assertTrue(all(summary.matches == 5 for summary in summaries))
+        self.assertEqual(sum(season.titles), 5)
+        self.assertEqual(sum(season.wins), 25)
+        self.assertEqual(sum(season.wins), sum(season.losses))
+        self.assertEqual(sum(season.events), 30)
+        self.assertEqual(sum(season.match_turns.values()), 25)
+        with self.assertRaises(ValueError):
+            season.play_week()
+
+    def test_partial_recovery(self):
+        season = Season(make_roster(), 1, recovery=0.5)
+        wrestler = season.roster.roster[0]
+        wrestler.health = wrestler.max_health - 100
+        wrestler.stamina_level = 0
+        season.recover()
+        self.assertEqual(wrestler.health, wrestler.max_health - 50)
+        self.assertEqual(wrestler.stamina_level, 50)
+
+    def test_hurt_wrestlers_rest(self):
+        season = Season(make_roster(), 1, event_size=8)
+        for wrestler in season.roster.roster[:2]:
+            wrestler.health = 1
+        self.assertEqual(len(season.available()), 8)
+        season.roster.roster[2].health = 0
+        available = season.available()
+        self.assertEqual(len(available), 8)
+        self.assertNotIn(season.roster.roster[2], available)
+
+    def test_checkpoint_resume_matches_uninterrupted_run(self):
+        random.seed(3)
+        full = Season(make_roster(), 6, event_size=4)
+        full.run()
+
+        random.seed(3)
+        interrupted = Season(
+            make_roster(),
+            6,
+            event_size=4,
+            checkpoint_path=self.path,
+            checkpoint_every=3,
+        )
+        for _ in range(4):
+            interrupted.play_week()  # week 4 is lost in the "crash"
+        resumed = Season.resume(self.path)
+        self.assertEqual(resumed.week, 3)
+        resumed.run()
+        self.assertEqual(table(resumed), table(full))
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_resume_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"\x80\x04N.")  # a pickled None
+        with self.assertRaises(ValueError):
+            Season.resume(self.path)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            Season(make_roster(), 0)
+        with self.assertRaises(ValueError):
+            Season(make_roster(4), 3, event_size=5)
+        with self.assertRaises(ValueError):
+            Season(make_roster(), 3, recovery=1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
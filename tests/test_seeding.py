@@ -0,0 +1,89 @@
+import random
+import unittest
+
+from wrestling_simulator.core.bracket import BYE, Bracket
+from wrestling_simulator.core.commentary import silenced
+from wrestling_simulator.core.roster import Roster
+from wrestling_simulator.core.seeding import SeedingOptimizer
+from wrestling_simulator.core.tournament import Tournament
+from wrestling_simulator.core.wrestler import Wrestler
+
+
+def make_wrestlers(count):
+    return [
+        Wrestler(f"Wrestler{i}", "male", 40 + i * 5, 70, 60, 150, 50 + i * 5, 10, 75)
+        for i in range(count)
+    ]
+
+
+class TestSeedingOptimizer(unittest.TestCase):
+    def setUp(self):
+        random.seed(7)
+        self.bracket = Bracket(make_wrestlers(7))
+
+    def test_incremental_score_matches_full_rescore(self):
+        for objective in ("final_rating", "first_round_balance"):
+            optimizer = SeedingOptimizer(self.bracket, objective=objective)
+            slots = [s for s in range(optimizer.size) if optimizer.leaves[s] != BYE]
+            for _ in range(30):
+                optimizer.swap(*random.sample(slots, 2))
+                layout = Bracket.from_layout(self.bracket.seeds, optimizer.leaves)
+                fresh = SeedingOptimizer(layout, objective=objective)
+                self.assertAlmostEqual(optimizer.score, fresh.score)
+
+    def test_undo_restores_score(self):
+        optimizer = SeedingOptimizer(self.bracket)
+        score = optimizer.score
+        saved = optimizer.swap(0, 3)
+        optimizer.undo(0, 3, saved, score)
+        self.assertEqual(list(optimizer.leaves), list(self.bracket.tree[8:]))
+        self.assertEqual(optimizer.score, score)
+
+    def test_anneal_never_worse(self):
+        for objective in ("final_rating", "first_round_balance"):
+            optimizer = SeedingOptimizer(self.bracket, objective=objective)
+            start = optimizer.score
+            best = optimizer.anneal(steps=500)
+            self.assertGreaterEqual(optimizer.best_score, start)
+            self.assertAlmostEqual(
+                SeedingOptimizer(best, objective=objective).score, optimizer.best_score
+            )
+            # Byes stay where the seeded draw put them
+            self.assertEqual(
+                [slot is None for slot in best.slots],
+                [slot is None for slot in self.bracket.slots],
+            )
+
+    def test_invalid_objective(self):
+        with self.assertRaises(ValueError):
+            SeedingOptimizer(self.bracket, objective="chaos")
+
+    def test_invalid_layouts(self):
+        seeds = self.bracket.seeds
+        with self.assertRaises(ValueError):
+            Bracket.from_layout(seeds, [0, 1, 2, 3, 4, 5, 6, 6])
+        with self.assertRaises(ValueError):
+            Bracket.from_layout(seeds[:5], [0, 1, 2, 3, 4, BYE, BYE, BYE])
+
+
+class TestTournamentSeeding(unittest.TestCase):
+    def setUp(self):
+        self.roster = Roster()
+        self.roster.roster = make_wrestlers(8)
+
+    def test_optimize_before_first_round(self):
+        tournament = Tournament(self.roster, 8, paced=False)
+        score = tournament.optimize_seeding("first_round_balance", steps=200)
+        self.assertLessEqual(score, 0.0)
+        self.assertEqual(tournament.tournamentPool, tournament.bracket.pairings(1))
+
+    def test_optimize_after_first_round_fails(self):
+        tournament = Tournament(self.roster, 8, paced=False)
+        with silenced():
+            tournament.Round()
+        with self.assertRaises(ValueError):
+            tournament.optimize_seeding()
+
+
+if __name__ == "__main__":
+    unittest.main()
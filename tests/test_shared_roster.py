@@ -0,0 +1,68 @@
+import unittest
+from multiprocessing import Pool
+
+from wrestling_simulator.core.roster import Roster
+from wrestling_simulator.core.shared_roster import (
+    SharedRoster,
+    init_worker,
+    worker_roster,
+)
+from wrestling_simulator.core.wrestler import Wrestler
+
+
+def _describe(index):
+    shared = worker_roster()
+    return shared.name_of(index), shared.column("power")[index]
+
+
+class TestSharedRoster(unittest.TestCase):
+    def setUp(self):
+        self.roster = Roster(auto_fill=False)
+        self.roster.roster = [
+            Wrestler("Wrestler1", "male", 80, 70, 60, 150, 90, 10, 75),
+            Wrestler("Rey Mistério", "female", 75, 80, 85, 140, 85, 15, 80),
+            Wrestler("W3", "other", 85, 65, 70, 160, 95, 12, 70),
+        ]
+        self.shared = self.roster.to_shared_memory()
+
+    def tearDown(self):
+        self.shared.close()
+        self.shared.unlink()
+
+    def test_round_trip_stats_and_names(self):
+        attached = SharedRoster.attach(self.shared.name)
+        try:
+            self.assertEqual(len(attached), 3)
+            self.assertEqual(attached.name_of(1), "Rey Mistério")
+            self.assertEqual(list(attached.column("grapple")), [10, 15, 12])
+            copy = attached.wrestler(2)
+            original = self.roster.roster[2]
+            self.assertEqual(copy.showStats(), original.showStats())
+        finally:
+            attached.close()
+
+    def test_wrestler_is_fresh_copy(self):
+        self.roster.roster[0].health = 90
+        copy = self.shared.wrestler(0)
+        self.assertEqual(copy.health, copy.max_health)
+
+    def test_invalid_index(self):
+        with self.assertRaises(IndexError):
+            self.shared.wrestler(3)
+
+    def test_attached_handle_cannot_unlink(self):
+        attached = SharedRoster.attach(self.shared.name)
+        try:
+            with self.assertRaises(RuntimeError):
+                attached.unlink()
+        finally:
+            attached.close()
+
+    def test_workers_receive_only_indices(self):
+        with Pool(2, initializer=init_worker, initargs=(self.shared.name,)) as pool:
+            results = pool.map(_describe, [0, 1, 2])
+        self.assertEqual(results, [("Wrestler1", 90), ("Rey Mistério", 85), ("W3", 95)])
+
+
+if __name__ == "__main__":
+    unittest.main()
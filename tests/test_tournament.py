@@ -1,5 +1,10 @@
+import os
+import random
+import tempfile
 import unittest
+from unittest import mock
 from wrestling_simulator.core.tournament import Tournament
+from wrestling_simulator.core.commentary import silenced
 from wrestling_simulator.core.roster import Roster
 from wrestling_simulator.core.wrestler import Wrestler
 
@@ -31,13 +36,18 @@ class TestTournament(unittest.TestCase):
     def test_tournament_creation_invalid_participants(self):
         """Test tournament creation with invalid number of participants."""
         with self.assertRaises(ValueError):
-            Tournament(self.roster, 3)  # Not divisible by 2
+            Tournament(self.roster, 3)  # Less than 4
 
     def test_tournament_creation_too_few_participants(self):
         """Test tournament creation with too few participants."""
         with self.assertRaises(ValueError):
             Tournament(self.roster, 2)  # Less than 4
 
+    def test_tournament_creation_more_participants_than_roster(self):
+        """Test tournament creation with more participants than wrestlers."""
+        with self.assertRaises(ValueError):
+            Tournament(self.roster, 16)
+
     def test_create_tournament_pool(self):
         """Test tournament pool creation."""
         tournament = Tournament(self.roster, 8)
@@ -79,3 +89,128 @@ class TestTournament(unittest.TestCase):
         # Tournament should be complete (winner determined)
         # The tournament pool might still have 1 entry representing the final match
         self.assertLessEqual(len(tournament.tournamentPool), 1)
+
+    def test_invalid_max_turns(self):
+        """Test that a turn cap too small for both wrestlers to act is rejected."""
+        with self.assertRaises(ValueError):
+            Tournament(self.roster, 4, max_turns=1)
+
+    @mock.patch("wrestling_simulator.core.tournament.time.sleep")
+    @mock.patch.object(Wrestler, "chooseAction")
+    def test_match_turn_cap_decision(self, _choose, _sleep):
+        """Test that a match hitting max_turns is settled by tiebreak."""
+        tournament = Tournament(self.roster, 4, max_turns=10, stall_window=100)
+        wrestler1, wrestler2 = tournament.wrestlers[0], tournament.wrestlers[1]
+        wrestler1.health = wrestler1.max_health
+        wrestler2.health = wrestler2.max_health // 2
+        winner = tournament.match(wrestler1, wrestler2)
+        self.assertIs(winner, wrestler1)
+        self.assertTrue(wrestler2.is_defeated)
+        stats = tournament.match_length_stats()
+        self.assertEqual(stats["max"], 10)
+        self.assertEqual(stats["decisions"], 1)
+
+    @mock.patch("wrestling_simulator.core.tournament.time.sleep")
+    @mock.patch.object(Wrestler, "chooseAction")
+    def test_match_odd_turn_cap(self, _choose, _sleep):
+        """Test that an odd max_turns ends the match mid-exchange, on the cap."""
+        tournament = Tournament(self.roster, 4, max_turns=9, stall_window=100)
+        tournament.match(tournament.wrestlers[0], tournament.wrestlers[1])
+        self.assertEqual(tournament.match_length_stats()["max"], 9)
+
+    @mock.patch("wrestling_simulator.core.tournament.time.sleep")
+    @mock.patch.object(Wrestler, "chooseAction")
+    def test_match_stall_detection(self, _choose, _sleep):
+        """Test that exchanges without net damage end the match early."""
+        tournament = Tournament(self.roster, 4, max_turns=1000, stall_window=3)
+        wrestler1, wrestler2 = tournament.wrestlers[0], tournament.wrestlers[1]
+        tournament.match(wrestler1, wrestler2)
+        self.assertEqual(tournament.match_length_stats()["p50"], 6)
+
+    def test_tiebreak_equal_health_uses_rating(self):
+        """Test that equal health shares fall back to the overall rating."""
+        weaker = Wrestler("Weaker", "male", 60, 60, 60, 150, 60, 10, 60)
+        stronger = Wrestler("Stronger", "male", 90, 90, 90, 150, 90, 15, 90)
+        self.assertIs(Tournament.tiebreak(weaker, stronger), stronger)
+        self.assertTrue(weaker.is_defeated)
+
+    def test_unpaced_tournament_runs_headless(self):
+        """Test that paced=False skips every delay."""
+        tournament = Tournament(self.roster, 8, paced=False)
+        with mock.patch("wrestling_simulator.core.tournament.time.sleep") as sleep:
+            with silenced():
+                tournament.tournamentPlay()
+        sleep.assert_not_called()
+        self.assertEqual(tournament.match_length_stats()["count"], 7)
+
+    def test_tournament_with_byes(self):
+        """Test that sizes that are not a power of 2 give the top seeds byes."""
+        tournament = Tournament(self.roster, 6, paced=False)
+        self.assertEqual(len(tournament.tournamentPool), 4)
+        byes = [pair for pair in tournament.tournamentPool if None in pair]
+        self.assertEqual(len(byes), 2)
+        top_seeds = set(tournament.bracket.seeds[:2])
+        self.assertEqual({pair[0] for pair in byes}, top_seeds)
+        with silenced():
+            tournament.tournamentPlay()
+        self.assertEqual(tournament.match_length_stats()["count"], 5)
+        self.assertIn(tournament.bracket.champion, tournament.wrestlers)
+
+    def test_checkpoint_resume_matches_uninterrupted_run(self):
+        """Test that a resumed tournament finishes exactly like an uninterrupted one."""
+        random.seed(11)
+        full = Tournament(self.roster, 8, paced=False)
+        with silenced():
+            full.tournamentPlay()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "tournament.ckpt")
+            for wrestler in self.roster.roster:
+                wrestler.recover()  # undo the damage taken in the full run
+            random.seed(11)
+            interrupted = Tournament(self.roster, 8, paced=False)
+            with silenced():
+                interrupted.Round()
+            interrupted.checkpoint(path)
+            random.random()  # anything the process did after the checkpoint
+            resumed = Tournament.resume(path, self.roster)
+            self.assertEqual(resumed.round, 2)
+            with silenced():
+                resumed.tournamentPlay(checkpoint_path=path)
+            self.assertTrue(os.path.exists(path))
+            self.assertFalse(os.path.exists(path + ".tmp"))
+
+        self.assertEqual(list(resumed.bracket.tree), list(full.bracket.tree))
+        self.assertEqual(resumed.match_turns, full.match_turns)
+        self.assertIs(resumed.bracket.champion, full.bracket.champion)
+
+    def test_resume_keeps_wrestlers_who_share_a_name(self):
+        """Test that resume finds entrants by roster position, not by name."""
+        for wrestler in self.roster.roster[4:]:
+            wrestler.name = "Twin"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "tournament.ckpt")
+            tournament = Tournament(self.roster, 8, paced=False)
+            tournament.checkpoint(path)
+            resumed = Tournament.resume(path, self.roster)
+            self.roster.roster.reverse()  # not the roster it was drawn from
+            with self.assertRaises(ValueError):
+                Tournament.resume(path, self.roster)
+        for seed, original in zip(resumed.bracket.seeds, tournament.bracket.seeds):
+            self.assertIs(seed, original)
+
+    def test_resume_without_roster(self):
+        """Test that a checkpoint can be resumed on its own."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "tournament.ckpt")
+            tournament = Tournament(self.roster, 4, paced=False)
+            tournament.checkpoint(path)
+            resumed = Tournament.resume(path)
+        self.assertEqual(
+            [w.name for w in resumed.bracket.seeds],
+            [w.name for w in tournament.bracket.seeds],
+        )
+        self.assertNotIn(resumed.bracket.seeds[0], self.roster.roster)
+        with silenced():
+            resumed.tournamentPlay()
+        self.assertIsNotNone(resumed.bracket.champion)
@@ -0,0 +1,113 @@
+import unittest
+from array import array
+
+from wrestling_simulator.utils.validation import (
+    Violation,
+    validate_columns,
+    validate_records,
+    validate_wrestler_stats,
+)
+
+
+def make_record(**changes):
+    record = {
+        "name": "Test Wrestler",
+        "gender": "male",
+        "strength": 80,
+        "speed": 70,
+        "agility": 60,
+        "health": 150,
+        "power": 90,
+        "grapple": 10,
+        "stamina": 75,
+    }
+    record.update(changes)
+    return record
+
+
+class TestValidateRecords(unittest.TestCase):
+    def test_valid_table(self):
+        report = validate_records([make_record() for _ in range(100)])
+        self.assertTrue(report.ok)
+        self.assertEqual(report.rows, 100)
+        report.raise_if_invalid()
+
+    def test_reports_every_violation(self):
+        records = [
+            make_record(),
+            make_record(strength=39, grapple=21),
+            make_record(gender="mixed"),
+            make_record(name=7, speed="fast"),
+        ]
+        report = validate_records(records)
+        self.assertEqual(
+            report.violations,
+            [
+                Violation(1, "strength", 39, "40-100"),
+                Violation(1, "grapple", 21, "1-20"),
+                Violation(2, "gender", "mixed", "one of male, female, other"),
+                Violation(3, "name", 7, "a string"),
+                Violation(3, "speed", "fast", "30-100"),
+            ],
+        )
+        self.assertEqual(report.bad_rows(), [1, 2, 3])
+        with self.assertRaises(ValueError):
+            report.raise_if_invalid()
+
+    def test_missing_fields(self):
+        incomplete = make_record(strength=5)
+        del incomplete["stamina"]
+        report = validate_records([make_record(), incomplete])
+        self.assertEqual(
+            report.violations,
+            [
+                Violation(1, "strength", 5, "40-100"),
+                Violation(1, "stamina", None, "required"),
+            ],
+        )
+        self.assertEqual(len(validate_records([incomplete], required=False)), 1)
+
+    def test_format_limit(self):
+        report = validate_records([make_record(power=1) for _ in range(30)])
+        text = report.format(limit=5)
+        self.assertIn("30 invalid value(s) in 30 of 30 record(s)", text)
+        self.assertIn("... and 25 more", text)
+        self.assertEqual(len(report.format(limit=None).splitlines()), 31)
+
+
+class TestValidateColumns(unittest.TestCase):
+    def test_stat_arrays(self):
+        report = validate_columns(
+            {
+                "strength": array("h", [40, 100, 101]),
+                "health": array("h", [80, 79, 200]),
+                "grapple": [1, 20, 3],
+            }
+        )
+        self.assertEqual(
+            [(v.row, v.field) for v in report],
+            [(1, "health"), (2, "strength")],
+        )
+
+    def test_mismatched_lengths(self):
+        with self.assertRaises(ValueError):
+            validate_columns({"strength": [50], "speed": [50, 60]})
+
+
+class TestValidateWrestlerStats(unittest.TestCase):
+    def test_partial_stats(self):
+        validate_wrestler_stats({"strength": 50, "grapple": 5})
+
+    def test_lists_every_invalid_stat(self):
+        with self.assertRaises(ValueError) as cm:
+            validate_wrestler_stats({"strength": 3, "stamina": 500})
+        lines = str(cm.exception).splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(
+            lines[0].startswith("Invalid strength value: 3. Strength must be")
+        )
+        self.assertTrue(lines[1].startswith("Invalid stamina value: 500."))
+
+
+if __name__ == "__main__":
+    unittest.main()
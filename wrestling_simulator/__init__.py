@@ -3,14 +3,30 @@ Wrestling Simulator - A Python-based wrestling tournament simulation game.
 
 This package provides a complete wrestling simulation system with customizable
 wrestlers, roster management, and tournament functionality.
+
+Submodules are loaded on first attribute access, so importing the package
+itself is cheap.
 """
 
 __version__ = "1.0.0"
 __author__ = "Sthembiso Mfusi"
 __email__ = "sthembiso.mfusi@example.com"
 
-from .core.wrestler import Wrestler
-from .core.roster import Roster
-from .core.tournament import Tournament
+from ._lazy import attach
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .core.wrestler import Wrestler
+    from .core.roster import Roster
+    from .core.tournament import Tournament
 
 __all__ = ["Wrestler", "Roster", "Tournament"]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "Wrestler": ".core.wrestler",
+        "Roster": ".core.roster",
+        "Tournament": ".core.tournament",
+    },
+)
@@ -0,0 +1,43 @@
+"""
+Lazy attribute loading for the wrestling simulator packages.
+
+The package ``__init__`` modules only name what they export; the submodule
+that defines each name is imported the first time the attribute is used.
+This module deliberately avoids importing ``typing`` so that a bare
+``import wrestling_simulator`` stays cheap.
+"""
+
+import sys
+
+
+def attach(package: str, exports: "dict[str, str]") -> tuple:
+    """
+    Builds the module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package: The ``__name__`` of the package being set up.
+        exports: Maps each exported name to the relative module defining it,
+            e.g. ``{"Roster": ".core.roster"}``.
+
+    Returns:
+        A ``(__getattr__, __dir__)`` pair to assign in the package namespace.
+    """
+
+    def __getattr__(name: str) -> object:
+        try:
+            module_name = exports[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+        import importlib
+
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Cache on the package so later lookups skip __getattr__ entirely
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> "list[str]":
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
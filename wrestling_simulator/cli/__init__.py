@@ -1,7 +1,24 @@
 """
 Command-line interface for the wrestling simulator.
+
+The interface is imported lazily, the first time one of its names is used.
 """
 
-from .main import main
+from .._lazy import attach
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .main import main
+    from .renderer import ColumnRenderer, FrameRenderer, replay_side_by_side
+
+__all__ = ["main", "FrameRenderer", "ColumnRenderer", "replay_side_by_side"]
 
-__all__ = ["main"]
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "main": ".main",
+        "FrameRenderer": ".renderer",
+        "ColumnRenderer": ".renderer",
+        "replay_side_by_side": ".renderer",
+    },
+)
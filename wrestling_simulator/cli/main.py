@@ -1,15 +1,39 @@
 #!/usr/bin/env python3
 """
 Main CLI interface for the Wrestling Simulator.
+
+With no arguments the interactive menu runs. Subcommands make the simulator
+scriptable:
+
+    wrestling-simulator list
+    wrestling-simulator run legends --no-pace --seed 7
+    wrestling-simulator simulate legends -n 10000 --workers 8 --format csv
+    wrestling-simulator odds legends "The Rock" "Edge" --source monte_carlo
+    wrestling-simulator matrix legends --format markdown -o h2h.md
+    wrestling-simulator build-rosters --workers 4
+    wrestling-simulator migrate-rosters --workers 4
+    wrestling-simulator merge-rosters all_stars legends modern_males rising_stars
 """
 
+import argparse
+import csv
+import json
 import os
-from typing import Optional
+import pickle
+import random
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from ..core.commentary import COMMENTARY, silenced
 from ..core.roster import Roster
 from ..core.tournament import Tournament
+from ..constants import PICKLE_EXTENSION
 from ..utils.file_utils import load_wrestler_names_from_file
 
+ROSTERS_DIR = "rosters"
+FORMATS = ("text", "json", "csv")
+DEFAULT_SIMULATIONS = 100
+
 
 def get_valid_wrestler_count(max_count: int = 75) -> int:
     """Gets a valid number of wrestlers from the user (between 1 and max_count)."""
@@ -24,21 +48,18 @@ def get_valid_wrestler_count(max_count: int = 75) -> int:
 
 
 def get_valid_tournament_size(max_participants: int) -> int:
-    """Gets a valid tournament size (divisible by 4, positive, not exceeding max_participants)."""
+    """Gets a valid tournament size (at least 4, not exceeding max_participants)."""
     while True:
         try:
             roster_num = int(
                 input(
-                    f"How many tournament participants? (max: {max_participants}, divisible by 4): "
+                    f"How many tournament participants? (4-{max_participants}, "
+                    f"top seeds get byes if it isn't a power of 2): "
                 )
             )
-            if (
-                roster_num % 4 == 0
-                and roster_num > 0
-                and roster_num <= max_participants
-            ):
+            if 4 <= roster_num <= max_participants:
                 return roster_num
-            print("Invalid choice. Must be positive, divisible by 4, and not exceed max.")
+            print(f"Invalid choice. Must be between 4 and {max_participants}.")
         except ValueError:
             print("Invalid input. Please enter a valid number.")
 
@@ -109,13 +130,15 @@ def view_wrestler_stats(roster: Roster) -> None:
         print("Please enter a valid number.")
 
 
-def main() -> None:
-    """Main function to run the wrestling simulator."""
+def interactive_menu() -> None:
+    """Runs the interactive menu: pick or create a roster, then play."""
     os.system("clear")  # clear the system so that player can focus on the actual game
     print("Welcome to the Wrestling Simulator!")
     print("=" * 40)
 
-    ans = input("Do you want to load a saved roster or create a new roster? [Create, Load]: ")
+    ans = input(
+        "Do you want to load a saved roster or create a new roster? [Create, Load]: "
+    )
     while ans.lower() not in ["create", "load"]:
         ans = input("Invalid option. Please choose [Create, Load]: ")
 
@@ -168,9 +191,10 @@ def main() -> None:
                 wwe.save_roster(fileName)
                 print(f"Roster saved to rosters/{fileName}")
         else:
-            wwe = create_roster_from_file()
-            if not wwe:
+            created = create_roster_from_file()
+            if not created:
                 return
+            wwe = created
 
     while True:
         print("\nMain Menu:")
@@ -178,20 +202,479 @@ def main() -> None:
         print("2. View Wrestler Stats")
         print("3. Exit")
 
-        choice = input("Select an option (1-3): ").strip()
+        option = input("Select an option (1-3): ").strip()
 
-        if choice == "1":
+        if option == "1":
             roster_num = get_valid_tournament_size(len(wwe.roster))
             battle = Tournament(wwe, roster_num)
             battle.tournamentPlay()
-        elif choice == "2":
+        elif option == "2":
             view_wrestler_stats(wwe)
-        elif choice == "3":
+        elif option == "3":
             print("Goodbye!")
             break
         else:
             print("Invalid selection. Please choose 1-3.")
 
 
+def find_roster(name: str) -> str:
+    """
+    Resolves a roster name to its file: an existing path, or a file in the
+    rosters folder with or without the .pickle extension.
+    """
+    candidates = [
+        name,
+        os.path.join(ROSTERS_DIR, name),
+        os.path.join(ROSTERS_DIR, name + PICKLE_EXTENSION),
+    ]
+    for path in candidates:
+        if os.path.isfile(path):
+            return path
+    raise FileNotFoundError(
+        f"Roster '{name}' not found. Use the 'list' command to see available rosters."
+    )
+
+
+def load_named_roster(name: str) -> Roster:
+    """Loads a roster by name; files of wrestler records are validated and built."""
+    with open(find_roster(name), "rb") as f:
+        data = pickle.load(f)
+    if data and isinstance(data[0], dict):
+        return Roster.from_records(data)
+    roster = Roster(auto_fill=False)
+    roster.roster = data
+    return roster
+
+
+def participant_count(requested: Optional[int], roster: Roster) -> int:
+    """Returns the participants to draw: as requested, or the whole roster."""
+    available = len(roster.roster)
+    if requested is not None and requested > available:
+        raise ValueError(
+            f"Cannot draw {requested} participants from a roster of {available} "
+            f"wrestlers. Use -p {available} or fewer."
+        )
+    return requested or available
+
+
+def emit(rows: List[Dict[str, Any]], columns: Sequence[str], fmt: str) -> None:
+    """Writes result rows to stdout as an aligned table, JSON or CSV."""
+    if fmt == "json":
+        print(json.dumps(rows, indent=2))
+    elif fmt == "csv":
+        writer = csv.DictWriter(sys.stdout, fieldnames=list(columns))
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        cells = [[_cell(row[column]) for column in columns] for row in rows]
+        widths = [
+            max([len(column)] + [len(line[i]) for line in cells])
+            for i, column in enumerate(columns)
+        ]
+        print("  ".join(c.ljust(w) for c, w in zip(columns, widths)).rstrip())
+        for line in cells:
+            print("  ".join(c.ljust(w) for c, w in zip(line, widths)).rstrip())
+
+
+def _cell(value: Any) -> str:
+    return f"{value:.4f}" if isinstance(value, float) else str(value)
+
+
+def _play_headless(roster: Roster, participants: int, seed: int) -> int:
+    """Plays one unpaced tournament from full health; returns the champion's index."""
+    for wrestler in roster.roster:
+        wrestler.recover()
+    tournament = Tournament(roster, participants, paced=False, seed=seed)
+    tournament.tournamentPlay()
+    return roster.roster.index(tournament.bracket.champion)  # type: ignore[arg-type]
+
+
+_worker_roster: Optional[Roster] = None
+
+
+def _init_simulate_worker(path: str) -> None:
+    global _worker_roster
+    COMMENTARY.enabled = False
+    _worker_roster = load_named_roster(path)
+
+
+def _simulate_one(task: Tuple[int, int]) -> int:
+    participants, seed = task
+    return _play_headless(_worker_roster, participants, seed)  # type: ignore[arg-type]
+
+
+def cmd_list(args: argparse.Namespace) -> int:
+    rows = [
+        {"roster": filename, "wrestlers": count}
+        for filename, count in Roster.list_available_rosters()
+    ]
+    emit(rows, ("roster", "wrestlers"), args.format)
+    return 0
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    roster = load_named_roster(args.roster)
+    participants = participant_count(args.participants, roster)
+    quiet = args.quiet or args.format != "text"
+    exporter = None
+    if args.export:
+        from ..storage.export import open_exporter
+
+        exporter = open_exporter(args.export)
+    tournament = Tournament(
+        roster,
+        participants,
+        paced=not args.no_pace,
+        exporter=exporter,
+        seed=args.seed,
+    )
+    try:
+        if quiet:
+            with silenced():
+                tournament.tournamentPlay(args.checkpoint)
+        elif args.fps:
+            from .renderer import FrameRenderer
+
+            with FrameRenderer(fps=args.fps):
+                tournament.tournamentPlay(args.checkpoint)
+        else:
+            tournament.tournamentPlay(args.checkpoint)
+    finally:
+        if exporter is not None:
+            exporter.close()
+    champion = tournament.bracket.champion
+    row = {
+        "champion": champion.name if champion is not None else None,
+        "participants": participants,
+        "matches": sum(tournament.match_turns.values()),
+        "decisions": tournament.decisions,
+    }
+    if args.format == "text":
+        print(f"🏆 Champion: {row['champion']}")
+    else:
+        emit([row], tuple(row), args.format)
+    return 0
+
+
+def cmd_simulate(args: argparse.Namespace) -> int:
+    path = find_roster(args.roster)
+    roster = load_named_roster(path)
+    participants = participant_count(args.participants, roster)
+    if args.tournaments < 1:
+        raise ValueError(
+            f"Invalid number of tournaments: {args.tournaments}. Try "
+            f"{DEFAULT_SIMULATIONS}."
+        )
+    # Every tournament gets its own seed, so results do not depend on the
+    # number of workers and forked workers never share a random state
+    base = args.seed if args.seed is not None else random.randrange(2**32)
+    tasks = [(participants, base + i) for i in range(args.tournaments)]
+    if args.workers > 1:
+        from multiprocessing import Pool  # only needed for parallel runs
+
+        chunk = max(1, len(tasks) // (args.workers * 4))
+        with Pool(args.workers, _init_simulate_worker, (path,)) as pool:
+            champions = list(pool.imap(_simulate_one, tasks, chunksize=chunk))
+    else:
+        with silenced():
+            champions = [_play_headless(roster, *task) for task in tasks]
+    titles: Dict[int, int] = {}
+    for index in champions:
+        titles[index] = titles.get(index, 0) + 1
+    rows = [
+        {
+            "wrestler": roster.roster[index].name,
+            "titles": count,
+            "share": count / len(tasks),
+        }
+        for index, count in sorted(titles.items(), key=lambda item: -item[1])
+    ]
+    emit(rows, ("wrestler", "titles", "share"), args.format)
+    return 0
+
+
+def cmd_odds(args: argparse.Namespace) -> int:
+    from ..core.odds import monte_carlo_matrix, rating_matrix
+
+    roster = load_named_roster(args.roster)
+    pair = [roster.get_wrestler(args.wrestler_a), roster.get_wrestler(args.wrestler_b)]
+    if args.seed is not None:
+        random.seed(args.seed)
+    if args.source == "monte_carlo":
+        matrix = monte_carlo_matrix(pair, samples=args.samples, workers=args.workers)
+    else:
+        matrix = rating_matrix(pair)
+    rows = [
+        {"wrestler": pair[0].name, "win_probability": matrix[0][1]},
+        {"wrestler": pair[1].name, "win_probability": matrix[1][0]},
+    ]
+    emit(rows, ("wrestler", "win_probability"), args.format)
+    return 0
+
+
+def cmd_matrix(args: argparse.Namespace) -> int:
+    from ..core.head_to_head import HeadToHead
+
+    roster = load_named_roster(args.roster)
+    if args.seed is not None:
+        random.seed(args.seed)
+    options = {"samples": args.samples, "workers": args.workers}
+    h2h = HeadToHead(
+        roster.roster,
+        args.source,
+        **(options if args.source == "monte_carlo" else {}),
+    )
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        if args.stat == "pairs":
+            h2h.write_pairs(out, args.format)
+        else:
+            h2h.write_matrix(out, args.stat, args.format)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def cmd_build_rosters(args: argparse.Namespace) -> int:
+    from ..core.roster_builder import build_all, build_custom
+
+    if args.file:
+        names = load_wrestler_names_from_file(args.file)
+        path, roster = build_custom(
+            names,
+            args.output,
+            args.type,
+            args.count,
+            args.gender,
+            ROSTERS_DIR,
+            args.seed,
+        )
+        if len(roster.roster) < args.count:
+            print(
+                f"⚠️  Only {len(roster.roster)} names available, "
+                f"requested {args.count}",
+                file=sys.stderr,
+            )
+        rows = [
+            {
+                "roster": os.path.basename(path),
+                "description": f"{args.type}, {args.gender}",
+                "wrestlers": len(roster.roster),
+            }
+        ]
+    else:
+        rows = [
+            {
+                "roster": theme.filename,
+                "description": theme.description,
+                "wrestlers": len(roster.roster),
+            }
+            for theme, roster in build_all(
+                ROSTERS_DIR, workers=args.workers, seed=args.seed
+            )
+        ]
+    emit(rows, ("roster", "description", "wrestlers"), args.format)
+    return 0
+
+
+def cmd_migrate_rosters(args: argparse.Namespace) -> int:
+    from ..storage.migration import INVALID, UNREADABLE, migrate_directory
+
+    results = migrate_directory(args.directory, args.output_dir, args.workers, args.log)
+    for result in results:
+        if result.message:
+            print(f"⚠️  {result.path}: {result.message}", file=sys.stderr)
+    rows = [
+        {
+            "roster": os.path.basename(result.path),
+            "format": result.format,
+            "status": result.status,
+            "wrestlers": result.wrestlers,
+        }
+        for result in results
+    ]
+    emit(rows, ("roster", "format", "status", "wrestlers"), args.format)
+    return int(any(result.status in (INVALID, UNREADABLE) for result in results))
+
+
+def cmd_merge_rosters(args: argparse.Namespace) -> int:
+    from ..storage.merge import merge_rosters
+
+    output = args.output
+    if os.path.dirname(output) == "":
+        os.makedirs(ROSTERS_DIR, exist_ok=True)
+        output = os.path.join(ROSTERS_DIR, output)
+    if not output.endswith(PICKLE_EXTENSION):
+        output += PICKLE_EXTENSION
+    result = merge_rosters([find_roster(name) for name in args.rosters], output)
+    counts = result._asdict()
+    row = {"roster": os.path.basename(counts.pop("path")), **counts}
+    emit([row], tuple(row), args.format)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the parser for the scriptable subcommands."""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--seed", type=int, help="seed the random number generator")
+    common.add_argument(
+        "--format", choices=FORMATS, default="text", help="output format"
+    )
+    workers = argparse.ArgumentParser(add_help=False)
+    workers.add_argument(
+        "--workers", type=int, default=1, help="processes to run on (default: 1)"
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="wrestling-simulator",
+        description="Wrestling Simulator. Run without arguments for the "
+        "interactive menu.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    listing = commands.add_parser("list", parents=[common], help="list saved rosters")
+    listing.set_defaults(handler=cmd_list)
+
+    run = commands.add_parser("run", parents=[common], help="run one tournament")
+    run.add_argument("roster", help="roster name or path")
+    run.add_argument("-p", "--participants", type=int, help="default: whole roster")
+    run.add_argument(
+        "--no-pace", action="store_true", help="skip the delays between actions"
+    )
+    run.add_argument("--quiet", action="store_true", help="hide the commentary")
+    run.add_argument(
+        "--fps",
+        type=float,
+        help="batch the commentary into at most this many frames a second",
+    )
+    run.add_argument("--checkpoint", help="write a checkpoint here after each round")
+    run.add_argument(
+        "--export",
+        help="write every match here: .csv, .csv.gz or a columnar binary file",
+    )
+    run.set_defaults(handler=cmd_run)
+
+    simulate = commands.add_parser(
+        "simulate",
+        parents=[common, workers],
+        help="play many headless tournaments and count titles",
+    )
+    simulate.add_argument("roster", help="roster name or path")
+    simulate.add_argument("-n", "--tournaments", type=int, default=DEFAULT_SIMULATIONS)
+    simulate.add_argument("-p", "--participants", type=int)
+    simulate.set_defaults(handler=cmd_simulate)
+
+    odds = commands.add_parser(
+        "odds", parents=[common, workers], help="head-to-head odds for two wrestlers"
+    )
+    odds.add_argument("roster", help="roster name or path")
+    odds.add_argument("wrestler_a")
+    odds.add_argument("wrestler_b")
+    odds.add_argument("--source", choices=("rating", "monte_carlo"), default="rating")
+    odds.add_argument(
+        "--samples", type=int, default=200, help="Monte Carlo bouts (default: 200)"
+    )
+    odds.set_defaults(handler=cmd_odds)
+
+    matrix = commands.add_parser(
+        "matrix",
+        parents=[workers],
+        help="head-to-head stat advantages and win odds for a whole roster",
+    )
+    matrix.add_argument("roster", help="roster name or path")
+    matrix.add_argument(
+        "--stat",
+        default="pairs",
+        help="'pairs' for one row per pairing (default), or one square matrix: "
+        "a stat name, 'overall' or 'win_probability'",
+    )
+    matrix.add_argument("--format", choices=("csv", "markdown"), default="csv")
+    matrix.add_argument("-o", "--output", help="write here instead of stdout")
+    matrix.add_argument("--seed", type=int, help="seed the random number generator")
+    matrix.add_argument("--source", choices=("rating", "monte_carlo"), default="rating")
+    matrix.add_argument(
+        "--samples", type=int, default=200, help="Monte Carlo bouts (default: 200)"
+    )
+    matrix.set_defaults(handler=cmd_matrix)
+
+    build = commands.add_parser(
+        "build-rosters",
+        parents=[common, workers],
+        help="write every themed roster, or one roster from a names file",
+    )
+    build.add_argument(
+        "-f", "--file", help="names file (one per line) for a single custom roster"
+    )
+    build.add_argument(
+        "-o", "--output", default="custom_roster", help="custom roster name"
+    )
+    build.add_argument(
+        "-c", "--count", type=int, default=8, help="wrestlers in a custom roster"
+    )
+    # Checked by the builder, so parsing never imports it
+    build.add_argument(
+        "-t", "--type", default="balanced", help="e.g. balanced, powerhouse, rookie"
+    )
+    build.add_argument(
+        "-g", "--gender", default="mixed", help="male, female, other or mixed"
+    )
+    build.set_defaults(handler=cmd_build_rosters)
+
+    migrate = commands.add_parser(
+        "migrate-rosters",
+        parents=[workers],
+        help="rewrite old roster files in the current format",
+    )
+    migrate.add_argument(
+        "directory", nargs="?", default=ROSTERS_DIR, help="default: rosters"
+    )
+    migrate.add_argument(
+        "-o", "--output-dir", help="write migrated files here instead of in place"
+    )
+    migrate.add_argument(
+        "--log", help="progress log (default: migration.jsonl in the output folder)"
+    )
+    migrate.add_argument(
+        "--format", choices=FORMATS, default="text", help="output format"
+    )
+    migrate.set_defaults(handler=cmd_migrate_rosters)
+
+    merge = commands.add_parser(
+        "merge-rosters",
+        help="combine rosters into one, dropping repeated wrestlers",
+    )
+    merge.add_argument("output", help="merged roster name or path")
+    merge.add_argument("rosters", nargs="+", help="roster names or paths")
+    merge.add_argument(
+        "--format", choices=FORMATS, default="text", help="output format"
+    )
+    merge.set_defaults(handler=cmd_merge_rosters)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Main function to run the wrestling simulator.
+
+    Args:
+        argv: Command-line arguments without the program name; defaults to
+            sys.argv. With none, the interactive menu runs.
+
+    Returns:
+        int: The exit status.
+    """
+    arguments = sys.argv[1:] if argv is None else list(argv)
+    if not arguments:
+        interactive_menu()
+        return 0
+    args = build_parser().parse_args(arguments)
+    try:
+        return int(args.handler(args))
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,277 @@
+"""
+Frame renderer for match commentary.
+
+Commentary normally reaches the terminal one print() at a time, so a fast
+headless run spends most of its time in unbuffered writes and scrolls past
+faster than anyone can read. This module contains two commentary sinks that
+batch lines into frames instead:
+
+    FrameRenderer   collects lines and writes them out as one frame at most
+                    ``fps`` times a second. If more lines arrive in a frame
+                    than fit on screen, the extra lines are dropped or
+                    condensed into a one-line summary.
+    ColumnRenderer  shows several matches at once, one fixed-width column per
+                    match, redrawn in place on a terminal.
+
+Both install themselves as the commentary sink when used as a context
+manager:
+
+    with FrameRenderer(fps=30):
+        tournament.tournamentPlay()
+
+replay_side_by_side() plays several recorded matches together in a
+ColumnRenderer.
+"""
+
+import shutil
+import sys
+import time
+from collections import deque
+from typing import Callable, Deque, Iterable, List, Optional, TextIO
+
+from ..core.commentary import COMMENTARY
+from ..storage.event_log import RecordedMatch, replay_steps
+
+DEFAULT_FPS = 30.0
+DEFAULT_PANEL_HEIGHT = 12  # rows per column in a ColumnRenderer
+OVERFLOW_MODES = ("drop", "condense")
+SEPARATOR = " | "
+
+# Lines worth keeping when a frame is condensed
+_HEADLINE_MARKERS = (
+    " vs ",
+    "winner",
+    "Winner",
+    "Round",
+    "advances",
+    "eliminated",
+    "enters the ring",
+    "wins ",
+    "time limit",
+    "upper hand",
+)
+
+
+def is_headline(line: str) -> bool:
+    """True for lines that say who is fighting or who won."""
+    return any(marker in line for marker in _HEADLINE_MARKERS)
+
+
+class FrameRenderer:
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        fps: float = DEFAULT_FPS,
+        max_lines: Optional[int] = None,
+        overflow: str = "condense",
+        keep: Callable[[str], bool] = is_headline,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        A commentary sink that writes buffered lines as rate-limited frames.
+
+        Args:
+            stream (file): Where frames go; defaults to sys.stdout.
+            fps (float): The most frames written per second.
+            max_lines (int): The most lines in one frame; defaults to the
+                terminal height; 0 means no limit.
+            overflow (str): What to do with lines past max_lines: "drop"
+                keeps the newest lines, "condense" keeps the headline lines
+                and counts the rest.
+            keep (callable): Picks the lines "condense" keeps.
+            clock (callable): Monotonic time source in seconds.
+        """
+        if fps <= 0:
+            raise ValueError(f"Invalid fps: {fps}. It must be positive.")
+        if overflow not in OVERFLOW_MODES:
+            raise ValueError(
+                f"Invalid overflow mode '{overflow}'. "
+                f"Valid modes are: {', '.join(OVERFLOW_MODES)}."
+            )
+        self.stream = stream if stream is not None else sys.stdout
+        self.interval = 1.0 / fps
+        if max_lines is None:
+            max_lines = shutil.get_terminal_size().lines - 1
+        self.max_lines = max(max_lines, 0)
+        self.overflow = overflow
+        self.keep = keep
+        self.clock = clock
+        self.frames = 0
+        self.lines = 0  # lines received
+        self.dropped = 0  # lines left out of a frame
+        self._pending: List[str] = []
+        self._next_frame = clock()
+        self._previous_sink: Optional[Callable[[str], None]] = None
+
+    def __call__(self, line: str = "") -> None:
+        self._pending.append(line)
+        self.lines += 1
+        if self.clock() >= self._next_frame:
+            self.flush()
+
+    def fit(self, lines: List[str]) -> List[str]:
+        """Trims one frame's lines to max_lines using the overflow mode."""
+        limit = self.max_lines
+        if not limit or len(lines) <= limit:
+            return lines
+        if self.overflow == "drop":
+            kept = lines[len(lines) - limit + 1 :]
+            skipped = len(lines) - len(kept)
+            self.dropped += skipped
+            return [f"... {skipped} lines skipped ..."] + kept
+        keep = self.keep
+        headlines = [line for line in lines if keep(line)]
+        headlines = headlines[max(len(headlines) - limit + 1, 0) :]
+        skipped = len(lines) - len(headlines)
+        self.dropped += skipped
+        return headlines + [f"... {skipped} more lines of action ..."]
+
+    def flush(self) -> None:
+        """Writes every pending line now as one frame."""
+        if not self._pending:
+            return
+        lines, self._pending = self.fit(self._pending), []
+        self.stream.write("\n".join(lines) + "\n")
+        self.stream.flush()
+        self.frames += 1
+        self._next_frame = self.clock() + self.interval
+
+    def __enter__(self) -> "FrameRenderer":
+        self._previous_sink = COMMENTARY.sink
+        COMMENTARY.sink = self
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        COMMENTARY.sink = self._previous_sink  # type: ignore[assignment]
+        self.flush()
+
+
+class ColumnRenderer(FrameRenderer):
+    def __init__(
+        self,
+        columns: int,
+        stream: Optional[TextIO] = None,
+        fps: float = DEFAULT_FPS,
+        width: Optional[int] = None,
+        height: int = DEFAULT_PANEL_HEIGHT,
+        redraw: Optional[bool] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Renders several commentary channels side by side. Each column shows
+        the newest ``height`` lines of its channel; older lines scroll off.
+
+        Args:
+            columns (int): Number of channels, one per match.
+            stream (file): Where frames go; defaults to sys.stdout.
+            fps (float): The most frames written per second.
+            width (int): Total width in characters; defaults to the terminal.
+            height (int): Rows per column.
+            redraw (bool): Draw each frame over the last one with ANSI cursor
+                movement; defaults to whether the stream is a terminal.
+            clock (callable): Monotonic time source in seconds.
+        """
+        if columns < 1:
+            raise ValueError(f"Invalid columns: {columns}. It must be at least 1.")
+        super().__init__(stream, fps, max_lines=0, clock=clock)
+        if width is None:
+            width = shutil.get_terminal_size().columns
+        self.column_width = max((width - len(SEPARATOR) * (columns - 1)) // columns, 1)
+        self.height = height
+        self.redraw = self.stream.isatty() if redraw is None else redraw
+        self.channels: List[Deque[str]] = [deque(maxlen=height) for _ in range(columns)]
+        self._dirty = False
+        self._drawn = False
+        self._first_channel = self.channel(0)
+
+    def channel(self, index: int) -> Callable[[str], None]:
+        """Returns a sink that writes to column ``index``."""
+        lines = self.channels[index]
+
+        def sink(line: str = "") -> None:
+            lines.append(line)
+            self.lines += 1
+            self._dirty = True
+            if self.clock() >= self._next_frame:
+                self.flush()
+
+        return sink
+
+    def __call__(self, line: str = "") -> None:
+        self._first_channel(line)
+
+    def _cell(self, line: str) -> str:
+        width = self.column_width
+        if len(line) > width:
+            return line[: width - 1] + "~"
+        return line.ljust(width)
+
+    def flush(self) -> None:
+        """Draws the current contents of every column now."""
+        if not self._dirty:
+            return
+        rows = []
+        for row in range(self.height):
+            cells = [
+                self._cell(lines[row]) if row < len(lines) else " " * self.column_width
+                for lines in self.channels
+            ]
+            while cells and not cells[-1].strip():
+                cells.pop()  # no separators trailing into empty columns
+            rows.append(SEPARATOR.join(cells).rstrip())
+        frame = "\n".join(rows) + "\n"
+        if self.redraw and self._drawn:
+            frame = f"\x1b[{self.height}F\x1b[J" + frame
+        self.stream.write(frame)
+        self.stream.flush()
+        self.frames += 1
+        self._dirty = False
+        self._drawn = True
+        self._next_frame = self.clock() + self.interval
+
+
+def replay_side_by_side(
+    matches: Iterable[RecordedMatch],
+    renderer: Optional[ColumnRenderer] = None,
+    speed: Optional[float] = None,
+) -> ColumnRenderer:
+    """
+    Replays recorded matches at the same time, one column each: every step
+    advances each unfinished match by one action.
+
+    Args:
+        matches (iterable): Matches from storage.event_log.read_matches().
+        renderer (ColumnRenderer): Where to draw; by default a new one with a
+            column per match.
+        speed (float): None replays instantly; otherwise 1.0 keeps the pace
+            of a live Tournament, as in event_log.replay.
+    Returns:
+        ColumnRenderer: The renderer used.
+    """
+    if speed is not None and speed <= 0:
+        raise ValueError(f"Invalid replay speed: {speed}. It must be positive.")
+    matches = list(matches)
+    if renderer is None:
+        renderer = ColumnRenderer(len(matches))
+    if len(matches) > len(renderer.channels):
+        raise ValueError(
+            f"{len(matches)} matches do not fit in {len(renderer.channels)} columns."
+        )
+    running = [
+        (replay_steps(match), renderer.channel(i)) for i, match in enumerate(matches)
+    ]
+    while running:
+        still_running = []
+        for steps, sink in running:
+            lines = next(steps, None)
+            if lines is None:
+                continue
+            for line in lines:
+                sink(line)
+            still_running.append((steps, sink))
+        running = still_running
+        if speed is not None and running:
+            renderer.flush()
+            time.sleep(1.5 / speed)
+    renderer.flush()
+    return renderer
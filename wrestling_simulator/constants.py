@@ -22,6 +22,10 @@ MAX_STAMINA = 100
 MIN_TOURNAMENT_SIZE = 4
 MAX_TOURNAMENT_SIZE = 64
 
+# Match limits
+MAX_MATCH_TURNS = 300  # actions by both wrestlers before a decision is forced
+STALL_WINDOW = 40  # exchanges in a row without net damage before a decision
+
 # Roster limits
 MIN_ROSTER_SIZE = 11
 MAX_ROSTER_SIZE = 75
@@ -2,10 +2,72 @@
 Core module for the wrestling simulator.
 
 This module contains the main classes for wrestlers, rosters, and tournaments.
+They are imported lazily, the first time each name is used.
 """
 
-from .wrestler import Wrestler
-from .roster import Roster
-from .tournament import Tournament
+from .._lazy import attach
 
-__all__ = ["Wrestler", "Roster", "Tournament"]
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .wrestler import Wrestler
+    from .roster import Roster
+    from .tournament import Tournament
+    from .bracket import Bracket
+    from .odds import BracketOdds, tournament_odds
+    from .seeding import SeedingOptimizer
+    from .season import Season
+    from .formats import RoundRobin, SwissTournament
+    from .battle_royal import BattleRoyal
+    from .head_to_head import HeadToHead
+    from .ratings import EloRatings, GlickoRatings
+    from .metrics import (
+        enable_metrics,
+        disable_metrics,
+        reset_metrics,
+        metrics_snapshot,
+    )
+
+__all__ = [
+    "Wrestler",
+    "Roster",
+    "Tournament",
+    "Bracket",
+    "BracketOdds",
+    "tournament_odds",
+    "SeedingOptimizer",
+    "Season",
+    "EloRatings",
+    "GlickoRatings",
+    "RoundRobin",
+    "SwissTournament",
+    "BattleRoyal",
+    "HeadToHead",
+    "enable_metrics",
+    "disable_metrics",
+    "reset_metrics",
+    "metrics_snapshot",
+]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "Wrestler": ".wrestler",
+        "Roster": ".roster",
+        "Tournament": ".tournament",
+        "Bracket": ".bracket",
+        "BracketOdds": ".odds",
+        "tournament_odds": ".odds",
+        "SeedingOptimizer": ".seeding",
+        "Season": ".season",
+        "EloRatings": ".ratings",
+        "GlickoRatings": ".ratings",
+        "RoundRobin": ".formats",
+        "SwissTournament": ".formats",
+        "BattleRoyal": ".battle_royal",
+        "HeadToHead": ".head_to_head",
+        "enable_metrics": ".metrics",
+        "disable_metrics": ".metrics",
+        "reset_metrics": ".metrics",
+        "metrics_snapshot": ".metrics",
+    },
+)
@@ -0,0 +1,67 @@
+"""
+Action selection tables for the wrestling simulator.
+
+Wrestler.chooseAction picks one of three actions with weights that depend on
+how hurt the opponent is. This module holds those weights as precomputed
+cumulative tables, one per opponent-health bucket, so a choice is one
+uniform draw and a bisect:
+
+    bucket = health_bucket(opponent.health, opponent.max_health)
+    action = choose_action(bucket)  # ATTACK_ACTION, GRAPPLE_ACTION or PIN_ACTION
+
+The draw is exactly what random.choices does with the same weights, so
+seeded matches play out as they always have. A batch engine can use the
+tables with its own generator through ``rand``, e.g. ``rng.random`` of a
+random.Random.
+"""
+
+import random
+from bisect import bisect
+from itertools import accumulate
+from typing import Callable, NamedTuple, Tuple
+
+# Action ids, in the order of the weights below
+ATTACK_ACTION = 0
+GRAPPLE_ACTION = 1
+PIN_ACTION = 2
+ACTION_NAMES = ("attack", "grappleOpponent", "pinOpponent")  # Wrestler methods
+
+# Opponent-health buckets
+HURT = 0  # at half health or below: more aggressive tactics
+FRESH = 1  # above half health: more conservative tactics
+
+ACTION_WEIGHTS = (
+    (0.4, 0.7, 1.5),  # HURT
+    (1.9, 1.5, 0.3),  # FRESH
+)
+
+
+class ActionTable(NamedTuple):
+    cum_weights: Tuple[float, ...]
+    total: float
+
+
+# Built as random.choices builds them, so the same draw gives the same action
+ACTION_TABLES = tuple(
+    ActionTable(cum_weights, cum_weights[-1] + 0.0)
+    for cum_weights in (tuple(accumulate(weights)) for weights in ACTION_WEIGHTS)
+)
+_LAST = len(ACTION_NAMES) - 1
+
+
+def health_bucket(health: int, max_health: int) -> int:
+    """Returns HURT or FRESH for an opponent's current and maximum health."""
+    return HURT if health <= max_health // 2 else FRESH
+
+
+def choose_action(bucket: int, rand: Callable[[], float] = random.random) -> int:
+    """
+    Picks an action id for an opponent-health bucket.
+
+    Args:
+        bucket (int): HURT or FRESH, from health_bucket().
+        rand: Returns a uniform float in [0, 1); defaults to the global
+            random stream, as random.choices uses.
+    """
+    cum_weights, total = ACTION_TABLES[bucket]
+    return bisect(cum_weights, rand() * total, 0, _LAST)
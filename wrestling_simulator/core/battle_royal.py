@@ -0,0 +1,226 @@
+"""
+Battle royal mode for the wrestling simulator.
+
+This module contains the BattleRoyal class, a Royal Rumble style match:
+wrestlers enter one at a time on a fixed interval, every turn a random
+wrestler in the ring acts on a random opponent through
+Wrestler.chooseAction, and a wrestler who is pinned is eliminated. The last
+wrestler left after everyone has entered wins.
+
+Wrestlers in the ring are kept in an ActiveSet, so picking the actor and the
+target and removing an eliminated wrestler are all O(1). A classic 30-man
+rumble and a 10,000-entrant stress run use the same loop.
+"""
+
+import random
+from array import array
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .commentary import say
+from .events import recording
+from .wrestler import Wrestler
+
+DEFAULT_ENTRY_INTERVAL = 3  # turns between entrants; pins come about every 4 turns
+DEFAULT_STARTING = 2  # wrestlers in the ring at the opening bell
+
+
+class ActiveSet:
+    """
+    A set of entrant indexes with O(1) add, remove and random sampling.
+
+    Members live in a dense list; ``position`` maps each index back to its
+    place in the list, so a removal swaps the last member into the hole.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.members: List[int] = []
+        self.position = array("l", [-1]) * capacity
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __contains__(self, index: int) -> bool:
+        return self.position[index] >= 0
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.members)
+
+    def add(self, index: int) -> None:
+        if self.position[index] >= 0:
+            return
+        self.position[index] = len(self.members)
+        self.members.append(index)
+
+    def remove(self, index: int) -> None:
+        hole = self.position[index]
+        if hole < 0:
+            raise KeyError(index)
+        last = self.members.pop()
+        if last != index:
+            self.members[hole] = last
+            self.position[last] = hole
+        self.position[index] = -1
+
+    def sample_pair(self) -> Tuple[int, int]:
+        """Returns two different members chosen uniformly at random."""
+        members = self.members
+        count = len(members)
+        first = random.randrange(count)
+        second = random.randrange(count - 1)
+        if second >= first:
+            second += 1
+        return members[first], members[second]
+
+
+class Elimination(NamedTuple):
+    wrestler: Wrestler
+    eliminated_by: Wrestler
+    turn: int
+    number: int  # entry number of the eliminated wrestler, from 1
+
+
+class BattleRoyal:
+    def __init__(
+        self,
+        entrants: Sequence[Wrestler],
+        entry_interval: int = DEFAULT_ENTRY_INTERVAL,
+        starting: int = DEFAULT_STARTING,
+        shuffle: bool = True,
+        pause: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        """
+        Sets up a battle royal; nothing happens until play().
+
+        Args:
+            entrants (list): Every wrestler in the match.
+            entry_interval (int): Turns between one entrant and the next.
+            starting (int): Wrestlers in the ring at the opening bell.
+            shuffle (bool): Draw the entry order at random; False enters the
+                wrestlers in the order given.
+            pause (callable): Called with a delay in seconds after each action,
+                as in play_match; None runs flat out.
+        """
+        if len(entrants) < 2:
+            raise ValueError(
+                f"A battle royal needs at least 2 wrestlers, got {len(entrants)}."
+            )
+        if not isinstance(entry_interval, int) or entry_interval < 1:
+            raise ValueError(
+                f"Invalid entry_interval: {entry_interval}. It must be a positive "
+                f"number of turns. Try {DEFAULT_ENTRY_INTERVAL}."
+            )
+        if not isinstance(starting, int) or not 2 <= starting <= len(entrants):
+            raise ValueError(
+                f"Invalid starting: {starting}. It must be between 2 and the "
+                f"number of entrants ({len(entrants)})."
+            )
+        self.order: List[Wrestler] = (
+            random.sample(entrants, len(entrants)) if shuffle else list(entrants)
+        )
+        self.entry_interval = entry_interval
+        self.starting = starting
+        self.pause = pause
+        count = len(self.order)
+        self.active = ActiveSet(count)
+        self.entered = 0  # entrants who have come out so far
+        self.turns = 0
+        self.entry_turn = array("l", [-1]) * count
+        self.exit_turn = array("l", [-1]) * count
+        self.elimination_counts = array("L", [0]) * count
+        self.eliminations: List[Elimination] = []
+        self.winner: Optional[Wrestler] = None
+
+    def _enter(self) -> None:
+        number = self.entered
+        wrestler = self.order[number]
+        wrestler.recover()
+        self.active.add(number)
+        self.entry_turn[number] = self.turns
+        self.entered += 1
+        say(f"{wrestler.name} enters the ring at number {number + 1}!")
+
+    def _eliminate(self, index: int, by: int) -> None:
+        self.active.remove(index)
+        self.exit_turn[index] = self.turns
+        self.elimination_counts[by] += 1
+        wrestler, winner = self.order[index], self.order[by]
+        self.eliminations.append(Elimination(wrestler, winner, self.turns, index + 1))
+        say(f"{wrestler.name} has been eliminated by {winner.name}!")
+
+    def play(self) -> Wrestler:
+        """
+        Runs the battle royal to the end.
+
+        Match events are not sent to a core.events recorder, since the event
+        log only describes one-on-one matches.
+
+        Returns:
+            Wrestler: The last wrestler standing.
+        """
+        if self.winner is not None:
+            raise ValueError("This battle royal has already been played.")
+        order, active, pause = self.order, self.active, self.pause
+        count = len(order)
+        with recording(None):
+            while self.entered < self.starting:
+                self._enter()
+            next_entry = self.entry_interval
+            while self.entered < count or len(active) > 1:
+                if self.entered < count and (
+                    self.turns >= next_entry or len(active) < 2
+                ):
+                    self._enter()
+                    next_entry = self.turns + self.entry_interval
+                    continue
+                actor, target = active.sample_pair()
+                attacker, opponent = order[actor], order[target]
+                attacker.chooseAction(opponent)
+                self.turns += 1
+                if pause is not None:
+                    pause(1.5)
+                if opponent.is_defeated:
+                    self._eliminate(target, actor)
+                attacker.staminaRegen()
+                attacker.healthRegen()
+        last = next(iter(active))
+        self.exit_turn[last] = self.turns
+        self.winner = order[last]
+        say(f"{self.winner.name} wins the battle royal!!!")
+        if pause is not None:
+            pause(2)
+        return self.winner
+
+    def standings(self, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Returns the final placings: the winner first, then the wrestlers in
+        reverse order of elimination.
+
+        Args:
+            top (int): Optional number of rows.
+        """
+        if self.winner is None:
+            raise ValueError("The battle royal has not been played yet.")
+        indexes = self.active.members + [
+            elimination.number - 1 for elimination in reversed(self.eliminations)
+        ]
+        if top is not None:
+            indexes = indexes[:top]
+        return [
+            {
+                "wrestler": self.order[i],
+                "entry": i + 1,
+                "eliminations": self.elimination_counts[i],
+                "time_in_ring": self.exit_turn[i] - self.entry_turn[i],
+            }
+            for i in indexes
+        ]
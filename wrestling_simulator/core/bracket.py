@@ -0,0 +1,258 @@
+"""
+Single-elimination brackets for the wrestling simulator.
+
+This module contains the Bracket class which lays out any number of entrants
+in a seeded single-elimination bracket. The bracket is padded up to the next
+power of two with byes, and the standard seeding order (1 v 16, 8 v 9, ...)
+puts those byes against the top seeds.
+
+The bracket is an implicit binary tree stored in one array, like a heap:
+node 1 is the final, the children of node k are 2k and 2k + 1, and the
+leaves (the first-round slots) are nodes size .. 2 * size - 1. Each node
+holds the seed index of the wrestler who won it, so a wrestler's next match
+is one shift away (node // 2) and the slot their opponent comes from is
+node ^ 1. The whole tree serializes to a few bytes per slot.
+"""
+
+import struct
+import sys
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .wrestler import Wrestler
+
+Slot = Optional[Wrestler]  # None is a bye, or a match not decided yet
+Pairing = Tuple[Slot, Slot]
+
+EMPTY = -1  # node not decided yet
+BYE = -2  # leaf with no entrant
+
+_MAGIC = b"WBT1"
+_HEADER = struct.Struct("<4sII")  # magic, bracket size, entrant count
+
+
+def bracket_size(entrants: int) -> int:
+    """Returns the smallest power of two that fits ``entrants``."""
+    size = 1
+    while size < entrants:
+        size *= 2
+    return size
+
+
+def seed_positions(size: int) -> List[int]:
+    """
+    Returns the 0-based seed placed in each slot of a bracket of ``size``.
+
+    Each doubling pairs every seed s with its mirror (2 * current - 1 - s), so
+    seed 0 meets the last seed, the top two seeds can only meet in the final,
+    and so on. For 8 slots this gives [0, 7, 3, 4, 1, 6, 2, 5].
+    """
+    if size < 1 or size & (size - 1):
+        raise ValueError(f"Invalid bracket size: {size}. It must be a power of 2.")
+    order = [0]
+    while len(order) < size:
+        mirror = 2 * len(order) - 1
+        order = [seed for s in order for seed in (s, mirror - s)]
+    return order
+
+
+class Bracket:
+    def __init__(self, entrants: Sequence[Wrestler], seeded: bool = True) -> None:
+        """
+        Lays out a bracket for any number of entrants.
+
+        Args:
+            entrants (list): The wrestlers in the bracket, at least 2.
+            seeded (bool): Seed by overall rating, best first. When False the
+                given order is used as the seeding, so shuffle it for a random draw.
+        """
+        if len(entrants) < 2:
+            raise ValueError(
+                f"A bracket needs at least 2 entrants, got {len(entrants)}."
+            )
+        if seeded:
+            # sorted() is stable, so equal ratings keep their draw order
+            seeds = sorted(
+                entrants, key=lambda wrestler: -wrestler.get_overall_rating()
+            )
+        else:
+            seeds = list(entrants)
+        size = bracket_size(len(seeds))
+        tree = array("i", [EMPTY]) * (2 * size)
+        count = len(seeds)
+        for slot, seed in enumerate(seed_positions(size)):
+            tree[size + slot] = seed if seed < count else BYE
+        self._setup(seeds, size, tree)
+
+    @classmethod
+    def from_layout(cls, seeds: Sequence[Wrestler], leaves: Sequence[int]) -> "Bracket":
+        """
+        Builds a bracket with a custom first-round layout.
+
+        Args:
+            seeds (list): The entrants in seed order.
+            leaves: The seed index in each first-round slot, BYE for an empty
+                one; every seed must appear exactly once.
+        """
+        size = len(leaves)
+        placed = sorted(seed for seed in leaves if seed != BYE)
+        if size < 2 or size & (size - 1) or placed != list(range(len(seeds))):
+            raise ValueError(
+                f"Invalid bracket layout: expected each of the {len(seeds)} seeds "
+                f"once, padded with BYE to a power of 2 slots."
+            )
+        if any(leaves[i] == leaves[i + 1] == BYE for i in range(0, size, 2)):
+            raise ValueError(
+                "Invalid bracket layout: two byes cannot meet in the first round."
+            )
+        tree = array("i", [EMPTY]) * size
+        tree.extend(leaves)
+        bracket = cls.__new__(cls)
+        bracket._setup(list(seeds), size, tree)
+        return bracket
+
+    def _setup(self, seeds: List[Wrestler], size: int, tree: "array[int]") -> None:
+        self.seeds = seeds
+        self.size = size
+        self.tree = tree
+        self._seed_of: Dict[Wrestler, int] = {
+            wrestler: seed for seed, wrestler in enumerate(seeds)
+        }
+        # Leaf of each seed, and the deepest node each seed has reached
+        self._leaf = array("i", [0]) * len(seeds)
+        for node in range(size, 2 * size):
+            if tree[node] >= 0:
+                self._leaf[tree[node]] = node
+        self._at = array("i", self._leaf)
+        for node in range(size - 1, 0, -1):
+            if tree[node] >= 0:
+                self._at[tree[node]] = node
+
+    @property
+    def byes(self) -> int:
+        """The number of first-round byes."""
+        return self.size - len(self.seeds)
+
+    @property
+    def rounds(self) -> int:
+        """The number of rounds needed to crown a winner."""
+        return self.size.bit_length() - 1
+
+    @property
+    def slots(self) -> List[Slot]:
+        """The first-round slots in bracket order; None is a bye."""
+        return [self.wrestler_at(node) for node in range(self.size, 2 * self.size)]
+
+    @property
+    def champion(self) -> Slot:
+        """The winner of the final, or None while it is undecided."""
+        return self.wrestler_at(1)
+
+    def wrestler_at(self, node: int) -> Slot:
+        """Returns the wrestler holding a node, or None for a bye or undecided node."""
+        seed = self.tree[node]
+        return self.seeds[seed] if seed >= 0 else None
+
+    def seed_of(self, wrestler: Wrestler) -> int:
+        """Returns a wrestler's seed, starting at 1."""
+        return self._seed_of[wrestler] + 1
+
+    def leaf(self, wrestler: Wrestler) -> int:
+        """Returns the node of a wrestler's first-round slot."""
+        return self._leaf[self._seed_of[wrestler]]
+
+    def match_node(self, wrestler: Wrestler, round: int) -> int:
+        """Returns the node a wrestler would win in ``round``, starting at 1."""
+        return self.leaf(wrestler) >> round
+
+    def meeting_round(self, wrestler1: Wrestler, wrestler2: Wrestler) -> int:
+        """Returns the only round in which two wrestlers can meet."""
+        return (self.leaf(wrestler1) ^ self.leaf(wrestler2)).bit_length()
+
+    def current_node(self, wrestler: Wrestler) -> int:
+        """Returns the deepest node a wrestler has reached so far."""
+        return self._at[self._seed_of[wrestler]]
+
+    def next_opponent_slot(self, wrestler: Wrestler) -> int:
+        """Returns the node a wrestler's next opponent will come from."""
+        return self._at[self._seed_of[wrestler]] ^ 1
+
+    def next_opponent(self, wrestler: Wrestler) -> Slot:
+        """Returns a wrestler's next opponent, or None for a bye or if undecided."""
+        return self.wrestler_at(self.next_opponent_slot(wrestler))
+
+    def round_nodes(self, round: int) -> range:
+        """Returns the nodes of the matches in ``round``, starting at 1."""
+        if not 1 <= round <= self.rounds:
+            raise ValueError(
+                f"Invalid round: {round}. This bracket has rounds 1 to {self.rounds}."
+            )
+        return range(self.size >> round, self.size >> (round - 1))
+
+    def contestants(self, node: int) -> Pairing:
+        """Returns the two wrestlers who meet at ``node``."""
+        return self.wrestler_at(2 * node), self.wrestler_at(2 * node + 1)
+
+    def pairings(self, round: int) -> List[Pairing]:
+        """Returns the pairings of ``round`` in bracket order; None is a bye."""
+        return [self.contestants(node) for node in self.round_nodes(round)]
+
+    def first_round(self) -> List[Pairing]:
+        """Returns the opening pairings; a None opponent is a bye."""
+        return self.pairings(1)
+
+    def record_winner(self, node: int, wrestler: Wrestler) -> None:
+        """
+        Records the winner of the match at ``node``.
+
+        Args:
+            node (int): A node from round_nodes().
+            wrestler (Wrestler): One of the two contestants of that node.
+        """
+        seed = self._seed_of.get(wrestler)
+        if seed is None or seed not in (self.tree[2 * node], self.tree[2 * node + 1]):
+            raise ValueError(
+                f"Wrestler '{wrestler.name}' is not a contestant of bracket node {node}."
+            )
+        self.tree[node] = seed
+        self._at[seed] = node
+
+    def to_bytes(self) -> bytes:
+        """Serializes the tree; the wrestlers are not included, see from_bytes()."""
+        tree = array("i", self.tree)
+        if sys.byteorder == "big":
+            tree.byteswap()
+        return _HEADER.pack(_MAGIC, self.size, len(self.seeds)) + tree.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, seeds: Sequence[Wrestler]) -> "Bracket":
+        """
+        Rebuilds a bracket from to_bytes() output.
+
+        Args:
+            data (bytes): The serialized tree.
+            seeds (list): The bracket's ``seeds``, in the same order.
+        """
+        magic, size, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Not a serialized bracket (bad magic bytes).")
+        if count != len(seeds):
+            raise ValueError(
+                f"The bracket was saved with {count} entrants but {len(seeds)} "
+                f"seeds were given."
+            )
+        tree = array("i")
+        tree.frombytes(data[_HEADER.size : _HEADER.size + 2 * size * tree.itemsize])
+        if sys.byteorder == "big":
+            tree.byteswap()
+        bracket = cls.__new__(cls)
+        bracket._setup(list(seeds), size, tree)
+        return bracket
+
+
+def pair_slots(slots: Sequence[Slot]) -> List[Pairing]:
+    """
+    Pairs adjacent slots, which is how each round of a bracket is drawn from
+    the winners of the one before it.
+    """
+    return [(slots[i], slots[i + 1]) for i in range(0, len(slots) - 1, 2)]
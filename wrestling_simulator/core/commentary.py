@@ -0,0 +1,59 @@
+"""
+Match commentary for the wrestling simulator.
+
+This module contains the Commentary class which every line of play-by-play
+goes through. By default lines are printed, but the sink can be swapped (for
+example for a buffered renderer) and commentary can be switched off entirely
+for headless batch runs.
+"""
+
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+
+class Commentary:
+    def __init__(self) -> None:
+        self.enabled = True
+        self.sink: Callable[[str], None] = print
+
+    def say(self, line: str = "") -> None:
+        """
+        Sends one line of commentary to the current sink.
+
+        Args:
+            line (str): The text to show; an empty string is a blank line.
+        """
+        if self.enabled:
+            self.sink(line)
+
+    def flush(self) -> None:
+        """Shows anything the sink is holding back, for sinks that buffer."""
+        flush = getattr(self.sink, "flush", None)
+        if flush is not None:
+            flush()
+
+
+COMMENTARY = Commentary()
+say = COMMENTARY.say
+
+
+@contextmanager
+def silenced() -> Iterator[None]:
+    """Turns commentary off for the duration of a with block."""
+    previous = COMMENTARY.enabled
+    COMMENTARY.enabled = False
+    try:
+        yield
+    finally:
+        COMMENTARY.enabled = previous
+
+
+@contextmanager
+def redirected(sink: Callable[[str], None]) -> Iterator[None]:
+    """Sends commentary to ``sink`` for the duration of a with block."""
+    previous = COMMENTARY.sink
+    COMMENTARY.sink = sink
+    try:
+        yield
+    finally:
+        COMMENTARY.sink = previous
@@ -0,0 +1,72 @@
+"""
+Match event hooks for the wrestling simulator.
+
+This module defines small integer codes for everything that can happen in a
+match and the EVENTS hook that the Wrestler action methods and play_match
+report to. Nothing is recorded unless a recorder is attached, e.g. a
+storage.event_log.EventLogWriter:
+
+    with recording(EventLogWriter("matches.wel")):
+        tournament.tournamentPlay()
+
+A recorder needs three methods:
+    begin_match(player1, player2)
+    event(code, actor, damage)     damage is 0.0 for codes without damage
+    end_match(winner, turns, ending)
+"""
+
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+# Event codes, one per outcome of the actions chooseAction can pick. Pin
+# outcomes are split by the commentary line they produce, so a replay can
+# reproduce it exactly.
+ATTACK = 0
+GRAPPLE_HIT = 1
+GRAPPLE_ESCAPE = 2
+PIN_WIN = 3
+PIN_KICKOUT = 4
+PIN_NONE = 5  # a pin attempt that neither scored nor drew a kick-out
+PIN_WIN_EARLY = 6  # pinned at full health
+PIN_WIN_UPSET = 7  # "in an unlikely turn of events"
+PIN_WIN_QUICK = 8  # "wins with a quick pin"
+PIN_QUICK_KICKOUT = 9  # kicked out at one
+
+PIN_WINS = (PIN_WIN, PIN_WIN_EARLY, PIN_WIN_UPSET, PIN_WIN_QUICK)
+
+ACTION_OF_EVENT = (
+    "attack",
+    "grappleOpponent",
+    "grappleOpponent",
+    "pinOpponent",
+    "pinOpponent",
+    "pinOpponent",
+    "pinOpponent",
+    "pinOpponent",
+    "pinOpponent",
+    "pinOpponent",
+)
+
+# How a match ended
+END_PINFALL = 0
+END_TIME_LIMIT = 1
+END_STALL = 2
+
+
+class MatchEvents:
+    def __init__(self) -> None:
+        self.recorder: Any = None
+
+
+EVENTS = MatchEvents()
+
+
+@contextmanager
+def recording(recorder: Any) -> Iterator[Any]:
+    """Sends match events to ``recorder`` for the duration of a with block."""
+    previous = EVENTS.recorder
+    EVENTS.recorder = recorder
+    try:
+        yield recorder
+    finally:
+        EVENTS.recorder = previous
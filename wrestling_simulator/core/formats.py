@@ -0,0 +1,350 @@
+"""
+Round-robin and Swiss tournament formats for the wrestling simulator.
+
+This module contains headless tournament formats built on play_match. Every
+bout starts with both wrestlers at full health, so the bouts of a round are
+independent and can be spread over a pool of worker processes. Workers read
+the entrants from a SharedRoster and only receive wrestler index pairs.
+"""
+
+import math
+from array import array
+from itertools import islice
+from multiprocessing import Pool
+from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .commentary import COMMENTARY, silenced
+from .match import play_match
+from .shared_roster import SharedRoster, init_worker, worker_roster
+from .wrestler import Wrestler
+from ..constants import MAX_MATCH_TURNS, STALL_WINDOW
+
+DEFAULT_CHUNK_SIZE = 2048  # bouts shipped to a worker per task
+
+Pairing = Tuple[int, int]
+Standing = Tuple[Wrestler, int, int]  # wrestler, wins, losses
+
+
+def _play_bouts(
+    wrestlers: Sequence[Wrestler],
+    flat_pairs: Sequence[int],
+    max_turns: int,
+    stall_window: int,
+) -> "array[int]":
+    """Plays bouts given as [i0, j0, i1, j1, ...] and returns each winner's index."""
+    winners = array("l")
+    for k in range(0, len(flat_pairs), 2):
+        i, j = flat_pairs[k], flat_pairs[k + 1]
+        first, second = wrestlers[i], wrestlers[j]
+        first.recover()
+        second.recover()
+        result = play_match(first, second, max_turns, stall_window)
+        winners.append(i if result.winner is first else j)
+    return winners
+
+
+_worker_wrestlers: List[Wrestler] = []
+
+
+def _init_bout_worker(name: str) -> None:
+    global _worker_wrestlers
+    init_worker(name)
+    COMMENTARY.enabled = False
+    _worker_wrestlers = worker_roster().wrestlers()
+
+
+def _play_chunk(task: Tuple[bytes, int, int]) -> bytes:
+    raw_pairs, max_turns, stall_window = task
+    flat_pairs = array("l")
+    flat_pairs.frombytes(raw_pairs)
+    winners = _play_bouts(_worker_wrestlers, flat_pairs, max_turns, stall_window)
+    return winners.tobytes()
+
+
+class BoutRunner:
+    """Runs batches of independent bouts, in-process or on a worker pool."""
+
+    def __init__(
+        self,
+        wrestlers: Sequence[Wrestler],
+        workers: int = 1,
+        max_turns: int = MAX_MATCH_TURNS,
+        stall_window: int = STALL_WINDOW,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError(
+                f"Invalid worker count: {workers}. Use 1 to run in-process "
+                f"or a higher number for a process pool."
+            )
+        self.wrestlers = list(wrestlers)
+        self.workers = workers
+        self.max_turns = max_turns
+        self.stall_window = stall_window
+        self.chunk_size = chunk_size
+        self._shared: Optional[SharedRoster] = None
+        self._pool = None
+        if workers > 1:
+            self._shared = SharedRoster.create(self.wrestlers)
+            try:
+                self._pool = Pool(
+                    workers,
+                    initializer=_init_bout_worker,
+                    initargs=(self._shared.name,),
+                )
+            except BaseException:
+                self.close()  # nothing else would free the shared block
+                raise
+
+    def run(self, pairs: Sequence[Pairing]) -> List[int]:
+        """
+        Plays every pairing and returns the winner's index for each, in order.
+
+        Args:
+            pairs: (i, j) index pairs into the runner's wrestlers; i acts first.
+        """
+        flat_pairs = array("l", [index for pair in pairs for index in pair])
+        if self._pool is None:
+            with silenced():
+                return list(
+                    _play_bouts(
+                        self.wrestlers, flat_pairs, self.max_turns, self.stall_window
+                    )
+                )
+        step = 2 * self.chunk_size
+        tasks = [
+            (flat_pairs[k : k + step].tobytes(), self.max_turns, self.stall_window)
+            for k in range(0, len(flat_pairs), step)
+        ]
+        winners = array("l")
+        for raw_winners in self._pool.imap(_play_chunk, tasks):
+            winners.frombytes(raw_winners)
+        return list(winners)
+
+    def close(self) -> None:
+        """Stops the worker pool and frees the shared roster."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared.unlink()
+            self._shared = None
+
+    def __enter__(self) -> "BoutRunner":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _batched(pairs: Iterable[Pairing], size: int) -> Iterator[List[Pairing]]:
+    iterator = iter(pairs)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class RoundRobin:
+    def __init__(
+        self,
+        wrestlers: Sequence[Wrestler],
+        workers: int = 1,
+        max_turns: int = MAX_MATCH_TURNS,
+        stall_window: int = STALL_WINDOW,
+    ) -> None:
+        self.wrestlers = list(wrestlers)
+        if len(self.wrestlers) < 2:
+            raise ValueError(
+                f"A round robin needs at least 2 wrestlers, got {len(self.wrestlers)}."
+            )
+        self.workers = workers
+        self.max_turns = max_turns
+        self.stall_window = stall_window
+        self.wins = array("L", [0]) * len(self.wrestlers)
+        self.losses = array("L", [0]) * len(self.wrestlers)
+
+    def pairings(self) -> Iterator[Pairing]:
+        """
+        Yields all n(n-1)/2 bouts. Who acts first alternates so that no
+        wrestler opens every one of their bouts.
+        """
+        count = len(self.wrestlers)
+        for i in range(count):
+            for j in range(i + 1, count):
+                yield (i, j) if (i + j) % 2 else (j, i)
+
+    def play(self) -> List[Standing]:
+        """
+        Plays every bout and returns the final standings.
+
+        Returns:
+            list: (wrestler, wins, losses), best record first.
+        """
+        wins, losses = self.wins, self.losses
+        with BoutRunner(
+            self.wrestlers, self.workers, self.max_turns, self.stall_window
+        ) as runner:
+            batch_size = DEFAULT_CHUNK_SIZE * self.workers
+            for batch in _batched(self.pairings(), batch_size):
+                for (i, j), winner in zip(batch, runner.run(batch)):
+                    wins[winner] += 1
+                    losses[j if winner == i else i] += 1
+        return self.standings()
+
+    def standings(self) -> List[Standing]:
+        order = sorted(
+            range(len(self.wrestlers)), key=lambda i: (-self.wins[i], self.losses[i])
+        )
+        return [(self.wrestlers[i], self.wins[i], self.losses[i]) for i in order]
+
+
+class SwissTournament:
+    def __init__(
+        self,
+        wrestlers: Sequence[Wrestler],
+        rounds: Optional[int] = None,
+        workers: int = 1,
+        max_turns: int = MAX_MATCH_TURNS,
+        stall_window: int = STALL_WINDOW,
+    ) -> None:
+        self.wrestlers = list(wrestlers)
+        count = len(self.wrestlers)
+        if count < 2:
+            raise ValueError(
+                f"A Swiss tournament needs at least 2 wrestlers, got {count}."
+            )
+        if rounds is None:
+            rounds = math.ceil(math.log2(count))
+        if not isinstance(rounds, int) or not 1 <= rounds < count:
+            raise ValueError(
+                f"Invalid number of rounds: {rounds}. With {count} wrestlers, "
+                f"use between 1 and {count - 1} rounds to avoid forced rematches."
+            )
+        self.rounds = rounds
+        self.workers = workers
+        self.max_turns = max_turns
+        self.stall_window = stall_window
+        self.round = 0
+        self.scores = array("L", [0]) * count
+        self.opponents: List[List[int]] = [[] for _ in range(count)]
+        self._played: Set[int] = set()  # i * count + j with i < j
+        self._byes: Set[int] = set()
+        # Ties in score are paired in seeding order, strongest first
+        ratings = [wrestler.get_overall_rating() for wrestler in self.wrestlers]
+        self._seed_order = sorted(range(count), key=lambda i: -ratings[i])
+        self._seed_rank = array("L", [0]) * count
+        for rank, i in enumerate(self._seed_order):
+            self._seed_rank[i] = rank
+
+    def _key(self, first: int, second: int) -> int:
+        low, high = (first, second) if first < second else (second, first)
+        return low * len(self.wrestlers) + high
+
+    def pair_round(self) -> Tuple[List[Pairing], Optional[int]]:
+        """
+        Pairs the next round from the current score groups.
+
+        Wrestlers are ranked by score (then seed) and each one, from the top,
+        meets the next-ranked wrestler they have not faced yet, so pairings stay
+        within a score group and only float down when a group runs out. A
+        rematch is only allowed when nobody unplayed is left.
+
+        Returns:
+            tuple: The list of (i, j) pairings and the index given a bye, if any.
+        """
+        scores, seed_rank = self.scores, self._seed_rank
+        order = sorted(
+            range(len(self.wrestlers)), key=lambda i: (-scores[i], seed_rank[i])
+        )
+        bye = None
+        if len(order) % 2:
+            # Lowest-ranked wrestler who has not had a bye yet
+            for i in reversed(order):
+                if i not in self._byes:
+                    bye = i
+                    break
+            else:
+                bye = order[-1]
+            order.remove(bye)
+
+        played = self._played
+        paired = [False] * len(self.wrestlers)
+        pairs: List[Pairing] = []
+        first_free = 0
+        for position, i in enumerate(order):
+            if paired[i]:
+                continue
+            paired[i] = True
+            while first_free < len(order) and paired[order[first_free]]:
+                first_free += 1
+            opponent = None
+            for k in range(max(position + 1, first_free), len(order)):
+                j = order[k]
+                if not paired[j] and self._key(i, j) not in played:
+                    opponent = j
+                    break
+            if opponent is None:
+                # Everyone left has already met i. Take the nearest of them and
+                # try to swap partners with an earlier pair, most recent first,
+                # so both new bouts are fresh; otherwise accept the rematch.
+                opponent = order[first_free]
+                paired[opponent] = True
+                pairs.append(self._repair(pairs, i, opponent))
+                continue
+            paired[opponent] = True
+            pairs.append((i, opponent))
+        return pairs, bye
+
+    def _repair(self, pairs: List[Pairing], i: int, j: int) -> Pairing:
+        played = self._played
+        key = self._key
+        for k in range(len(pairs) - 1, -1, -1):
+            a, b = pairs[k]
+            if key(a, i) not in played and key(b, j) not in played:
+                pairs[k] = (a, i)
+                return (b, j)
+            if key(a, j) not in played and key(b, i) not in played:
+                pairs[k] = (a, j)
+                return (b, i)
+        return (i, j)
+
+    def play_round(self, runner: BoutRunner) -> None:
+        """Pairs and plays one round, updating scores and opponent lists."""
+        pairs, bye = self.pair_round()
+        for (i, j), winner in zip(pairs, runner.run(pairs)):
+            self.scores[winner] += 1
+            self.opponents[i].append(j)
+            self.opponents[j].append(i)
+            self._played.add(self._key(i, j))
+        if bye is not None:
+            self.scores[bye] += 1
+            self._byes.add(bye)
+        self.round += 1
+
+    def play(self) -> List[Tuple[Wrestler, int, int]]:
+        """
+        Plays every round and returns the final standings.
+
+        Returns:
+            list: (wrestler, score, buchholz), best first. Buchholz is the sum
+            of opponents' scores and breaks ties in score.
+        """
+        with BoutRunner(
+            self.wrestlers, self.workers, self.max_turns, self.stall_window
+        ) as runner:
+            while self.round < self.rounds:
+                self.play_round(runner)
+        return self.standings()
+
+    def standings(self) -> List[Tuple[Wrestler, int, int]]:
+        scores = self.scores
+        buchholz = [sum(scores[j] for j in opps) for opps in self.opponents]
+        order = sorted(
+            range(len(self.wrestlers)),
+            key=lambda i: (-scores[i], -buchholz[i], self._seed_rank[i]),
+        )
+        return [(self.wrestlers[i], scores[i], buchholz[i]) for i in order]
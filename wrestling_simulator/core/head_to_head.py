@@ -0,0 +1,199 @@
+"""
+Roster-wide head-to-head comparison for the wrestling simulator.
+
+This module contains HeadToHead, the roster-sized counterpart of
+Wrestler.compare_wrestlers: for every pair of wrestlers it gives the
+advantage in each stat and in overall rating, and the chance that one beats
+the other. Stats are held as one typed array per stat, so a matrix row is a
+single vectorised subtraction rather than n attribute lookups.
+
+Matrices can be written as CSV or Markdown through utils.tables.TableWriter,
+one row at a time:
+
+    h2h = HeadToHead(roster.roster)
+    with open("h2h.csv", "w", newline="") as f:
+        h2h.write_pairs(f)
+"""
+
+from array import array
+from itertools import repeat
+from operator import gt, sub
+from typing import Any, Dict, Iterator, List, Sequence, Set, TextIO, Tuple, Union
+
+from .odds import ProbabilitySource, probability_matrix
+from .wrestler import Wrestler
+from ..schema import SCHEMA
+from ..utils.tables import TableWriter
+
+WIN_PROBABILITY = "win_probability"
+OVERALL = "overall"
+
+WrestlerRef = Union[int, str, Wrestler]
+
+
+class HeadToHead:
+    def __init__(
+        self,
+        wrestlers: Sequence[Wrestler],
+        source: ProbabilitySource = "rating",
+        **options: float,
+    ) -> None:
+        """
+        Gathers the stat columns and builds the win probabilities.
+
+        Args:
+            wrestlers (list): The wrestlers to compare, in matrix order.
+            source: Where win probabilities come from: "rating",
+                "monte_carlo" or a callable(a, b), as in tournament_odds.
+            **options: Passed to the probability builder, e.g. ``samples=200``.
+        """
+        if len(wrestlers) < 2:
+            raise ValueError(
+                f"A head-to-head comparison needs at least 2 wrestlers, "
+                f"got {len(wrestlers)}."
+            )
+        self.wrestlers = list(wrestlers)
+        self.names = [wrestler.name for wrestler in self.wrestlers]
+        # Rows are by position, so wrestlers who share a name keep their own;
+        # objects are found by identity, and a shared name is ambiguous
+        self._positions = {id(wrestler): i for i, wrestler in enumerate(wrestlers)}
+        self._index: Dict[str, int] = {}
+        self._shared_names: Set[str] = set()
+        for i, name in enumerate(self.names):
+            if name in self._index:
+                self._shared_names.add(name)
+            else:
+                self._index[name] = i
+        # Stats compare the schema values, so health is max_health. Stats are
+        # never negative, so a difference fits the same typecode as the column
+        self.columns: Dict[str, "array[Any]"] = {
+            field.name: array(
+                SCHEMA.typecode,
+                [getattr(wrestler, field.attribute) for wrestler in wrestlers],
+            )
+            for field in SCHEMA.fields
+        }
+        self.columns[OVERALL] = array(
+            "d", [wrestler.get_overall_rating() for wrestler in wrestlers]
+        )
+        self.stats: Tuple[str, ...] = tuple(self.columns)
+        self.probabilities = probability_matrix(self.wrestlers, source, **options)
+
+    def __len__(self) -> int:
+        return len(self.wrestlers)
+
+    def index(self, wrestler: WrestlerRef) -> int:
+        """Returns the matrix index of a wrestler given by index, name or object."""
+        if isinstance(wrestler, int):
+            if not 0 <= wrestler < len(self.wrestlers):
+                raise ValueError(f"No wrestler at index {wrestler}.")
+            return wrestler
+        if isinstance(wrestler, Wrestler):
+            position = self._positions.get(id(wrestler))
+            if position is not None:
+                return position
+            name = wrestler.name
+        else:
+            name = wrestler
+        if name in self._shared_names:
+            raise ValueError(
+                f"'{name}' names more than one wrestler in this comparison. "
+                f"Give their matrix index or the Wrestler itself."
+            )
+        index = self._index.get(name)
+        if index is None:
+            raise ValueError(f"'{name}' is not in this comparison.")
+        return index
+
+    def advantage_row(self, stat: str, wrestler: WrestlerRef) -> "array[Any]":
+        """
+        Returns how far ahead a wrestler is of everyone, in matrix order, for
+        a stat name, "overall" or "win_probability". Negative values mean
+        they trail.
+        """
+        i = self.index(wrestler)
+        if stat == WIN_PROBABILITY:
+            return self.probabilities[i]
+        column = self.columns.get(stat)
+        if column is None:
+            raise ValueError(
+                f"Unknown stat '{stat}'. Valid stats are: "
+                f"{', '.join(self.stats + (WIN_PROBABILITY,))}."
+            )
+        return array(column.typecode, map(sub, repeat(column[i]), column))
+
+    def advantage(self, stat: str, wrestler: WrestlerRef, opponent: WrestlerRef) -> Any:
+        """Returns wrestler's value minus opponent's, or the win probability."""
+        i, j = self.index(wrestler), self.index(opponent)
+        if stat == WIN_PROBABILITY:
+            return self.probabilities[i][j]
+        column = self.columns.get(stat)
+        if column is None:
+            return self.advantage_row(stat, i)  # raises the unknown-stat error
+        return column[i] - column[j]
+
+    def win_probability(self, wrestler: WrestlerRef, opponent: WrestlerRef) -> float:
+        """Returns the chance that wrestler beats opponent."""
+        return self.probabilities[self.index(wrestler)][self.index(opponent)]
+
+    def stats_won(self, wrestler: WrestlerRef) -> "array[int]":
+        """
+        Counts, against every opponent, how many of the schema stats the
+        wrestler is strictly ahead in.
+        """
+        i = self.index(wrestler)
+        ahead = [
+            map(gt, repeat(column[i]), column)
+            for column in (self.columns[name] for name in SCHEMA.names)
+        ]
+        return array(SCHEMA.typecode, map(sum, zip(*ahead)))
+
+    def pairs(self) -> Iterator[Tuple[Any, ...]]:
+        """
+        Yields one row per ordered pair of different wrestlers: the two
+        names, the advantage in each stat and overall, then the win
+        probability. Rows are built a wrestler at a time, from whole rows of
+        the matrices.
+        """
+        names = self.names
+        for i, name in enumerate(names):
+            rows = [self.advantage_row(stat, i) for stat in self.stats]
+            rows.append(self.probabilities[i])
+            for j, values in enumerate(zip(names, *rows)):
+                if j != i:
+                    yield (name,) + values
+
+    def pair_columns(self) -> List[str]:
+        """The column headings of pairs()."""
+        return ["wrestler", "opponent", *self.stats, WIN_PROBABILITY]
+
+    def write_pairs(self, stream: TextIO, fmt: str = "csv") -> int:
+        """
+        Writes pairs() as a CSV or Markdown table.
+
+        Returns:
+            int: The number of rows written.
+        """
+        writer = TableWriter(stream, self.pair_columns(), fmt)
+        writer.writerows(self.pairs())
+        return writer.rows
+
+    def write_matrix(
+        self, stream: TextIO, stat: str = WIN_PROBABILITY, fmt: str = "csv"
+    ) -> int:
+        """
+        Writes one square matrix as a CSV or Markdown table: a row per
+        wrestler, a column per opponent. The diagonal of the
+        win-probability matrix is 0.5.
+
+        Args:
+            stream (file): Where the table goes.
+            stat (str): A stat name, "overall" or "win_probability".
+            fmt (str): "csv" or "markdown".
+        Returns:
+            int: The number of rows written.
+        """
+        writer = TableWriter(stream, ["wrestler", *self.names], fmt)
+        for i, name in enumerate(self.names):
+            writer.writerow([name, *self.advantage_row(stat, i)])
+        return writer.rows
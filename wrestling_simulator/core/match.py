@@ -0,0 +1,153 @@
+"""
+Match engine for the wrestling simulator.
+
+This module contains play_match, the one-on-one match loop shared by
+Tournament and the headless tournament formats, and the tiebreak rule used
+when a match hits its turn cap or stalls.
+"""
+
+from typing import Callable, NamedTuple, Optional
+
+from .commentary import say
+from .events import END_PINFALL, END_STALL, END_TIME_LIMIT, EVENTS
+from .metrics import METRICS
+from .wrestler import Wrestler
+from ..constants import MAX_MATCH_TURNS, STALL_WINDOW
+
+
+class MatchResult(NamedTuple):
+    winner: Wrestler
+    loser: Wrestler
+    turns: int
+    decision: bool  # True if settled by tiebreak instead of a pinfall
+    winner_damage: int = 0  # health the winner took off the loser
+    loser_damage: int = 0  # health the loser took off the winner
+
+
+def play_match(
+    player1: Wrestler,
+    player2: Wrestler,
+    max_turns: int = MAX_MATCH_TURNS,
+    stall_window: int = STALL_WINDOW,
+    pause: Optional[Callable[[float], None]] = None,
+) -> MatchResult:
+    """
+    Runs a match until one wrestler is pinned or a decision is forced.
+
+    A match that reaches max_turns, or goes stall_window exchanges without
+    either wrestler losing health, is settled by tiebreak(). Health and
+    stamina are not restored first, so damage carries over from earlier bouts.
+
+    Args:
+        player1 (Wrestler): The wrestler who acts first in every exchange.
+        player2 (Wrestler): The other wrestler.
+        max_turns (int): Actions, counting both wrestlers', before a decision;
+            checked after every action, so an odd cap ends mid-exchange.
+        stall_window (int): Exchanges without net damage before a decision.
+        pause (callable): Called with a delay in seconds after each action and
+            at the end, for paced play; None runs the match flat out.
+
+    Returns:
+        MatchResult: winner, loser, number of turns, whether it went to a
+        decision, and the health each wrestler took off the other.
+    """
+    turns = 0
+    stalled = 0  # consecutive exchanges where regen undid all the damage
+    dealt1 = dealt2 = 0  # health taken off the opponent, before regen
+    player1.reset()
+    player2.reset()
+    if EVENTS.recorder is not None:
+        EVENTS.recorder.begin_match(player1, player2)
+    while True:
+        health1, health2 = player1.health, player2.health
+        player1.chooseAction(player2)
+        dealt1 += health2 - player2.health
+        turns += 1
+        if pause is not None:
+            pause(1.5)  # Delay after each action to let user read it
+        if player2.is_defeated:
+            return _finish(player1, player2, turns, END_PINFALL, pause, dealt1, dealt2)
+        if turns >= max_turns:  # an odd cap can run out mid-exchange
+            return _decide(
+                player1, player2, turns, END_TIME_LIMIT, pause, dealt1, dealt2
+            )
+        player2.chooseAction(player1)
+        dealt2 += health1 - player1.health
+        turns += 1
+        if pause is not None:
+            pause(1.5)
+        if player1.is_defeated:
+            return _finish(player2, player1, turns, END_PINFALL, pause, dealt2, dealt1)
+        player1.staminaRegen()
+        player2.staminaRegen()
+        player1.healthRegen()
+        player2.healthRegen()
+        if player1.health >= health1 and player2.health >= health2:
+            stalled += 1
+        else:
+            stalled = 0
+        if turns >= max_turns or stalled >= stall_window:
+            ending = END_TIME_LIMIT if turns >= max_turns else END_STALL
+            return _decide(player1, player2, turns, ending, pause, dealt1, dealt2)
+
+
+def _decide(
+    player1: Wrestler,
+    player2: Wrestler,
+    turns: int,
+    ending: int,
+    pause: Optional[Callable[[float], None]],
+    dealt1: int,
+    dealt2: int,
+) -> MatchResult:
+    if ending == END_TIME_LIMIT:
+        say("The time limit has expired!")
+    else:
+        say("Neither wrestler can gain the upper hand!")
+    winner = tiebreak(player1, player2)
+    say(f"The winner by decision is {winner.name}!!!")
+    if winner is player1:
+        return _finish(player1, player2, turns, ending, pause, dealt1, dealt2)
+    return _finish(player2, player1, turns, ending, pause, dealt2, dealt1)
+
+
+def _finish(
+    winner: Wrestler,
+    loser: Wrestler,
+    turns: int,
+    ending: int,
+    pause: Optional[Callable[[float], None]],
+    winner_damage: int,
+    loser_damage: int,
+) -> MatchResult:
+    if METRICS.enabled:
+        METRICS.record_match(turns)
+    if EVENTS.recorder is not None:
+        EVENTS.recorder.end_match(winner, turns, ending)
+    if pause is not None:
+        pause(2)  # Delay after match ends to see winner
+    return MatchResult(
+        winner, loser, turns, ending != END_PINFALL, winner_damage, loser_damage
+    )
+
+
+def tiebreak(player1: Wrestler, player2: Wrestler) -> Wrestler:
+    """
+    Decides a match that hit the turn cap or stalled.
+
+    The wrestler with the larger share of their max_health left wins. Equal
+    shares go to the higher overall rating, and a complete tie goes to player1.
+
+    Returns:
+        Wrestler: The winner of the decision; the loser is marked defeated.
+    """
+    share1 = player1.health / player1.max_health
+    share2 = player2.health / player2.max_health
+    if share1 != share2:
+        winner, loser = (player1, player2) if share1 > share2 else (player2, player1)
+    elif player2.get_overall_rating() > player1.get_overall_rating():
+        winner, loser = player2, player1
+    else:
+        winner, loser = player1, player2
+    loser.defeat()
+    return winner
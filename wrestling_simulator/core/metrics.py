@@ -0,0 +1,187 @@
+"""
+Simulation metrics for the wrestling simulator.
+
+This module contains an opt-in collector that counts the actions wrestlers
+take, grapple and pin outcomes, match lengths and per-action timings. It is
+disabled by default; the hot paths only test the ``enabled`` flag until it is
+switched on.
+"""
+
+from typing import Any, Dict, List
+
+from .actions import ACTION_NAMES
+
+# Timings are bucketed by bit length, so bucket b holds durations in
+# [2 ** (b - 1), 2 ** b) nanoseconds. 40 buckets reach well past 9 minutes.
+HISTOGRAM_BUCKETS = 40
+
+
+class SimulationMetrics:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Clears every counter and histogram without changing the enabled flag.
+        """
+        self.action_counts: Dict[str, int] = dict.fromkeys(ACTION_NAMES, 0)
+        self.action_ns: Dict[str, int] = dict.fromkeys(ACTION_NAMES, 0)
+        self.timings: Dict[str, List[int]] = {
+            action: [0] * HISTOGRAM_BUCKETS for action in ACTION_NAMES
+        }
+        self.grapple_attempts = 0
+        self.grapple_successes = 0
+        self.pin_attempts = 0
+        self.pinfalls = 0
+        self.kickouts = 0
+        self.match_turns: Dict[int, int] = {}
+
+    def record_action(self, action: str, elapsed_ns: int) -> None:
+        """
+        Records one action taken through Wrestler.chooseAction.
+
+        Args:
+            action (str): The name of the action method that was called.
+            elapsed_ns (int): How long the action took in nanoseconds.
+        """
+        self.action_counts[action] += 1
+        self.action_ns[action] += elapsed_ns
+        bucket = min(elapsed_ns.bit_length(), HISTOGRAM_BUCKETS - 1)
+        self.timings[action][bucket] += 1
+
+    def record_grapple(self, success: bool) -> None:
+        """
+        Records the outcome of a grapple attempt.
+
+        Args:
+            success (bool): Whether the grapple landed.
+        """
+        self.grapple_attempts += 1
+        if success:
+            self.grapple_successes += 1
+
+    def record_pin_attempt(self) -> None:
+        """
+        Records that a pin was attempted.
+        """
+        self.pin_attempts += 1
+
+    def record_pin_outcome(self, pinfall: bool) -> None:
+        """
+        Records how a pin attempt was resolved.
+
+        Args:
+            pinfall (bool): True if the pin won the match, False for a kickout.
+        """
+        if pinfall:
+            self.pinfalls += 1
+        else:
+            self.kickouts += 1
+
+    def record_match(self, turns: int) -> None:
+        """
+        Records the length of a finished match.
+
+        Args:
+            turns (int): The number of actions taken by both wrestlers.
+        """
+        self.match_turns[turns] = self.match_turns.get(turns, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Builds a point-in-time copy of every metric.
+
+        Returns:
+            dict: Plain data (ints, floats, dicts) that is safe to keep after
+            the collector is reset.
+        """
+        timings: Dict[str, Dict[str, Any]] = {}
+        for action in ACTION_NAMES:
+            count = self.action_counts[action]
+            timings[action] = {
+                "count": count,
+                "total_ns": self.action_ns[action],
+                "mean_ns": self.action_ns[action] / count if count else 0.0,
+                # keyed by the exclusive upper bound of each bucket
+                "histogram": {
+                    1 << bucket: hits
+                    for bucket, hits in enumerate(self.timings[action])
+                    if hits
+                },
+            }
+        return {
+            "actions": dict(self.action_counts),
+            "timings": timings,
+            "grapple": {
+                "attempts": self.grapple_attempts,
+                "successes": self.grapple_successes,
+                "success_rate": (
+                    self.grapple_successes / self.grapple_attempts
+                    if self.grapple_attempts
+                    else 0.0
+                ),
+            },
+            "pin": {
+                "attempts": self.pin_attempts,
+                "pinfalls": self.pinfalls,
+                "kickouts": self.kickouts,
+            },
+            "matches": {
+                **summarize_turns(self.match_turns),
+                "turns": dict(sorted(self.match_turns.items())),
+            },
+        }
+
+
+def summarize_turns(turn_counts: Dict[int, int]) -> Dict[str, float]:
+    """
+    Summarizes a match-length distribution.
+
+    Args:
+        turn_counts (dict): Maps a match length in turns to how many matches
+            lasted that long.
+
+    Returns:
+        dict: count, mean, p50, p99 and max. Percentiles use the nearest-rank
+        method, so they are always lengths that actually occurred.
+    """
+    count = sum(turn_counts.values())
+    if not count:
+        return {"count": 0, "mean": 0.0, "p50": 0, "p99": 0, "max": 0}
+    lengths = sorted(turn_counts)
+    total = sum(turns * n for turns, n in turn_counts.items())
+    # nearest-rank: the smallest length covering ceil(q * count) matches
+    targets = {"p50": -(-count * 50 // 100), "p99": -(-count * 99 // 100)}
+    summary: Dict[str, float] = {"count": count, "mean": total / count}
+    seen = 0
+    for turns in lengths:
+        seen += turn_counts[turns]
+        for key, rank in targets.items():
+            if key not in summary and seen >= rank:
+                summary[key] = turns
+    summary["max"] = lengths[-1]
+    return summary
+
+
+METRICS = SimulationMetrics()
+
+
+def enable_metrics() -> None:
+    """Turns on metric collection for every wrestler and match."""
+    METRICS.enabled = True
+
+
+def disable_metrics() -> None:
+    """Turns off metric collection, keeping whatever was already recorded."""
+    METRICS.enabled = False
+
+
+def reset_metrics() -> None:
+    """Discards everything recorded so far."""
+    METRICS.reset()
+
+
+def metrics_snapshot() -> Dict[str, Any]:
+    """Returns a copy of the metrics recorded so far."""
+    return METRICS.snapshot()
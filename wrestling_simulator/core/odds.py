@@ -0,0 +1,323 @@
+"""
+Bracket odds for the wrestling simulator.
+
+This module computes exact tournament odds from pairwise win probabilities.
+Given a matrix P where P[i][j] is the chance that entrant i beats entrant j,
+the chance that the wrestler in each bracket slot wins round r is
+
+    reach[r][i] = reach[r-1][i] * sum(reach[r-1][j] * P[i][j])
+
+summed over the slots j in the other half of i's round-r block. One pass
+over the rounds gives every entrant's advancement odds in O(n^2), with no
+need to simulate thousands of tournaments.
+
+Pairwise probabilities can come from a rating surrogate (fast, no
+simulation), from Monte Carlo bouts on the real match engine, or from any
+callable. The model treats every match as a fresh bout, as the headless
+formats do, and does not account for damage carried between rounds.
+"""
+
+import math
+from array import array
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from .bracket import BYE, Bracket
+from .roster import Roster
+from .wrestler import Wrestler
+from ..constants import MAX_MATCH_TURNS, STALL_WINDOW
+
+# Rating points per e-fold of the odds, fitted to Monte Carlo bouts between
+# random wrestlers. Overall rating is only a loose predictor of who wins.
+DEFAULT_RATING_SCALE = 20.0
+DEFAULT_SAMPLES = 100  # Monte Carlo bouts per pairing
+
+Matrix = List["array[float]"]
+ProbabilitySource = Union[str, Callable[[Wrestler, Wrestler], float]]
+
+
+def rating_matrix(
+    wrestlers: Sequence[Wrestler], scale: float = DEFAULT_RATING_SCALE
+) -> Matrix:
+    """
+    Builds win probabilities from overall ratings with a logistic curve.
+
+    Args:
+        wrestlers (list): The entrants, in matrix order.
+        scale (float): Rating gap at which the odds are e to 1; smaller
+            values make ratings more decisive.
+    """
+    ratings = [wrestler.get_overall_rating() for wrestler in wrestlers]
+    return [
+        array("d", [1 / (1 + math.exp((r_j - r_i) / scale)) for r_j in ratings])
+        for r_i in ratings
+    ]
+
+
+def function_matrix(
+    wrestlers: Sequence[Wrestler], probability: Callable[[Wrestler, Wrestler], float]
+) -> Matrix:
+    """
+    Builds win probabilities from a callable, e.g. a custom solver.
+
+    ``probability(a, b)`` is only called once per pair, with a listed before b,
+    and the reverse pairing is filled in as 1 - p.
+    """
+    count = len(wrestlers)
+    matrix = [array("d", [0.5]) * count for _ in range(count)]
+    for i in range(count):
+        for j in range(i + 1, count):
+            p = probability(wrestlers[i], wrestlers[j])
+            if not 0.0 <= p <= 1.0:
+                raise ValueError(
+                    f"Invalid win probability {p} for {wrestlers[i].name} vs "
+                    f"{wrestlers[j].name}. It must be between 0 and 1."
+                )
+            matrix[i][j] = p
+            matrix[j][i] = 1 - p
+    return matrix
+
+
+def monte_carlo_matrix(
+    wrestlers: Sequence[Wrestler],
+    samples: int = DEFAULT_SAMPLES,
+    workers: int = 1,
+    max_turns: int = MAX_MATCH_TURNS,
+    stall_window: int = STALL_WINDOW,
+) -> Matrix:
+    """
+    Estimates win probabilities by playing every pairing on the match engine.
+
+    Each pair meets ``samples`` times from full health, taking turns to act
+    first. Commentary is silenced and the bouts can run on a worker pool.
+
+    Args:
+        wrestlers (list): The entrants, in matrix order.
+        samples (int): Bouts per pairing; the error shrinks like 1/sqrt(samples).
+        workers (int): Processes to play the bouts on; 1 runs in-process.
+    """
+    if not isinstance(samples, int) or samples < 1:
+        raise ValueError(
+            f"Invalid samples: {samples}. It must be a positive integer. "
+            f"Try {DEFAULT_SAMPLES}."
+        )
+    from .formats import BoutRunner  # pulls in multiprocessing, only needed here
+
+    count = len(wrestlers)
+    pairs = [
+        (i, j) if k % 2 == 0 else (j, i)
+        for i in range(count)
+        for j in range(i + 1, count)
+        for k in range(samples)
+    ]
+    wins = [array("L", [0]) * count for _ in range(count)]
+    with BoutRunner(wrestlers, workers, max_turns, stall_window) as runner:
+        for (i, j), winner in zip(pairs, runner.run(pairs)):
+            wins[winner][j if winner == i else i] += 1
+    return [
+        array(
+            "d",
+            [0.5 if i == j else wins[i][j] / samples for j in range(count)],
+        )
+        for i in range(count)
+    ]
+
+
+def probability_matrix(
+    wrestlers: Sequence[Wrestler],
+    source: ProbabilitySource = "rating",
+    **options: float,
+) -> Matrix:
+    """
+    Builds the pairwise win probabilities for ``wrestlers`` from a source.
+
+    Args:
+        wrestlers (list): The wrestlers, in matrix order.
+        source: "rating", "monte_carlo" or a callable(a, b), as in
+            tournament_odds.
+        **options: Passed to the matrix builder.
+    """
+    if callable(source):
+        return function_matrix(wrestlers, source)
+    if source == "rating":
+        return rating_matrix(wrestlers, **options)
+    if source == "monte_carlo":
+        return monte_carlo_matrix(wrestlers, **options)  # type: ignore[arg-type]
+    raise ValueError(
+        f"Invalid probability source: {source!r}. Use 'rating', "
+        f"'monte_carlo' or a callable(wrestler_a, wrestler_b)."
+    )
+
+
+def propagate(
+    leaves: Sequence[int],
+    matrix: Sequence[Sequence[float]],
+    winners: Optional[Sequence[int]] = None,
+) -> List["array[float]"]:
+    """
+    Pushes pairwise odds through a bracket.
+
+    Args:
+        leaves: The entrant index in each first-round slot, BYE for an empty one.
+            The length must be a power of 2.
+        matrix: matrix[a][b] is the chance entrant a beats entrant b.
+        winners: Optional heap-ordered tree of decided results (see
+            Bracket.tree); a node holding an entrant index fixes its outcome.
+
+    Returns:
+        list: One array per round; reach[r][slot] is the chance that the
+        wrestler starting in ``slot`` wins round r + 1.
+    """
+    size = len(leaves)
+    previous = array("d", [0.0 if entrant == BYE else 1.0 for entrant in leaves])
+    reach = []
+    half = 1
+    while half < size:
+        current = array("d")
+        for start in range(0, size, 2 * half):
+            middle, end = start + half, start + 2 * half
+            current.extend(
+                merge_halves(
+                    previous[start:middle],
+                    leaves[start:middle],
+                    previous[middle:end],
+                    leaves[middle:end],
+                    matrix,
+                )
+            )
+        if winners is not None:
+            _fix_decided(current, leaves, winners, size, 2 * half)
+        reach.append(current)
+        previous = current
+        half *= 2
+    return reach
+
+
+def merge_halves(
+    left: Sequence[float],
+    left_entrants: Sequence[int],
+    right: Sequence[float],
+    right_entrants: Sequence[int],
+    matrix: Sequence[Sequence[float]],
+) -> "array[float]":
+    """
+    Plays one bracket node: the winner of the left half meets the winner of
+    the right half.
+
+    Args:
+        left: Chance that each slot of the left half wins that half.
+        left_entrants: The entrant index in each slot of the left half.
+        right: The same for the right half.
+        right_entrants: The entrant index in each slot of the right half.
+        matrix: matrix[a][b] is the chance entrant a beats entrant b.
+
+    Returns:
+        array: Chance that each slot, left half first, wins the node.
+    """
+    out = array("d", [0.0]) * (len(left) + len(right))
+    offset = 0
+    for mine, my_entrants, theirs, their_entrants in (
+        (left, left_entrants, right, right_entrants),
+        (right, right_entrants, left, left_entrants),
+    ):
+        others = [(p, e) for p, e in zip(theirs, their_entrants) if p > 0.0]
+        for k, p_i in enumerate(mine):
+            if p_i == 0.0:
+                continue
+            if not others:
+                out[offset + k] = p_i  # a bye, nobody to beat
+                continue
+            row = matrix[my_entrants[k]]
+            out[offset + k] = p_i * sum(p_j * row[e_j] for p_j, e_j in others)
+        offset = len(left)
+    return out
+
+
+def _fix_decided(
+    current: "array[float]",
+    leaves: Sequence[int],
+    winners: Sequence[int],
+    size: int,
+    block: int,
+) -> None:
+    # The nodes of this round are (size + slot) // block for each slot
+    for start in range(0, size, block):
+        winner = winners[(size + start) // block]
+        if winner < 0:
+            continue
+        for i in range(start, start + block):
+            current[i] = 1.0 if leaves[i] == winner else 0.0
+
+
+class BracketOdds:
+    """Per-round advancement odds for every entrant of a bracket."""
+
+    def __init__(self, bracket: Bracket, matrix: Sequence[Sequence[float]]) -> None:
+        """
+        Args:
+            bracket (Bracket): The bracket; results already recorded in it are
+                treated as certain.
+            matrix: Win probabilities indexed by seed (bracket.seeds order).
+        """
+        self.bracket = bracket
+        self.matrix = matrix
+        leaves = bracket.tree[bracket.size :]
+        reach = propagate(leaves, matrix, bracket.tree)
+        # Re-index from slots to seeds
+        count = len(bracket.seeds)
+        self.reach: List["array[float]"] = []
+        for by_slot in reach:
+            by_seed = array("d", [0.0]) * count
+            for slot, seed in enumerate(leaves):
+                if seed >= 0:
+                    by_seed[seed] = by_slot[slot]
+            self.reach.append(by_seed)
+
+    def advancement(self, wrestler: Wrestler) -> List[float]:
+        """Returns a wrestler's chance of winning each round, first round first."""
+        seed = self.bracket.seed_of(wrestler) - 1
+        return [by_seed[seed] for by_seed in self.reach]
+
+    def champion_probability(self, wrestler: Wrestler) -> float:
+        """Returns a wrestler's chance of winning the whole bracket."""
+        return self.reach[-1][self.bracket.seed_of(wrestler) - 1]
+
+    def table(self) -> List[Tuple[Wrestler, List[float]]]:
+        """Returns (wrestler, per-round odds) for every entrant, in seed order."""
+        return [
+            (wrestler, [by_seed[seed] for by_seed in self.reach])
+            for seed, wrestler in enumerate(self.bracket.seeds)
+        ]
+
+    def favourites(self, top: Optional[int] = None) -> List[Tuple[Wrestler, float]]:
+        """Returns (wrestler, chance of winning) ordered from most to least likely."""
+        final = self.reach[-1]
+        order = sorted(range(len(final)), key=lambda seed: -final[seed])
+        if top is not None:
+            order = order[:top]
+        return [(self.bracket.seeds[seed], final[seed]) for seed in order]
+
+
+def tournament_odds(
+    roster: Roster,
+    bracket: Optional[Bracket] = None,
+    source: ProbabilitySource = "rating",
+    **options: float,
+) -> BracketOdds:
+    """
+    Computes exact advancement odds for every entrant of a bracket.
+
+    Args:
+        roster (Roster): Used to build a seeded bracket when none is given.
+        bracket (Bracket): The bracket to evaluate; its seeds are the entrants.
+        source: "rating" for the logistic surrogate, "monte_carlo" to estimate
+            each pairing on the match engine, or a callable(a, b) returning the
+            chance that a beats b.
+        **options: Passed to the matrix builder, e.g. ``samples=200, workers=4``
+            for Monte Carlo or ``scale=3.0`` for the rating surrogate.
+
+    Returns:
+        BracketOdds: The per-round odds.
+    """
+    if bracket is None:
+        bracket = Bracket(roster.roster)
+    return BracketOdds(bracket, probability_matrix(bracket.seeds, source, **options))
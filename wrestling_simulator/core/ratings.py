@@ -0,0 +1,209 @@
+"""
+Rating engines for the wrestling simulator.
+
+This module contains streaming Elo and Glicko rating engines. Ratings are
+held in compact ``array`` columns keyed by roster position and updated one
+result at a time, so they can follow live Tournament.match results or replay
+millions of stored results, and the leaderboard can be read at any point.
+"""
+
+import abc
+import heapq
+import math
+from array import array
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .wrestler import Wrestler
+
+if TYPE_CHECKING:
+    from .roster import Roster
+
+DEFAULT_RATING = 1500.0
+DEFAULT_K = 32.0
+DEFAULT_RD = 350.0  # Glicko rating deviation of an unrated wrestler
+MIN_RD = 30.0
+DEFAULT_RD_GROWTH = 35.0  # how far RD drifts back up per rating period
+
+_Q = math.log(10) / 400
+
+
+class RatingEngine(abc.ABC):
+    """Shared bookkeeping for the rating engines; subclasses implement update()."""
+
+    def __init__(self, wrestlers: Sequence[Wrestler], initial: float) -> None:
+        self.wrestlers: List[Wrestler] = list(wrestlers)
+        self.index: Dict[Wrestler, int] = {
+            wrestler: i for i, wrestler in enumerate(self.wrestlers)
+        }
+        self.ratings = array("d", [initial]) * len(self.wrestlers)
+        self.games = array("L", [0]) * len(self.wrestlers)
+
+    @classmethod
+    def for_roster(cls, roster: "Roster", **options: float) -> "RatingEngine":
+        """
+        Creates an engine covering every wrestler in a roster.
+
+        Args:
+            roster (Roster): Ratings are keyed by position in ``roster.roster``.
+            **options: Passed through to the engine, e.g. ``k=24``.
+        """
+        return cls(roster.roster, **options)
+
+    def position(self, wrestler: Wrestler) -> int:
+        """Returns the rating slot of a wrestler."""
+        try:
+            return self.index[wrestler]
+        except KeyError:
+            raise ValueError(
+                f"Wrestler '{wrestler.name}' is not tracked by this rating engine. "
+                f"Create the engine from the roster the tournament was drawn from."
+            ) from None
+
+    @abc.abstractmethod
+    def update(self, winner: int, loser: int) -> None:
+        """Applies one result given as the winner's and loser's positions."""
+
+    def record_match(
+        self, player1: Wrestler, player2: Wrestler, winner: Wrestler
+    ) -> None:
+        """
+        Applies one Tournament.match result.
+
+        Args:
+            player1 (Wrestler): The first wrestler.
+            player2 (Wrestler): The second wrestler.
+            winner (Wrestler): The wrestler returned by Tournament.match.
+        """
+        loser = player2 if winner is player1 else player1
+        self.update(self.position(winner), self.position(loser))
+
+    def consume(self, results: Iterable[Tuple[int, int]]) -> int:
+        """
+        Applies a stream of (winner, loser) roster positions as they arrive.
+
+        Args:
+            results: Any iterable, e.g. a generator fed by a batch engine.
+
+        Returns:
+            int: The number of results applied.
+        """
+        update = self.update
+        applied = 0
+        for winner, loser in results:
+            update(winner, loser)
+            applied += 1
+        return applied
+
+    def replay(self, winners: Iterable[int], losers: Iterable[int]) -> int:
+        """
+        Applies historical results given as parallel columns of positions.
+
+        Returns:
+            int: The number of results applied.
+        """
+        return self.consume(zip(winners, losers))
+
+    def rating(self, wrestler: Wrestler) -> float:
+        """Returns a wrestler's current rating."""
+        return self.ratings[self.position(wrestler)]
+
+    def leaderboard(self, top: Optional[int] = None) -> List[Tuple[Wrestler, float]]:
+        """
+        Returns wrestlers ordered by rating, best first.
+
+        Args:
+            top (int): Optional number of entries; only those are sorted.
+        """
+        ratings = self.ratings
+        count = len(ratings) if top is None else top
+        best = heapq.nlargest(count, range(len(ratings)), key=ratings.__getitem__)
+        return [(self.wrestlers[i], ratings[i]) for i in best]
+
+    def power_ranking(self, top: Optional[int] = None) -> List[Wrestler]:
+        """Returns wrestlers ordered by rating, replacing get_overall_rating ordering."""
+        return [wrestler for wrestler, _ in self.leaderboard(top)]
+
+
+class EloRatings(RatingEngine):
+    def __init__(
+        self,
+        wrestlers: Sequence[Wrestler],
+        k: float = DEFAULT_K,
+        initial: float = DEFAULT_RATING,
+    ) -> None:
+        super().__init__(wrestlers, initial)
+        self.k = k
+
+    def expected(self, first: int, second: int) -> float:
+        """Returns the Elo expectation that ``first`` beats ``second``."""
+        return 1 / (1 + 10 ** ((self.ratings[second] - self.ratings[first]) / 400))
+
+    def update(self, winner: int, loser: int) -> None:
+        ratings = self.ratings
+        change = self.k / (1 + 10 ** ((ratings[winner] - ratings[loser]) / 400))
+        ratings[winner] += change
+        ratings[loser] -= change
+        self.games[winner] += 1
+        self.games[loser] += 1
+
+    def consume(self, results: Iterable[Tuple[int, int]]) -> int:
+        # Same as update(), inlined with locals so bulk replays avoid call overhead
+        ratings, games, k = self.ratings, self.games, self.k
+        applied = 0
+        for winner, loser in results:
+            change = k / (1 + 10 ** ((ratings[winner] - ratings[loser]) / 400))
+            ratings[winner] += change
+            ratings[loser] -= change
+            games[winner] += 1
+            games[loser] += 1
+            applied += 1
+        return applied
+
+
+class GlickoRatings(RatingEngine):
+    """Glicko-1 ratings updated after every match rather than per rating period."""
+
+    def __init__(
+        self,
+        wrestlers: Sequence[Wrestler],
+        initial: float = DEFAULT_RATING,
+        rd: float = DEFAULT_RD,
+        rd_growth: float = DEFAULT_RD_GROWTH,
+    ) -> None:
+        super().__init__(wrestlers, initial)
+        self.max_rd = rd
+        self.rd_growth = rd_growth
+        self.rd = array("d", [rd]) * len(self.wrestlers)
+
+    def new_period(self) -> None:
+        """Grows every rating deviation, e.g. between events of a season."""
+        growth = self.rd_growth**2
+        max_rd = self.max_rd
+        rd = self.rd
+        for i in range(len(rd)):
+            rd[i] = min(math.sqrt(rd[i] ** 2 + growth), max_rd)
+
+    def update(self, winner: int, loser: int) -> None:
+        ratings, rd = self.ratings, self.rd
+        r_w, r_l = ratings[winner], ratings[loser]
+        rd_w, rd_l = rd[winner], rd[loser]
+        ratings[winner], rd[winner] = _glicko_step(r_w, rd_w, r_l, rd_l, 1.0)
+        ratings[loser], rd[loser] = _glicko_step(r_l, rd_l, r_w, rd_w, 0.0)
+        self.games[winner] += 1
+        self.games[loser] += 1
+
+    def conservative(self, wrestler: Wrestler) -> float:
+        """Returns rating minus two deviations, a cautious estimate of strength."""
+        i = self.position(wrestler)
+        return self.ratings[i] - 2 * self.rd[i]
+
+
+def _glicko_step(
+    rating: float, rd: float, opp_rating: float, opp_rd: float, score: float
+) -> Tuple[float, float]:
+    g = 1 / math.sqrt(1 + 3 * (_Q * opp_rd) ** 2 / math.pi**2)
+    expected = 1 / (1 + 10 ** (-g * (rating - opp_rating) / 400))
+    d_squared_inv = _Q**2 * g**2 * expected * (1 - expected)
+    precision = 1 / rd**2 + d_squared_inv
+    rating += _Q / precision * g * (score - expected)
+    return rating, max(math.sqrt(1 / precision), MIN_RD)
@@ -8,10 +8,15 @@ handles creation, loading, saving, and manipulation of wrestler rosters.
 import random
 import pickle
 import os
-from typing import List, Union, Optional
+from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, Union, Optional
 from .wrestler import Wrestler
 from ..utils.file_utils import load_wrestler_names
+from ..utils.validation import RECORD_FIELDS, validate_records
 from ..constants import VALID_GENDERS, PICKLE_EXTENSION
+from ..schema import SCHEMA
+
+if TYPE_CHECKING:
+    from .shared_roster import SharedRoster
 
 
 class Roster:
@@ -49,17 +54,7 @@ class Roster:
         names = load_wrestler_names(gender)
 
         name = random.choice(names)
-        strength = random.randint(40, 100)
-        speed = random.randint(30, 100)
-        agility = random.randint(10, 100)
-        health = random.randint(80, 200)
-        power = random.randint(50, 100)
-        grapple = random.randint(1, 20)
-        stamina = random.randint(30, 100)
-
-        new = Wrestler(
-            name, gender, strength, speed, agility, health, power, grapple, stamina
-        )
+        new = Wrestler(name, gender, *SCHEMA.random_values())
         return new
 
     def manualCreate(self, sex: Optional[str] = None) -> Wrestler:
@@ -92,83 +87,19 @@ class Roster:
 
         name = input("enter the wrestler's name:").strip()
 
-        while True:
-            try:
-                strength = int(input("enter the wrestler's strength(min:40,max:100):"))
-                if strength < 40 or strength > 100:
-                    raise ValueError
-                break
-            except ValueError:
-                print(
-                    "❌ Invalid strength! Please enter a number between 40-100 (e.g., 70 or 85)."
-                )
-        while True:
-            try:
-                speed = int(input("enter the wrestler's speed(min:30,max:100):"))
-                if speed < 30 or speed > 100:
-                    raise ValueError
-                break
-            except ValueError:
-                print(
-                    "❌ Invalid speed! Please enter a number between 30-100 (e.g., 65 or 80)."
-                )
-        while True:
-            try:
-                agility = int(input("enter the wrestler's agility(min:10,max:100):"))
-                if agility < 10 or agility > 100:
-                    raise ValueError
-                break
-            except ValueError:
-                print(
-                    "❌ Invalid agility! Please enter a number between 10-100 (e.g., 50 or 75)."
-                )
-
-        while True:
-            try:
-                health = int(input("enter the wrestler's health(min:80,max:200):"))
-                if health < 80 or health > 200:
-                    raise ValueError
-                break
-            except ValueError:
-                print(
-                    "❌ Invalid health! Please enter a number between 80-200 (e.g., 120 or 160)."
-                )
-
-        while True:
-            try:
-                power = int(input("enter the wrestler's power(min:50,max:100):"))
-                if power < 50 or power > 100:
-                    raise ValueError
-                break
-            except ValueError:
-                print(
-                    "❌ Invalid power! Please enter a number between 50-100 (e.g., 75 or 90)."
-                )
-
-        while True:
-            try:
-                grapple = int(input("enter the wrestler's grapple(min:1,max:20):"))
-                if grapple < 1 or grapple > 20:
-                    raise ValueError
-                break
-            except ValueError:
-                print(
-                    "❌ Invalid grapple! Please enter a number between 1-20 (e.g., 10 or 15)."
-                )
-        while True:
-            try:
-                stamina = int(input("enter the wrestler's stamina(min:30,max:100):"))
-                if stamina < 30 or stamina > 100:
-                    raise ValueError
-                break
-            except ValueError:
-                print(
-                    "❌ Invalid stamina! Please enter a number between 30-100 (e.g., 60 or 80)."
-                )
+        values = []
+        for field in SCHEMA.fields:
+            while True:
+                try:
+                    value = int(input(field.prompt()))
+                    if value < field.low or value > field.high:
+                        raise ValueError
+                    break
+                except ValueError:
+                    print(field.input_error())
+            values.append(value)
 
-        new = Wrestler(
-            name, sex, strength, speed, agility, health, power, grapple, stamina
-        )
+        new = Wrestler(name, sex, *values)
         return new
 
     def fillRoster(self) -> None:
@@ -325,6 +256,21 @@ class Roster:
         with open(filename, "rb") as f:
             self.roster = pickle.load(f)
 
+    def to_shared_memory(self, name: Optional[str] = None) -> "SharedRoster":
+        """
+        Exports the roster into a shared memory block for worker processes.
+
+        Args:
+            name (str): Optional name for the block; one is generated if omitted.
+
+        Returns:
+            SharedRoster: The owning handle. Workers attach with
+            SharedRoster.attach(handle.name) and receive only wrestler indices.
+        """
+        from .shared_roster import SharedRoster
+
+        return SharedRoster.create(self.roster, name)
+
     @staticmethod
     def list_available_rosters() -> list[tuple[str, int]]:
         """
@@ -370,10 +316,44 @@ class Roster:
         Returns:
             Roster object
         """
-        roster = cls(auto_fill=False)
+        records = []
         for name in names:
             # We'll assume Wrestler can take 'type' as a stat if relevant
-            strength = random.randint(40, 100)
-            speed = random.randint(30, 100)
-            agility = random.randint(10, 100)
-            health = random.randint
+            values = SCHEMA.random_values()
+            sex = gender.lower()
+            if sex not in VALID_GENDERS:
+                # "Mixed" rosters draw each wrestler's gender individually
+                sex = random.choice(["male", "female"])
+            records.append(
+                {"name": name, "gender": sex, **dict(zip(SCHEMA.names, values))}
+            )
+        return cls.from_records(records)
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[Mapping[str, Any]], validate: bool = True
+    ) -> "Roster":
+        """
+        Create a Roster from wrestler records, e.g. rows of an imported dataset.
+
+        Every record is validated in one pass before any wrestler is built, so
+        a bad dataset is reported in full rather than one error at a time.
+
+        Args:
+            records: Dicts with a name, gender and every stat; extra keys are ignored
+            validate: False skips the check for records already validated
+
+        Returns:
+            Roster object
+
+        Raises:
+            ValueError: Listing every invalid or missing value
+        """
+        records = list(records)
+        if validate:
+            validate_records(records).raise_if_invalid()
+        roster = cls(auto_fill=False)
+        roster.roster = [
+            Wrestler(*[record[field] for field in RECORD_FIELDS]) for record in records
+        ]
+        return roster
@@ -0,0 +1,377 @@
+"""
+Themed roster builder for the wrestling simulator.
+
+This module contains the wrestler types (stat ranges for a powerhouse, a
+speedster and so on), the themed rosters shipped with the simulator, and
+functions that build them from the bundled name files through the real
+Roster/Wrestler path. build_all() draws every roster's records on a worker
+pool, validates them all in one pass and then writes the files, so a bad
+range never leaves half the rosters rewritten.
+
+Each roster draws from its own random stream, seeded from the base seed and
+its position in the list, so the output is the same for any worker count.
+"""
+
+import os
+import pickle
+import random
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .roster import Roster
+from ..constants import PICKLE_EXTENSION, VALID_GENDERS
+from ..schema import SCHEMA
+from ..utils.file_utils import AtomicFile, load_wrestler_names
+from ..utils.validation import validate_records
+
+ROSTERS_DIR = "rosters"
+MIXED = "mixed"  # a roster of male and female wrestlers, drawn per wrestler
+GENDER_CHOICES = (*VALID_GENDERS, MIXED)
+
+# Stat ranges by wrestler type; stats not listed use SHARED_RANGES
+WRESTLER_TYPES: Dict[str, Dict[str, Tuple[int, int]]] = {
+    "balanced": {
+        "strength": (60, 90),
+        "power": (60, 90),
+        "speed": (50, 80),
+        "agility": (60, 90),
+    },
+    "powerhouse": {
+        "strength": (80, 100),
+        "power": (80, 100),
+        "speed": (30, 60),
+        "agility": (50, 80),
+    },
+    "speedster": {
+        "strength": (50, 80),
+        "power": (50, 80),
+        "speed": (80, 100),
+        "agility": (70, 95),
+    },
+    "technician": {
+        "strength": (60, 85),
+        "power": (60, 85),
+        "speed": (60, 85),
+        "agility": (80, 100),
+    },
+    "veteran": {
+        "strength": (70, 95),
+        "power": (70, 95),
+        "speed": (40, 70),
+        "agility": (75, 95),
+    },
+    "rookie": {
+        "strength": (50, 75),
+        "power": (50, 75),
+        "speed": (50, 80),
+        "agility": (40, 70),
+    },
+}
+SHARED_RANGES = {"health": (120, 180), "stamina": (60, 100), "grapple": (5, 20)}
+
+
+class ThemedRoster(NamedTuple):
+    filename: str
+    description: str
+    pools: Tuple[str, ...]  # name files drawn from, joined in this order
+    start: int  # first name taken from the joined pools
+    size: int  # wrestlers in the roster
+    gender: str  # a VALID_GENDERS entry or MIXED
+    wrestler_type: str
+
+
+THEMED_ROSTERS = (
+    ThemedRoster(
+        "legendary_males.pickle",
+        "Legendary Male Wrestlers",
+        ("male",),
+        0,
+        8,
+        "male",
+        "veteran",
+    ),
+    ThemedRoster(
+        "legendary_females.pickle",
+        "Legendary Female Wrestlers",
+        ("female",),
+        0,
+        8,
+        "female",
+        "veteran",
+    ),
+    ThemedRoster(
+        "modern_males.pickle",
+        "Modern Male Wrestlers",
+        ("male",),
+        4,
+        6,
+        "male",
+        "balanced",
+    ),
+    ThemedRoster(
+        "modern_females.pickle",
+        "Modern Female Wrestlers",
+        ("female",),
+        4,
+        6,
+        "female",
+        "balanced",
+    ),
+    ThemedRoster(
+        "powerhouse_division.pickle",
+        "Powerhouse Division",
+        ("male",),
+        0,
+        4,
+        "male",
+        "powerhouse",
+    ),
+    ThemedRoster(
+        "speed_demons.pickle",
+        "Speed Demons",
+        ("female",),
+        0,
+        4,
+        "female",
+        "speedster",
+    ),
+    ThemedRoster(
+        "technical_masters.pickle",
+        "Technical Masters",
+        ("male", "female"),
+        0,
+        6,
+        MIXED,
+        "technician",
+    ),
+    ThemedRoster(
+        "rookie_class.pickle",
+        "Rookie Class",
+        ("male", "female"),
+        6,
+        8,
+        MIXED,
+        "rookie",
+    ),
+    ThemedRoster(
+        "mixed_legends.pickle",
+        "Mixed Legends",
+        ("male", "female"),
+        0,
+        12,
+        MIXED,
+        "veteran",
+    ),
+    ThemedRoster(
+        "indie_stars.pickle",
+        "Independent Stars",
+        ("other",),
+        0,
+        6,
+        MIXED,
+        "balanced",
+    ),
+    ThemedRoster(
+        "championship_roster_large.pickle",
+        "Championship Roster",
+        ("male", "female"),
+        0,
+        16,
+        MIXED,
+        "balanced",
+    ),
+    ThemedRoster(
+        "womens_division.pickle",
+        "Women's Division",
+        ("female",),
+        0,
+        10,
+        "female",
+        "balanced",
+    ),
+    ThemedRoster(
+        "hall_of_fame.pickle",
+        "Hall of Fame",
+        ("male", "female"),
+        0,
+        20,
+        MIXED,
+        "veteran",
+    ),
+    ThemedRoster(
+        "tag_teams.pickle",
+        "Tag Team Specialists",
+        ("male",),
+        0,
+        4,
+        "male",
+        "balanced",
+    ),
+    ThemedRoster(
+        "rising_stars.pickle",
+        "Rising Stars",
+        ("male", "female"),
+        10,
+        8,
+        MIXED,
+        "rookie",
+    ),
+)
+
+
+def type_ranges(wrestler_type: str) -> Dict[str, Tuple[int, int]]:
+    """Returns the stat ranges of a wrestler type, e.g. "powerhouse"."""
+    ranges = WRESTLER_TYPES.get(wrestler_type.lower())
+    if ranges is None:
+        raise ValueError(
+            f"Unknown wrestler type '{wrestler_type}'. Valid types are: "
+            f"{', '.join(WRESTLER_TYPES)}."
+        )
+    return {**SHARED_RANGES, **ranges}
+
+
+def build_records(
+    names: Sequence[str],
+    gender: str,
+    wrestler_type: str = "balanced",
+    seed: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Draws a wrestler record per name with the stat ranges of a type.
+
+    Args:
+        names (list): The wrestlers' names.
+        gender (str): "male", "female", "other", or "mixed" to pick male or
+            female for each wrestler.
+        wrestler_type (str): A WRESTLER_TYPES key.
+        seed (int): Seeds a private random stream; None uses the global one.
+    """
+    gender = gender.lower()
+    if gender not in GENDER_CHOICES:
+        raise ValueError(
+            f"Invalid gender: '{gender}'. Use one of {', '.join(GENDER_CHOICES)}."
+        )
+    ranges = type_ranges(wrestler_type)
+    if seed is not None:
+        state = random.getstate()
+        random.seed(seed)
+    try:
+        return [
+            SCHEMA.random_record(
+                name,
+                random.choice(("male", "female")) if gender == MIXED else gender,
+                **ranges,
+            )
+            for name in names
+        ]
+    finally:
+        if seed is not None:
+            random.setstate(state)
+
+
+def theme_names(theme: ThemedRoster) -> List[str]:
+    """Returns the names a themed roster takes from the bundled name files."""
+    pool: List[str] = []
+    for gender in theme.pools:
+        pool.extend(load_wrestler_names(gender))
+    return pool[theme.start : theme.start + theme.size]
+
+
+def _build_theme(
+    task: Tuple[ThemedRoster, List[str], Optional[int]],
+) -> List[Dict[str, Any]]:
+    theme, names, seed = task
+    return build_records(names, theme.gender, theme.wrestler_type, seed)
+
+
+def write_roster(roster: Roster, path: str) -> None:
+    """Writes a roster pickle atomically: a temporary file, then a rename."""
+    with AtomicFile(path) as f:
+        pickle.dump(roster.roster, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def build_all(
+    directory: str = ROSTERS_DIR,
+    themes: Sequence[ThemedRoster] = THEMED_ROSTERS,
+    workers: int = 1,
+    seed: Optional[int] = None,
+) -> List[Tuple[ThemedRoster, Roster]]:
+    """
+    Builds every themed roster and writes it to ``directory``.
+
+    Args:
+        directory (str): Where the roster files go; created if missing.
+        themes (list): The rosters to build.
+        workers (int): Processes to draw the rosters on; 1 runs in-process.
+        seed (int): Base seed; roster k uses seed + k. None draws a fresh
+            base seed.
+
+    Returns:
+        list: (theme, roster) for every roster written, in theme order.
+
+    Raises:
+        ValueError: If any record is invalid; no file is written then.
+    """
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError(
+            f"Invalid worker count: {workers}. Use 1 to run in-process "
+            f"or a higher number for a process pool."
+        )
+    if seed is None:
+        seed = random.randrange(2**32)
+    tasks = [(theme, theme_names(theme), seed + k) for k, theme in enumerate(themes)]
+    if workers > 1 and len(tasks) > 1:
+        from multiprocessing import Pool  # only needed for parallel builds
+
+        with Pool(min(workers, len(tasks))) as pool:
+            drawn = pool.map(_build_theme, tasks)
+    else:
+        drawn = [_build_theme(task) for task in tasks]
+    # One validation pass over every record before any file is touched
+    validate_records(
+        [record for records in drawn for record in records]
+    ).raise_if_invalid()
+    built = [
+        (theme, Roster.from_records(records, validate=False))
+        for theme, records in zip(themes, drawn)
+    ]
+    os.makedirs(directory, exist_ok=True)
+    for theme, roster in built:
+        write_roster(roster, os.path.join(directory, theme.filename))
+    return built
+
+
+def build_custom(
+    names: Sequence[str],
+    output: str,
+    wrestler_type: str = "balanced",
+    count: int = 8,
+    gender: str = MIXED,
+    directory: str = ROSTERS_DIR,
+    seed: Optional[int] = None,
+) -> Tuple[str, Roster]:
+    """
+    Builds one roster from a list of names, e.g. read from a user's file.
+
+    Args:
+        names (list): Candidate names; the first ``count`` are used.
+        output (str): Roster name; PICKLE_EXTENSION is added if missing.
+        wrestler_type (str): A WRESTLER_TYPES key.
+        count (int): Number of wrestlers.
+        gender (str): "male", "female", "other" or "mixed".
+        directory (str): Where the roster file goes; created if missing.
+        seed (int): Optional seed for a reproducible roster.
+
+    Returns:
+        tuple: The path written and the roster.
+    """
+    if not isinstance(count, int) or count < 1:
+        raise ValueError(f"Invalid count: {count}. It must be a positive integer.")
+    roster = Roster.from_records(
+        build_records(names[:count], gender, wrestler_type, seed)
+    )
+    if not output.endswith(PICKLE_EXTENSION):
+        output += PICKLE_EXTENSION
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, output)
+    write_roster(roster, path)
+    return path, roster
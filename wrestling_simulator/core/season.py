@@ -0,0 +1,283 @@
+"""
+Season simulator for the wrestling simulator.
+
+This module contains the Season class which runs a schedule of weekly
+tournaments drawn from one Roster. Health and stamina carry over from week
+to week: Tournament.match never restores them, and between events each
+wrestler only recovers part of what they lost, so a wrestler who went deep
+one week may be too hurt to enter the next.
+
+Only per-wrestler aggregates are kept (in ``array`` columns), so memory stays
+constant however many events are played. The season can be checkpointed to
+disk every few weeks and resumed after an interruption.
+"""
+
+import pickle
+import random
+from array import array
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional
+
+from .commentary import silenced
+from .ratings import EloRatings, RatingEngine
+from .roster import Roster
+from .tournament import Tournament
+from .wrestler import Wrestler
+from ..constants import DEFAULT_STAMINA_LEVEL
+from ..utils.file_utils import AtomicFile
+
+if TYPE_CHECKING:
+    from ..storage.export import ResultsExporter
+    from ..storage.results_store import ResultsStore
+
+DEFAULT_RECOVERY = 0.5  # share of lost health and stamina regained between events
+DEFAULT_MIN_HEALTH_SHARE = 0.25  # wrestlers below this share of max_health sit out
+CHECKPOINT_VERSION = 1
+
+
+class EventSummary(NamedTuple):
+    week: int
+    champion: Wrestler
+    matches: int
+    decisions: int
+    resting: int  # wrestlers too hurt to be drawn this week
+
+
+class Season:
+    def __init__(
+        self,
+        roster: Roster,
+        weeks: int,
+        event_size: int = 8,
+        recovery: float = DEFAULT_RECOVERY,
+        min_health_share: float = DEFAULT_MIN_HEALTH_SHARE,
+        ratings: Optional[RatingEngine] = None,
+        results_store: Optional["ResultsStore"] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = 10,
+        exporter: Optional["ResultsExporter"] = None,
+    ) -> None:
+        """
+        Sets up a season; nothing is played until run() or play_week().
+
+        Args:
+            roster (Roster): Every wrestler who can be drawn into an event.
+            weeks (int): Number of weekly events.
+            event_size (int): Entrants per event, at least 4.
+            recovery (float): Share of lost health and stamina regained
+                between events.
+            min_health_share (float): Wrestlers under this share of their
+                max_health rest for the week instead of being drawn.
+            ratings (RatingEngine): Updated after every match; Elo by default.
+            results_store (ResultsStore): Optional store for every match.
+            checkpoint_path (str): Where to write checkpoints; None disables them.
+            checkpoint_every (int): Weeks between checkpoints.
+            exporter (ResultsExporter): Optional export of every match, one
+                tournament number per week.
+        """
+        if not isinstance(weeks, int) or weeks < 1:
+            raise ValueError(f"Invalid number of weeks: {weeks}. Try 52.")
+        if not 4 <= event_size <= len(roster.roster):
+            raise ValueError(
+                f"Invalid event size: {event_size}. It must be between 4 and the "
+                f"roster size ({len(roster.roster)})."
+            )
+        if not 0.0 <= recovery <= 1.0:
+            raise ValueError(
+                f"Invalid recovery: {recovery}. It must be between 0 and 1. "
+                f"Try {DEFAULT_RECOVERY}."
+            )
+        if not isinstance(checkpoint_every, int) or checkpoint_every < 1:
+            raise ValueError(
+                f"Invalid checkpoint_every: {checkpoint_every}. It must be a "
+                f"positive number of weeks."
+            )
+        self.roster = roster
+        self.weeks = weeks
+        self.event_size = event_size
+        self.recovery = recovery
+        self.min_health_share = min_health_share
+        self.ratings = ratings if ratings is not None else EloRatings(roster.roster)
+        self.results_store = results_store
+        self.exporter = exporter
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.week = 0  # events played so far
+        count = len(roster.roster)
+        self.index: Dict[Wrestler, int] = {
+            wrestler: i for i, wrestler in enumerate(roster.roster)
+        }
+        self.events = array("L", [0]) * count
+        self.titles = array("L", [0]) * count
+        self.wins = array("L", [0]) * count
+        self.losses = array("L", [0]) * count
+        self.match_turns: Dict[int, int] = {}  # bounded by the turn cap
+        self.decisions = 0
+
+    def available(self) -> List[Wrestler]:
+        """
+        Returns the wrestlers fit to compete this week. If too few are fit, the
+        healthiest of the rest are added so an event can always be held.
+        """
+        share = self.min_health_share
+        fit = [w for w in self.roster.roster if w.health >= share * w.max_health]
+        if len(fit) >= self.event_size:
+            return fit
+        resting = sorted(
+            (w for w in self.roster.roster if w.health < share * w.max_health),
+            key=lambda w: -w.health / w.max_health,
+        )
+        return fit + resting[: self.event_size - len(fit)]
+
+    def play_week(self) -> EventSummary:
+        """Plays the next weekly event and applies recovery afterwards."""
+        if self.week >= self.weeks:
+            raise ValueError(f"The season is over: all {self.weeks} weeks are played.")
+        field = Roster()
+        field.roster = self.available()
+        tournament = Tournament(
+            field,
+            self.event_size,
+            results_store=self.results_store,
+            ratings=self.ratings,
+            paced=False,
+            exporter=self.exporter,
+        )
+        with silenced():
+            tournament.tournamentPlay()
+        self.week += 1
+        summary = self._record(tournament, len(self.roster.roster) - len(field.roster))
+        self.recover()
+        if self.checkpoint_path is not None and (
+            self.week % self.checkpoint_every == 0 or self.week == self.weeks
+        ):
+            self.checkpoint(self.checkpoint_path)
+        return summary
+
+    def _record(self, tournament: Tournament, resting: int) -> EventSummary:
+        index, bracket = self.index, tournament.bracket
+        for wrestler in bracket.seeds:
+            self.events[index[wrestler]] += 1
+        # Every decided node below the leaves is one match or one bye
+        for node in range(1, bracket.size):
+            winner = bracket.wrestler_at(node)
+            first, second = bracket.contestants(node)
+            if first is None or second is None or winner is None:
+                continue
+            loser = second if winner is first else first
+            self.wins[index[winner]] += 1
+            self.losses[index[loser]] += 1
+        champion = bracket.champion
+        self.titles[index[champion]] += 1  # type: ignore[index]
+        for turns, count in tournament.match_turns.items():
+            self.match_turns[turns] = self.match_turns.get(turns, 0) + count
+        self.decisions += tournament.decisions
+        return EventSummary(
+            self.week,
+            champion,  # type: ignore[arg-type]
+            sum(tournament.match_turns.values()),
+            tournament.decisions,
+            resting,
+        )
+
+    def recover(self) -> None:
+        """Gives every wrestler back part of their lost health and stamina."""
+        recovery = self.recovery
+        for wrestler in self.roster.roster:
+            wrestler.health += int((wrestler.max_health - wrestler.health) * recovery)
+            wrestler.stamina_level += int(
+                (DEFAULT_STAMINA_LEVEL - wrestler.stamina_level) * recovery
+            )
+            wrestler.is_defeated = False
+
+    def run(self, on_event: Optional[Callable[[EventSummary], None]] = None) -> None:
+        """
+        Plays every remaining week.
+
+        Args:
+            on_event (callable): Called with each week's EventSummary as it
+                finishes, e.g. to stream results to a log.
+        """
+        while self.week < self.weeks:
+            summary = self.play_week()
+            if on_event is not None:
+                on_event(summary)
+
+    def standings(self, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Returns the season table ordered by titles, then wins, then rating.
+
+        Args:
+            top (int): Optional number of rows.
+        """
+        index = self.index
+        order = sorted(
+            self.roster.roster,
+            key=lambda w: (
+                -self.titles[index[w]],
+                -self.wins[index[w]],
+                -self.ratings.rating(w),
+            ),
+        )
+        if top is not None:
+            order = order[:top]
+        return [
+            {
+                "wrestler": wrestler,
+                "events": self.events[index[wrestler]],
+                "titles": self.titles[index[wrestler]],
+                "wins": self.wins[index[wrestler]],
+                "losses": self.losses[index[wrestler]],
+                "rating": self.ratings.rating(wrestler),
+            }
+            for wrestler in order
+        ]
+
+    def checkpoint(self, path: str) -> None:
+        """
+        Saves the season so it can be resumed, including every wrestler's
+        current health, the ratings and the random number generator state.
+
+        The file is written next to ``path`` first and then moved into place,
+        so an interruption never leaves a half-written checkpoint.
+        """
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "season": {
+                key: value
+                for key, value in self.__dict__.items()
+                if key not in ("results_store", "exporter")
+            },
+            "random_state": random.getstate(),
+        }
+        with AtomicFile(path) as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def resume(
+        cls,
+        path: str,
+        results_store: Optional["ResultsStore"] = None,
+        exporter: Optional["ResultsExporter"] = None,
+    ) -> "Season":
+        """
+        Loads a season saved by checkpoint() and restores the random state, so
+        the rest of the season plays out as it would have without the break.
+
+        Args:
+            path (str): The checkpoint file.
+            results_store (ResultsStore): Reattached for the remaining weeks;
+                matches played after the last checkpoint are recorded again.
+            exporter (ResultsExporter): Reattached for the remaining weeks.
+        """
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if not isinstance(state, dict) or state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"'{path}' is not a season checkpoint this version can read."
+            )
+        season = cls.__new__(cls)
+        season.__dict__.update(state["season"])
+        season.results_store = results_store
+        season.exporter = exporter
+        random.setstate(state["random_state"])
+        return season
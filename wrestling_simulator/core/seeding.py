@@ -0,0 +1,198 @@
+"""
+Seeding optimizer for the wrestling simulator.
+
+This module contains the SeedingOptimizer class which searches first-round
+bracket layouts with simulated annealing. Each step swaps two entrants and
+rescores the layout incrementally: only the bracket nodes on the two changed
+paths are recomputed with merge_halves, and a rejected swap restores the
+saved nodes instead of recomputing them, so thousands of layouts can be
+scored per second.
+
+Objectives (all maximized):
+    final_rating         expected combined overall rating of the two finalists
+    first_round_balance  minus the summed gap from an even contest, |p - 0.5|,
+                         over the first-round matches
+"""
+
+import math
+import random
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from .bracket import BYE, Bracket
+from .odds import merge_halves, rating_matrix
+
+OBJECTIVES = ("final_rating", "first_round_balance")
+DEFAULT_STEPS = 20000
+COOLING_RANGE = 1000.0  # start temperature / end temperature
+
+
+class SeedingOptimizer:
+    def __init__(
+        self,
+        bracket: Bracket,
+        matrix: Optional[Sequence[Sequence[float]]] = None,
+        objective: str = "final_rating",
+    ) -> None:
+        """
+        Prepares a search starting from an existing bracket's layout.
+
+        Args:
+            bracket (Bracket): The starting layout; its byes stay in place.
+            matrix: Win probabilities indexed by seed. Defaults to the rating
+                surrogate from odds.rating_matrix.
+            objective (str): One of OBJECTIVES.
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(
+                f"Invalid objective: {objective!r}. "
+                f"Choose from: {', '.join(OBJECTIVES)}."
+            )
+        self.bracket = bracket
+        self.objective = objective
+        self.matrix = matrix if matrix is not None else rating_matrix(bracket.seeds)
+        self.ratings = [wrestler.get_overall_rating() for wrestler in bracket.seeds]
+        self.size = bracket.size
+        self.leaves = array("i", bracket.tree[bracket.size :])
+        self.evaluated = 0  # layouts scored so far
+        # final_rating needs every node below the final; the balance objective
+        # only looks at first-round pairs and keeps no node state
+        self._top = 2 if objective == "final_rating" else self.size
+        self._dist: List["array[float]"] = [array("d")] * (2 * self.size)
+        for node in range(2 * self.size - 1, self._top - 1, -1):
+            self._dist[node] = self._node(node)
+        self.score = self._score()
+        self.best_score = self.score  # best layout scored; anneal() updates it
+
+    def _node(self, node: int) -> "array[float]":
+        size, leaves = self.size, self.leaves
+        if node >= size:
+            return array("d", [0.0 if leaves[node - size] == BYE else 1.0])
+        left, right = self._dist[2 * node], self._dist[2 * node + 1]
+        start = node * 2 * len(left) - size
+        middle = start + len(left)
+        return merge_halves(
+            left,
+            leaves[start:middle],
+            right,
+            leaves[middle : middle + len(right)],
+            self.matrix,
+        )
+
+    def _pair_cost(self, pair: int) -> float:
+        first, second = self.leaves[2 * pair], self.leaves[2 * pair + 1]
+        if first == BYE or second == BYE:
+            return 0.0
+        return abs(self.matrix[first][second] - 0.5)
+
+    def _score(self) -> float:
+        if self.objective == "first_round_balance":
+            return -sum(self._pair_cost(pair) for pair in range(self.size // 2))
+        ratings, leaves = self.ratings, self.leaves
+        half = self.size // 2
+        score = 0.0
+        for offset, dist in ((0, self._dist[2]), (half, self._dist[3])):
+            for k, p in enumerate(dist):
+                if p > 0.0:
+                    score += p * ratings[leaves[offset + k]]
+        return score
+
+    def swap(self, first: int, second: int) -> Dict[int, "array[float]"]:
+        """
+        Swaps the entrants in two first-round slots and rescores the layout.
+
+        Returns:
+            dict: The replaced node states, for undo().
+        """
+        leaves = self.leaves
+        saved: Dict[int, "array[float]"] = {}
+        if self.objective == "first_round_balance":
+            pairs = {first // 2, second // 2}
+            before = sum(self._pair_cost(pair) for pair in pairs)
+            leaves[first], leaves[second] = leaves[second], leaves[first]
+            self.score += before - sum(self._pair_cost(pair) for pair in pairs)
+        else:
+            leaves[first], leaves[second] = leaves[second], leaves[first]
+            nodes = set()
+            node_a, node_b = (self.size + first) // 2, (self.size + second) // 2
+            while node_a >= self._top:
+                nodes.add(node_a)
+                nodes.add(node_b)
+                node_a //= 2
+                node_b //= 2
+            # Children have larger indices, so descending order is bottom-up
+            for node in sorted(nodes, reverse=True):
+                saved[node] = self._dist[node]
+                self._dist[node] = self._node(node)
+            self.score = self._score()
+        self.evaluated += 1
+        return saved
+
+    def undo(
+        self,
+        first: int,
+        second: int,
+        saved: Dict[int, "array[float]"],
+        score: float,
+    ) -> None:
+        """Reverts a swap() without recomputing anything."""
+        leaves = self.leaves
+        leaves[first], leaves[second] = leaves[second], leaves[first]
+        for node, dist in saved.items():
+            self._dist[node] = dist
+        self.score = score
+
+    def anneal(
+        self,
+        steps: int = DEFAULT_STEPS,
+        start_temperature: Optional[float] = None,
+        end_temperature: Optional[float] = None,
+    ) -> Bracket:
+        """
+        Runs simulated annealing and returns the best bracket found.
+
+        Args:
+            steps (int): Number of swaps to try.
+            start_temperature (float): Initial temperature; by default the mean
+                score change of a few random swaps, so early moves are mostly
+                accepted.
+            end_temperature (float): Final temperature; by default
+                start_temperature / COOLING_RANGE.
+
+        Returns:
+            Bracket: A new bracket with the best layout; the seeds are unchanged.
+        """
+        slots = [slot for slot in range(self.size) if self.leaves[slot] != BYE]
+        if len(slots) < 2 or steps < 1:
+            self.best_score = self.score
+            return Bracket.from_layout(self.bracket.seeds, self.leaves)
+        if start_temperature is None:
+            start_temperature = self._typical_change(slots)
+        if end_temperature is None:
+            end_temperature = start_temperature / COOLING_RANGE
+        cooling = (end_temperature / start_temperature) ** (1 / steps)
+        temperature = start_temperature
+        best_score, best_leaves = self.score, array("i", self.leaves)
+        for _ in range(steps):
+            first, second = random.sample(slots, 2)
+            score = self.score
+            saved = self.swap(first, second)
+            change = self.score - score
+            if change < 0 and random.random() >= math.exp(change / temperature):
+                self.undo(first, second, saved, score)
+            elif self.score > best_score:
+                best_score, best_leaves = self.score, array("i", self.leaves)
+            temperature *= cooling
+        self.best_score = best_score
+        return Bracket.from_layout(self.bracket.seeds, best_leaves)
+
+    def _typical_change(self, slots: List[int], samples: int = 50) -> float:
+        total = 0.0
+        for _ in range(samples):
+            first, second = random.sample(slots, 2)
+            score = self.score
+            saved = self.swap(first, second)
+            total += abs(self.score - score)
+            self.undo(first, second, saved, score)
+        # A flat landscape still needs a positive temperature
+        return total / samples or 1e-9
@@ -0,0 +1,246 @@
+"""
+Shared-memory rosters for the wrestling simulator.
+
+This module contains the SharedRoster class which packs a roster's stats and
+names into a single ``multiprocessing.shared_memory`` block. Worker processes
+attach to the block by name and read it without copying, so tasks only need
+to ship wrestler indices instead of pickled Wrestler objects.
+
+Block layout, in native byte order (the block is only shared between
+processes on one host)::
+
+    header    magic b"WSR1", wrestler count (uint32), name bytes (uint32), pad
+    offsets   uint32[count + 1]   start of each name in the names table
+    stats     SCHEMA.typecode[count] per stat in STAT_COLUMNS order
+    genders   uint8[count]        index into VALID_GENDERS
+    names     utf-8 names table
+"""
+
+import struct
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, List, Optional, cast
+
+from .wrestler import Wrestler
+from ..constants import VALID_GENDERS
+from ..schema import SCHEMA
+
+# The stats a fresh Wrestler is built from; max_health is passed as health.
+STAT_COLUMNS = SCHEMA.attributes
+_STAT_CODE = SCHEMA.typecode  # int16 for the default ranges
+_STAT_SIZE = SCHEMA.itemsize
+
+_MAGIC = b"WSR1"
+_HEADER = struct.Struct("=4sII4x")
+
+
+def _int_view(view: memoryview, typecode: str) -> "memoryview[int]":
+    # memoryview.cast is only typed for literal formats; stat typecodes are
+    # always integer codes
+    return cast("memoryview[int]", cast(Any, view).cast(typecode))
+
+
+class SharedRoster:
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        magic, count, names_size = _HEADER.unpack_from(shm.buf, 0)
+        if magic != _MAGIC:
+            raise ValueError(
+                f"Shared memory block '{shm.name}' does not hold a roster. "
+                f"Create one with SharedRoster.create()."
+            )
+        self._shm = shm
+        self.owner = owner
+        self.count = int(count)
+        offset = _HEADER.size
+        self._offsets = shm.buf[offset : offset + 4 * (count + 1)].cast("I")
+        offset += 4 * (count + 1)
+        self._columns: Dict[str, "memoryview[int]"] = {}
+        for stat in STAT_COLUMNS:
+            self._columns[stat] = _int_view(
+                shm.buf[offset : offset + _STAT_SIZE * count], _STAT_CODE
+            )
+            offset += _STAT_SIZE * count
+        self._genders = shm.buf[offset : offset + count]
+        offset += count
+        self._names = shm.buf[offset : offset + names_size]
+
+    @classmethod
+    def create(
+        cls, wrestlers: Iterable[Wrestler], name: Optional[str] = None
+    ) -> "SharedRoster":
+        """
+        Packs wrestlers into a new shared memory block.
+
+        Args:
+            wrestlers: The wrestlers to export, usually ``roster.roster``.
+            name (str): Optional name for the block; one is generated if omitted.
+
+        Returns:
+            SharedRoster: The owning handle. Call unlink() when every worker is done.
+        """
+        wrestlers = list(wrestlers)
+        count = len(wrestlers)
+        encoded = [wrestler.name.encode("utf-8") for wrestler in wrestlers]
+        names_size = sum(len(raw) for raw in encoded)
+        size = (
+            _HEADER.size
+            + 4 * (count + 1)
+            + (_STAT_SIZE * len(STAT_COLUMNS) + 1) * count
+        )
+        size += names_size
+
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+        buf = shm.buf
+        _HEADER.pack_into(buf, 0, _MAGIC, count, names_size)
+        offset = _HEADER.size
+        offsets = buf[offset : offset + 4 * (count + 1)].cast("I")
+        position = 0
+        for i, raw in enumerate(encoded):
+            offsets[i] = position
+            position += len(raw)
+        offsets[count] = position
+        offsets.release()
+        offset += 4 * (count + 1)
+        for stat in STAT_COLUMNS:
+            column = _int_view(buf[offset : offset + _STAT_SIZE * count], _STAT_CODE)
+            for i, wrestler in enumerate(wrestlers):
+                column[i] = getattr(wrestler, stat)
+            column.release()
+            offset += _STAT_SIZE * count
+        for i, wrestler in enumerate(wrestlers):
+            buf[offset + i] = VALID_GENDERS.index(wrestler.gender)
+        offset += count
+        buf[offset : offset + names_size] = b"".join(encoded)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedRoster":
+        """
+        Attaches to a roster block created by another process.
+
+        Args:
+            name (str): The block name, taken from the owner's ``name`` attribute.
+
+        Returns:
+            SharedRoster: A read-only handle; call close() when finished.
+        """
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def __len__(self) -> int:
+        return self.count
+
+    def column(self, stat: str) -> "memoryview[int]":
+        """
+        Returns one stat for every wrestler as a zero-copy integer view.
+
+        Args:
+            stat (str): One of STAT_COLUMNS.
+        """
+        if stat not in self._columns:
+            raise ValueError(
+                f"Unknown stat column '{stat}'. Valid columns are: "
+                f"{', '.join(STAT_COLUMNS)}."
+            )
+        return self._columns[stat]
+
+    def name_of(self, index: int) -> str:
+        """Returns the name of the wrestler at ``index``."""
+        self._check_index(index)
+        return str(
+            self._names[self._offsets[index] : self._offsets[index + 1]], "utf-8"
+        )
+
+    def gender_of(self, index: int) -> str:
+        """Returns the gender of the wrestler at ``index``."""
+        self._check_index(index)
+        return VALID_GENDERS[self._genders[index]]
+
+    def wrestler(self, index: int) -> Wrestler:
+        """
+        Builds a fresh, full-health Wrestler from the shared columns.
+
+        Args:
+            index (int): Position of the wrestler in the exported roster.
+
+        Returns:
+            Wrestler: A new object; changes to it are not written back.
+        """
+        self._check_index(index)
+        columns = self._columns
+        return Wrestler(
+            self.name_of(index),
+            self.gender_of(index),
+            columns["strength"][index],
+            columns["speed"][index],
+            columns["agility"][index],
+            columns["max_health"][index],
+            columns["power"][index],
+            columns["grapple"][index],
+            columns["stamina"][index],
+        )
+
+    def wrestlers(self, indices: Optional[Iterable[int]] = None) -> List[Wrestler]:
+        """Builds fresh wrestlers for ``indices``, or for the whole roster."""
+        if indices is None:
+            indices = range(self.count)
+        return [self.wrestler(index) for index in indices]
+
+    def _check_index(self, index: int) -> None:
+        if not 0 <= index < self.count:
+            raise IndexError(
+                f"Invalid wrestler index: {index}. "
+                f"The shared roster has {self.count} wrestler(s)."
+            )
+
+    def close(self) -> None:
+        """Releases this process's views and detaches from the block."""
+        views = [self._offsets, self._genders, self._names]
+        views.extend(self._columns.values())
+        for view in views:
+            view.release()
+        self._columns = {}
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroys the block. Only the creating process should call this."""
+        if not self.owner:
+            raise RuntimeError(
+                f"Only the process that created '{self.name}' may unlink it. "
+                f"Workers should call close() instead."
+            )
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedRoster":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+        if self.owner:
+            self.unlink()
+
+
+_worker_roster: Optional[SharedRoster] = None
+
+
+def init_worker(name: str) -> None:
+    """
+    Pool initializer that attaches the worker process to a shared roster.
+
+    Example:
+        Pool(4, initializer=init_worker, initargs=(shared.name,))
+    """
+    global _worker_roster
+    _worker_roster = SharedRoster.attach(name)
+
+
+def worker_roster() -> SharedRoster:
+    """Returns the roster attached by init_worker() in this worker process."""
+    if _worker_roster is None:
+        raise RuntimeError(
+            "No shared roster is attached in this process. "
+            "Pass init_worker as the pool initializer."
+        )
+    return _worker_roster
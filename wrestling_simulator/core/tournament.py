@@ -5,22 +5,85 @@ This module contains the Tournament class which handles tournament creation,
 match simulation, and winner determination.
 """
 
+import pickle
 import random
 import time
-from typing import List, Tuple, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+from .bracket import Bracket, Pairing, Slot, pair_slots
 from .roster import Roster
+from .seeding import DEFAULT_STEPS, SeedingOptimizer
 from .wrestler import Wrestler
+from .commentary import COMMENTARY, say
+from .match import MatchResult, play_match, tiebreak
+from .metrics import summarize_turns
+from ..constants import MAX_MATCH_TURNS, STALL_WINDOW
+from ..utils.file_utils import AtomicFile
 from ..utils.validation import validate_tournament_size
 
+if TYPE_CHECKING:
+    from .ratings import RatingEngine
+    from ..storage.export import ResultsExporter
+    from ..storage.results_store import ResultsStore
+
+CHECKPOINT_VERSION = 1
+
 
 class Tournament:
-    def __init__(self, roster: Roster, participants: int) -> None:
+    def __init__(
+        self,
+        roster: Roster,
+        participants: int,
+        max_turns: int = MAX_MATCH_TURNS,
+        stall_window: int = STALL_WINDOW,
+        results_store: Optional["ResultsStore"] = None,
+        ratings: Optional["RatingEngine"] = None,
+        paced: bool = True,
+        seeded: bool = True,
+        exporter: Optional["ResultsExporter"] = None,
+        seed: Optional[int] = None,
+    ) -> None:
         self.participants = participants
         validate_tournament_size(participants)
+        if participants > len(roster.roster):
+            raise ValueError(
+                f"Cannot draw {participants} participants from a roster of "
+                f"{len(roster.roster)} wrestlers."
+            )
+        if not isinstance(max_turns, int) or max_turns < 2:
+            raise ValueError(
+                f"Invalid max_turns: {max_turns}. A match needs at least 2 turns "
+                f"so both wrestlers can act. Try {MAX_MATCH_TURNS}."
+            )
+        if not isinstance(stall_window, int) or stall_window < 1:
+            raise ValueError(
+                f"Invalid stall_window: {stall_window}. It must be a positive "
+                f"number of exchanges. Try {STALL_WINDOW}."
+            )
+        self.max_turns = max_turns
+        self.paced = paced  # False skips every delay, for headless runs
+        self.stall_window = stall_window
+        self.match_turns: Dict[int, int] = {}  # match length -> number of matches
+        self.decisions = 0  # matches settled by tiebreak instead of a pinfall
+        self.results_store = results_store
+        self.ratings = ratings
+        if seed is None and results_store is not None:
+            # Stored results keep the seed they were played with, so draw one
+            seed = random.randrange(2**32)
+        if seed is not None:
+            random.seed(seed)
+        self.seed = seed  # replays the draw and every match when set
+        self.tournament_id: Optional[int] = None
+        if results_store is not None:
+            self.tournament_id = results_store.start_tournament(participants, seed=seed)
+        self.exporter = exporter
+        self.export_id = 0 if exporter is None else exporter.start_tournament()
         self.roster = roster
         self.wrestlers: List[Wrestler] = []
         self.tournamentRoster()
-        self.tournamentPool = self.createTournamentPool(self.wrestlers)
+        # A random draw shuffles a copy, self.wrestlers keeps the selection order
+        draw = self.wrestlers if seeded else random.sample(self.wrestlers, participants)
+        self.bracket = Bracket(draw, seeded=seeded)
+        self.tournamentPool = self.bracket.pairings(1)
         self.round = 1
 
     def tournamentRoster(self) -> None:
@@ -38,28 +101,44 @@ class Tournament:
                 playing_roster.append(player)
         self.wrestlers = playing_roster
 
-    def createTournamentPool(
-        self, pool: List[Wrestler]
-    ) -> List[Tuple[Wrestler, Wrestler]]:
+    def createTournamentPool(self, pool: Sequence[Slot]) -> List[Pairing]:
         """pools the tournament participants
-        Args:
-            pool(list): a list containing wrestlers that are in the tournament
-        Returns:
-                main_pool(list): a list containing tuples of the competitors and their opponents
+        Neighbouring bracket slots meet each other, so the winners of one round,
+        kept in bracket order, give the pairings for the next.
+            Args:
+                pool(list): the wrestlers in bracket order, None marks a bye
+            Returns:
+                    main_pool(list): a list containing tuples of the competitors and their opponents
+        """
+        return pair_slots(pool)
+
+    def optimize_seeding(
+        self, objective: str = "final_rating", steps: int = DEFAULT_STEPS
+    ) -> float:
+        """Replaces the seeded draw with an optimized bracket layout
+        Searches first-round layouts with simulated annealing, scoring each one with
+        exact bracket odds from the rating surrogate. Only allowed before round 1.
+            Args:
+                objective(str): "final_rating" or "first_round_balance", see core.seeding
+                steps(int): the number of layouts to try
+            Returns:
+                    score(float): the objective value of the chosen layout
         """
-        random.shuffle(pool)  # Shuffle the pool for random pairings
-        wrestler_count = int(len(pool) / 2)
-        pool1 = pool[:wrestler_count]
-        pool2 = pool[wrestler_count:]
-        main_pool = []
-        for i in range(len(pool1)):
-            main_pool.append((pool1[i], pool2[i]))
-        return main_pool
+        decided = self.bracket.tree[1 : self.bracket.size]
+        if self.round != 1 or any(node >= 0 for node in decided):
+            raise ValueError(
+                "Seeding can only be optimized before the first round is played."
+            )
+        optimizer = SeedingOptimizer(self.bracket, objective=objective)
+        self.bracket = optimizer.anneal(steps)
+        self.tournamentPool = self.bracket.pairings(1)
+        return optimizer.best_score
 
     def match(self, player1: Wrestler, player2: Wrestler) -> Wrestler:
         """creates the match simulation for the wrestlers
         they will start using their assortment of actions to try and encapacitate and defeat
-        their opponent
+        their opponent. A match that reaches max_turns, or goes stall_window exchanges
+        without either wrestler losing health, is settled by tiebreak().
             Args:
                 player1(object): the first wrestler
                 player2(object): the second wrestlers
@@ -67,53 +146,229 @@ class Tournament:
                     winner(object): returns the winner of the fight
 
         """
-        state = True
-        print(f"It's {player1.name} vs {player2.name}!!!")
-        time.sleep(2)  # Give user time to see the match announcement
-        player1.reset()
-        player2.reset()
-        while state:
-            player1.chooseAction(player2)
-            time.sleep(1.5)  # Delay after each action to let user read it
-            if player2.is_defeated:
-                state = False
-                time.sleep(2)  # Delay after match ends to see winner
-                return player1
-            player2.chooseAction(player1)
-            time.sleep(1.5)  # Delay after each action to let user read it
-            if player1.is_defeated:
-                state = False
-                time.sleep(2)  # Delay after match ends to see winner
-                return player2
-            player1.staminaRegen()
-            player2.staminaRegen()
-            player1.healthRegen()
-            player2.healthRegen()
-
-        # This should never be reached due to the logic above, but mypy needs a return
-        raise RuntimeError("Match ended without a winner")
+        say(f"It's {player1.name} vs {player2.name}!!!")
+        self._pause(2)  # Give user time to see the match announcement
+        result = play_match(
+            player1,
+            player2,
+            max_turns=self.max_turns,
+            stall_window=self.stall_window,
+            pause=self._pause,
+        )
+        if result.decision:
+            self.decisions += 1
+        self._record_result(player1, player2, result)
+        return result.winner
+
+    @staticmethod
+    def tiebreak(player1: Wrestler, player2: Wrestler) -> Wrestler:
+        """Decides a match that hit the turn cap or stalled
+        The wrestler with the larger share of their max_health left wins. Equal shares
+        go to the higher overall rating, and a complete tie goes to player1.
+            Args:
+                player1(object): the first wrestler
+                player2(object): the second wrestler
+            Returns:
+                    winner(object): the winner of the decision, the loser is marked defeated
+        """
+        return tiebreak(player1, player2)
+
+    def _pause(self, seconds: float) -> None:
+        if self.paced:
+            COMMENTARY.flush()  # a buffered sink shows the action before the wait
+            time.sleep(seconds)
+
+    def _record_result(
+        self, player1: Wrestler, player2: Wrestler, result: MatchResult
+    ) -> None:
+        winner, turns = result.winner, result.turns
+        self.match_turns[turns] = self.match_turns.get(turns, 0) + 1
+        if self.ratings is not None:
+            self.ratings.record_match(player1, player2, winner)
+        if self.results_store is not None:
+            self.results_store.record_match(
+                player1.name,
+                player2.name,
+                winner.name,
+                turns,
+                seed=self.seed,
+                tournament_id=self.tournament_id,
+                round=self.round,
+            )
+        if self.exporter is not None:
+            self.exporter.record(
+                player1, player2, result, tournament=self.export_id, round=self.round
+            )
+
+    def match_length_stats(self) -> Dict[str, float]:
+        """Summarizes how long this tournament's matches have lasted
+        Returns:
+                stats(dict): count, mean, p50, p99 and max match length in turns,
+                plus the number of matches settled by decision
+        """
+        stats = summarize_turns(self.match_turns)
+        stats["decisions"] = self.decisions
+        return stats
 
     def Round(self) -> None:
-        print(f"------ Round {self.round} ------")
-        time.sleep(1.5)  # Give user time to see round announcement
-        winners = []
-        for fighter1, fighter2 in self.tournamentPool:
+        say(f"------ Round {self.round} ------")
+        self._pause(1.5)  # Give user time to see round announcement
+        self._record_bracket()
+        nodes = self.bracket.round_nodes(self.round)
+        for node, (fighter1, fighter2) in zip(nodes, self.tournamentPool):
+            if fighter1 is None or fighter2 is None:
+                winner = fighter2 if fighter1 is None else fighter1
+                say(f"{winner.name} advances with a bye!")  # type: ignore[union-attr]
+                self.bracket.record_winner(node, winner)  # type: ignore[arg-type]
+                continue
             winner = self.match(fighter1, fighter2)
-            winners.append(winner)
-            print()  # Add blank line between matches for clarity
-            time.sleep(1)  # Brief pause between matches in the same round
+            self.bracket.record_winner(node, winner)
+            say()  # Add blank line between matches for clarity
+            self._pause(1)  # Brief pause between matches in the same round
         self.round += 1
-        if len(winners) > 1:
-            self.tournamentPool = self.createTournamentPool(
-                winners
-            )  # Create new pairings for next round
+        if self.round <= self.bracket.rounds:
+            # Create new pairings for next round
+            self.tournamentPool = self.bracket.pairings(self.round)
         if len(self.tournamentPool) == 1:
-            grand_champ = self.match(
-                self.tournamentPool[0][0], self.tournamentPool[0][1]
-            )
-            print(f"\n***** The Tournament Winner is:{grand_champ.name} *****")
-            time.sleep(3)  # Give user time to see the tournament winner
+            self._record_bracket()
+            finalist1, finalist2 = self.tournamentPool[0]
+            grand_champ = self.match(finalist1, finalist2)  # type: ignore[arg-type]
+            self.bracket.record_winner(1, grand_champ)
+            say(f"\n***** The Tournament Winner is:{grand_champ.name} *****")
+            if self.results_store is not None and self.tournament_id is not None:
+                self.results_store.finish_tournament(
+                    self.tournament_id, grand_champ.name
+                )
+            self._pause(3)  # Give user time to see the tournament winner
+
+    def _record_bracket(self) -> None:
+        if self.results_store is None or self.tournament_id is None:
+            return
+        self.results_store.record_bracket(
+            self.tournament_id,
+            self.round,
+            [
+                None if wrestler is None else wrestler.name
+                for pair in self.tournamentPool
+                for wrestler in pair
+            ],
+        )
 
-    def tournamentPlay(self) -> None:
+    def tournamentPlay(self, checkpoint_path: Optional[str] = None) -> None:
+        """Plays every remaining round
+        Args:
+            checkpoint_path(str): if given, a checkpoint is written there after each round
+        """
         while len(self.tournamentPool) > 1:
             self.Round()
+            if checkpoint_path is not None:
+                self.checkpoint(checkpoint_path)
+
+    def checkpoint(self, path: str) -> None:
+        """Saves the tournament between rounds so it can be resumed later
+        The file holds the bracket tree, the round, every entrant's roster
+        position, stats and current health and stamina, the match statistics and
+        the random number generator state. It is written to a temporary file first
+        and then moved into place, so an interruption never leaves a half-written
+        checkpoint.
+            Args:
+                path(str): the file to write
+        """
+        # Positions, not names, since a roster can hold two wrestlers of one name
+        positions = {id(wrestler): i for i, wrestler in enumerate(self.roster.roster)}
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "participants": self.participants,
+            "max_turns": self.max_turns,
+            "stall_window": self.stall_window,
+            "paced": self.paced,
+            "round": self.round,
+            "bracket": self.bracket.to_bytes(),
+            "wrestlers": [
+                tuple(getattr(wrestler, stat) for stat in Wrestler.statList)
+                for wrestler in self.bracket.seeds
+            ],
+            "positions": [positions[id(wrestler)] for wrestler in self.bracket.seeds],
+            "match_turns": self.match_turns,
+            "decisions": self.decisions,
+            "tournament_id": self.tournament_id,
+            "seed": self.seed,
+            "export_id": self.export_id,
+            "random_state": random.getstate(),
+        }
+        with AtomicFile(path) as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _roster_wrestler(roster: Roster, position: int, name: str) -> Wrestler:
+        if position < len(roster.roster) and roster.roster[position].name == name:
+            return roster.roster[position]
+        raise ValueError(
+            f"The roster has no '{name}' at position {position}. Resume with the "
+            f"roster the tournament was drawn from, or without a roster."
+        )
+
+    @classmethod
+    def resume(
+        cls,
+        path: str,
+        roster: Optional[Roster] = None,
+        results_store: Optional["ResultsStore"] = None,
+        ratings: Optional["RatingEngine"] = None,
+        exporter: Optional["ResultsExporter"] = None,
+    ) -> "Tournament":
+        """Loads a tournament saved by checkpoint() and restores the random state
+        Calling tournamentPlay() on the result finishes the tournament exactly as
+        the uninterrupted run would have.
+            Args:
+                path(str): the checkpoint file
+                roster(object): the roster the tournament was drawn from; the wrestlers
+                    at the saved positions get the saved state and take part, so rating
+                    engines keyed on them keep working. Without it, new Wrestler
+                    objects are created.
+                results_store(object): reattached for the remaining rounds
+                ratings(object): reattached for the remaining rounds
+                exporter(object): reattached for the remaining rounds
+            Returns:
+                    tournament(object): the tournament, ready to continue
+        """
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if not isinstance(state, dict) or state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"'{path}' is not a tournament checkpoint this version can read."
+            )
+        seeds = []
+        for position, values in zip(state["positions"], state["wrestlers"]):
+            if roster is None:
+                wrestler = Wrestler.__new__(Wrestler)
+            else:
+                wrestler = cls._roster_wrestler(roster, position, values[0])
+            for stat, value in zip(Wrestler.statList, values):
+                setattr(wrestler, stat, value)
+            seeds.append(wrestler)
+        tournament = cls.__new__(cls)
+        tournament.participants = state["participants"]
+        tournament.max_turns = state["max_turns"]
+        tournament.stall_window = state["stall_window"]
+        tournament.paced = state["paced"]
+        tournament.match_turns = state["match_turns"]
+        tournament.decisions = state["decisions"]
+        tournament.results_store = results_store
+        tournament.ratings = ratings
+        tournament.tournament_id = state["tournament_id"]
+        tournament.seed = state.get("seed")
+        tournament.exporter = exporter
+        tournament.export_id = state.get("export_id", 0)
+        if roster is None:
+            roster = Roster()
+            roster.roster = list(seeds)
+        tournament.roster = roster
+        tournament.wrestlers = list(seeds)
+        tournament.bracket = Bracket.from_bytes(state["bracket"], seeds)
+        tournament.round = state["round"]
+        tournament.tournamentPool = tournament.bracket.pairings(
+            min(tournament.round, tournament.bracket.rounds)
+        )
+        random.setstate(state["random_state"])
+        return tournament
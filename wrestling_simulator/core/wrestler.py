@@ -10,26 +10,36 @@ Constants for the wrestling simulator.
 """
 
 import random
+import time
 from typing import Union
 
-from ..constants import (
-    MIN_STRENGTH,
-    MAX_STRENGTH,
-    MIN_SPEED,
-    MAX_SPEED,
-    MIN_AGILITY,
-    MAX_AGILITY,
-    MIN_HEALTH,
-    MAX_HEALTH,
-    MIN_POWER,
-    MAX_POWER,
-    MIN_GRAPPLE,
-    MAX_GRAPPLE,
-    MIN_STAMINA,
-    MAX_STAMINA,
-    VALID_GENDERS,
-    DEFAULT_STAMINA_LEVEL,
+from ..constants import VALID_GENDERS, DEFAULT_STAMINA_LEVEL
+from ..schema import SCHEMA
+from .actions import ACTION_NAMES, choose_action, health_bucket
+from .commentary import say
+from .events import (
+    ATTACK,
+    EVENTS,
+    GRAPPLE_ESCAPE,
+    GRAPPLE_HIT,
+    PIN_KICKOUT,
+    PIN_NONE,
+    PIN_QUICK_KICKOUT,
+    PIN_WIN,
+    PIN_WIN_EARLY,
+    PIN_WIN_QUICK,
+    PIN_WIN_UPSET,
 )
+from .metrics import METRICS
+
+# Attributes with a range in the schema; max_health holds the health stat
+_RANGED = SCHEMA.by_attribute
+_HEALTH = SCHEMA.field("health")
+
+
+def blow_damage(force: int, strength: int) -> float:
+    """Returns the damage a blow of ``force`` does; strength reduces damage."""
+    return force * (1 - strength / 200)
 
 
 class Wrestler:
@@ -72,90 +82,38 @@ class Wrestler:
         self.grapple = grapple  # how well they can grapple
         self.stamina = stamina  # how often they can use different moves
         self.stamina_level = DEFAULT_STAMINA_LEVEL
-        if self.health < MIN_HEALTH or self.health > MAX_HEALTH:
-            raise ValueError(
-                f"Invalid health value: {health}. Health must be between {MIN_HEALTH}-{MAX_HEALTH}. "
-                f"Try a value like {(MIN_HEALTH + MAX_HEALTH) // 2} or {MAX_HEALTH - 20}."
-            )
         self.is_defeated = False
 
     def __setattr__(self, name: str, value: Union[str, int, bool]) -> None:
-        match name:
-            case "name":
-                if not isinstance(value, str):
-                    raise ValueError(
-                        f"Invalid name type: {type(value).__name__}. Name must be a string. "
-                        f"Example: 'The Rock' or 'John Cena'."
-                    )
-            case "gender":
-                if not isinstance(value, str) or value not in self.genders:
-                    raise ValueError(
-                        f"Invalid gender: '{value}'. Gender must be one of {self.genders}. "
-                        f"Please use 'male', 'female', or 'other'."
-                    )
-            case "strength":
-                if (
-                    not isinstance(value, int)
-                    or value < MIN_STRENGTH
-                    or value > MAX_STRENGTH
-                ):
-                    raise ValueError(
-                        f"Invalid strength value: {value}. Strength must be between {MIN_STRENGTH}-{MAX_STRENGTH}. "
-                        f"This determines damage resistance. Try a value like 70 or 85."
-                    )
-            case "speed":
-                if not isinstance(value, int) or value < MIN_SPEED or value > MAX_SPEED:
-                    raise ValueError(
-                        f"Invalid speed value: {value}. Speed must be between {MIN_SPEED}-{MAX_SPEED}. "
-                        f"This affects attack and reaction speed. Try a value like 65 or 80."
-                    )
-            case "agility":
-                if (
-                    not isinstance(value, int)
-                    or value < MIN_AGILITY
-                    or value > MAX_AGILITY
-                ):
-                    raise ValueError(
-                        f"Invalid agility value: {value}. Agility must be between {MIN_AGILITY}-{MAX_AGILITY}. "
-                        f"This helps escape grapples and pins. Try a value like 50 or 75."
-                    )
-            case "health":
-                if not isinstance(value, int):
-                    raise ValueError(
-                        f"Invalid health type: {type(value).__name__}. Health must be an integer. "
-                        f"Try a value between {MIN_HEALTH} and {MAX_HEALTH}, like 120 or 160."
-                    )
-            case "power":
-                if not isinstance(value, int) or value < MIN_POWER or value > MAX_POWER:
-                    raise ValueError(
-                        f"Invalid power value: {value}. Power must be between {MIN_POWER}-{MAX_POWER}. "
-                        f"This determines attack damage. Try a value like 75 or 90."
-                    )
-            case "grapple":
-                if (
-                    not isinstance(value, int)
-                    or value < MIN_GRAPPLE
-                    or value > MAX_GRAPPLE
-                ):
-                    raise ValueError(
-                        f"Invalid grapple value: {value}. Grapple must be between {MIN_GRAPPLE}-{MAX_GRAPPLE}. "
-                        f"This affects grappling success. Try a value like 10 or 15."
-                    )
-            case "stamina":
-                if (
-                    not isinstance(value, int)
-                    or value < MIN_STAMINA
-                    or value > MAX_STAMINA
-                ):
-                    raise ValueError(
-                        f"Invalid stamina value: {value}. Stamina must be between {MIN_STAMINA}-{MAX_STAMINA}. "
-                        f"This controls special move frequency. Try a value like 60 or 80."
-                    )
-            case "is_defeated":
-                if not isinstance(value, bool):
-                    raise ValueError(
-                        f"Invalid is_defeated value: {value}. This can only be True or False."
-                    )
+        field = _RANGED.get(name)
+        if field is not None:
+            if not isinstance(value, int) or value < field.low or value > field.high:
+                raise ValueError(field.error(value))
+        else:
+            match name:
+                case "name":
+                    if not isinstance(value, str):
+                        raise ValueError(
+                            f"Invalid name type: {type(value).__name__}. Name must be a string. "
+                            f"Example: 'The Rock' or 'John Cena'."
+                        )
+                case "gender":
+                    if not isinstance(value, str) or value not in self.genders:
+                        raise ValueError(
+                            f"Invalid gender: '{value}'. Gender must be one of {self.genders}. "
+                            f"Please use 'male', 'female', or 'other'."
+                        )
+                case "health":
+                    if not isinstance(value, int):
+                        raise ValueError(
+                            f"Invalid health type: {type(value).__name__}. Health must be an integer. "
+                            f"Try a value between {_HEALTH.low} and {_HEALTH.high}, like 120 or 160."
+                        )
+                case "is_defeated":
+                    if not isinstance(value, bool):
+                        raise ValueError(
+                            f"Invalid is_defeated value: {value}. This can only be True or False."
+                        )
         if name not in self.statList:
             raise ValueError(
                 f"Cannot set attribute '{name}'. Only these stats can be changed: {', '.join(self.statList)}"
@@ -198,12 +156,10 @@ class Wrestler:
                 f"Try training 'strength', 'speed', 'agility', 'power', 'grapple', or 'stamina' instead."
             )
         current_value = getattr(self, stat)
-        # Example limitation: prevent stats from exceeding a maximum
-        max_value = 100 if stat != "max_health" else 200
-        if stat != "grapple":
-            new_value = min(current_value + amount, max_value)
-        else:
-            new_value = min(current_value + amount, 20)
+        # Stats cannot be trained past the top of their schema range
+        field = _RANGED.get(stat)
+        max_value = field.high if field is not None else DEFAULT_STAMINA_LEVEL
+        new_value = min(current_value + amount, max_value)
         setattr(self, stat, new_value)
 
     def takeDamage(self, damage: Union[int, float]) -> None:
@@ -249,12 +205,14 @@ class Wrestler:
         Returns:
                 None, at the end the opponent's name and the damage they took is displayed
         """
-        damage = self.power * (1 - opponent.strength / 200)  # strength reduces damage
+        damage = blow_damage(self.power, opponent.strength)
         opponent.takeDamage(damage)
         self.stamina_level -= 30
         if self.stamina_level < 0:
             self.stamina_level = 0
-        print(f"{self.name} attacks {opponent.name} for {damage} damage!")
+        say(f"{self.name} attacks {opponent.name} for {damage} damage!")
+        if EVENTS.recorder is not None:
+            EVENTS.recorder.event(ATTACK, self, damage)
 
     def grappleOpponent(self, opponent: "Wrestler") -> None:
         """Used to handle the grapple move used by a wrestler
@@ -268,16 +226,22 @@ class Wrestler:
         chances = [grapple_chance, escape_chance]
         outcome = [True, False]
         calc = random.choices(outcome, chances, k=1)[0]  # Ensure a boolean result
-        print(f"{self.name} attempts to grapple {opponent.name}!")
+        if METRICS.enabled:
+            METRICS.record_grapple(calc)
+        say(f"{self.name} attempts to grapple {opponent.name}!")
         if calc:
-            print(f"{self.name} successfully grapples {opponent.name}!")
-            damage = (self.grapple * 8) * (1 - opponent.strength / 200)
+            say(f"{self.name} successfully grapples {opponent.name}!")
+            damage = blow_damage(self.grapple * 8, opponent.strength)
             opponent.takeDamage(damage)
-            print(f"{opponent.name} takes {damage} damage from the grapple.")
+            say(f"{opponent.name} takes {damage} damage from the grapple.")
             self.stamina_level -= 70
+            if EVENTS.recorder is not None:
+                EVENTS.recorder.event(GRAPPLE_HIT, self, damage)
         else:
-            print(f"{opponent.name} escapes the grapple!")
+            say(f"{opponent.name} escapes the grapple!")
             self.stamina_level -= 45
+            if EVENTS.recorder is not None:
+                EVENTS.recorder.event(GRAPPLE_ESCAPE, self, 0.0)
 
         if self.stamina_level < 0:
             self.stamina_level = 0
@@ -291,75 +255,110 @@ class Wrestler:
                 the match will the end and self will be declared the winner
 
         """
+        if METRICS.enabled:
+            METRICS.record_pin_attempt()
+        outcome = PIN_NONE
         chance = ["self", "opponent"]
         if opponent.health == opponent.max_health:
             possibilities = random.choices(chance, [2, 1], k=3)
             if possibilities.count("self") >= 2:
                 for i in range(1, 4):
-                    print(f"{i}...")
-                print(
+                    say(f"{i}...")
+                say(
                     f"The winner is {self.name}! With a quick pin to end the match quickly"
                 )
                 opponent.defeat()
+                if METRICS.enabled:
+                    METRICS.record_pin_outcome(True)
+                if EVENTS.recorder is not None:
+                    EVENTS.recorder.event(PIN_WIN_EARLY, self, 0.0)
                 return True  # Indicate successful pin
         elif opponent.health <= opponent.max_health // 4:
             possibilities = random.choices(chance, [5, 1], k=3)
             if possibilities.count("self") >= 1:
                 for i in range(1, 4):
-                    print(f"{i}...")
-                print(f"The winner is {self.name}!!!")
+                    say(f"{i}...")
+                say(f"The winner is {self.name}!!!")
                 opponent.defeat()
+                if METRICS.enabled:
+                    METRICS.record_pin_outcome(True)
+                if EVENTS.recorder is not None:
+                    EVENTS.recorder.event(PIN_WIN, self, 0.0)
                 return True  # Indicate successful pin
             elif possibilities.count("opponent") == 3:
                 for i in range(1, 3):
-                    print(f"{i}...")
-                print(f"{opponent.name} kicks out!!")
+                    say(f"{i}...")
+                say(f"{opponent.name} kicks out!!")
+                if METRICS.enabled:
+                    METRICS.record_pin_outcome(False)
+                outcome = PIN_KICKOUT
                 self.stamina_level -= 40
         else:
             if opponent.health >= opponent.max_health // 2:
                 possibilities = random.choices(chance, [2, 1], k=3)
                 if possibilities.count("self") >= 1:
                     for i in range(1, 4):
-                        print(f"{i}...")
-                    print(f"The winner is {self.name}!!!")
+                        say(f"{i}...")
+                    say(f"The winner is {self.name}!!!")
                     opponent.defeat()
+                    if METRICS.enabled:
+                        METRICS.record_pin_outcome(True)
+                    if EVENTS.recorder is not None:
+                        EVENTS.recorder.event(PIN_WIN, self, 0.0)
                     return True  # Indicate successful pin
                 elif possibilities.count("opponent") >= 2:
                     for i in range(1, 3):
-                        print(f"{i}...")
-                    print(f"{opponent.name} kicks out!!")
+                        say(f"{i}...")
+                    say(f"{opponent.name} kicks out!!")
+                    if METRICS.enabled:
+                        METRICS.record_pin_outcome(False)
+                    outcome = PIN_KICKOUT
                     opponent.stamina_level -= 40
 
             elif opponent.health <= opponent.max_health // 3:
                 possibilities = random.choices(chance, [3, 1], k=3)
                 if possibilities.count("self") >= 2:
                     for i in range(1, 4):
-                        print(f"{i}...")
-                    print(
-                        f"The winner is {self.name}!!! In an unlikely turn of events!"
-                    )
+                        say(f"{i}...")
+                    say(f"The winner is {self.name}!!! In an unlikely turn of events!")
                     opponent.defeat()
+                    if METRICS.enabled:
+                        METRICS.record_pin_outcome(True)
+                    if EVENTS.recorder is not None:
+                        EVENTS.recorder.event(PIN_WIN_UPSET, self, 0.0)
                     return True  # Indicate successful pin
                 elif possibilities.count("opponent") >= 3:
                     for i in range(1, 3):
-                        print(f"{i}...")
-                    print(f"{opponent.name} kicks out!!")
+                        say(f"{i}...")
+                    say(f"{opponent.name} kicks out!!")
+                    if METRICS.enabled:
+                        METRICS.record_pin_outcome(False)
+                    outcome = PIN_KICKOUT
                     self.stamina_level -= 40
 
             else:
                 possibilities = random.choices(chance, k=3)
                 if possibilities.count("self") >= 1:
                     for i in range(1, 4):
-                        print(f"{i}...")
-                    print(f"{self.name} wins with a quick pin!!!")
+                        say(f"{i}...")
+                    say(f"{self.name} wins with a quick pin!!!")
                     opponent.defeat()
+                    if METRICS.enabled:
+                        METRICS.record_pin_outcome(True)
+                    if EVENTS.recorder is not None:
+                        EVENTS.recorder.event(PIN_WIN_QUICK, self, 0.0)
                     return True  # Indicate successful pin
                 else:
-                    print(f"1...")
-                    print(f"{opponent.name} quickly kicks out")
+                    say("1...")
+                    say(f"{opponent.name} quickly kicks out")
+                    if METRICS.enabled:
+                        METRICS.record_pin_outcome(False)
+                    outcome = PIN_QUICK_KICKOUT
 
         if self.stamina_level < 0:
             self.stamina_level = 0
+        if EVENTS.recorder is not None:
+            EVENTS.recorder.event(outcome, self, 0.0)
         return False  # Indicate unsuccessful pin
 
     def defeat(self) -> bool:
@@ -370,17 +369,26 @@ class Wrestler:
         self.is_defeated = False
         return self.is_defeated
 
+    def recover(self) -> None:
+        """Restores full health and stamina, ready for an independent bout
+        Args:
+            None
+        Returns:
+            None
+        """
+        self.health = self.max_health
+        self.stamina_level = DEFAULT_STAMINA_LEVEL
+        self.is_defeated = False
+
     def chooseAction(self, opponent: "Wrestler") -> None:
-        func_list = [self.attack, self.grappleOpponent, self.pinOpponent]
-        if opponent.health <= (opponent.max_health // 2):
-            # Opponent is at half health or below - more aggressive tactics
-            weights = [0.4, 0.7, 1.5]
-            ans = random.choices(func_list, weights=weights, k=1)[0]
+        bucket = health_bucket(opponent.health, opponent.max_health)
+        ans = _ACTIONS[choose_action(bucket)]
+        if METRICS.enabled:
+            start = time.perf_counter_ns()
+            ans(self, opponent)
+            METRICS.record_action(ans.__name__, time.perf_counter_ns() - start)
         else:
-            # Opponent is above half health - more conservative tactics
-            weights = [1.9, 1.5, 0.3]
-            ans = random.choices(func_list, weights=weights, k=1)[0]
-        ans(opponent)
+            ans(self, opponent)
 
     @classmethod
     def compare_wrestlers(val, wrestler1: "Wrestler", wrestler2: "Wrestler") -> None:
@@ -411,14 +419,21 @@ class Wrestler:
                         wres2_attrib = highlight(wres2_attrib)
                         wres1_attrib = "    " + str(wres1_attrib)
                     else:
-                        wres1_attrib="    "+str(wres1_attrib)
-                        wres2_attrib="    "+str(wres2_attrib)
-                    print(f"{wres1_attrib}{(((len(wrestler1.name))+1)-len(str(wres1_attrib)))*" "}|{wres2_attrib}{((len(wrestler2.name)+1)-len(str(wres2_attrib)))*" "}",sep="|",end="|\n")
-                    
-        print(f' {"--"*border}')
-        print(f"|  Overall   |  {wrestler1.get_overall_rating()}{(((len(wrestler1.name))+1)-len(str(wres1_attrib)))*" "}|  {wrestler2.get_overall_rating()}{((len(wrestler2.name)-1)-len(str(wrestler2.get_overall_rating())))*" "}",end="|\n")
-                 
-        print(f' {"--"*border}')
+                        wres1_attrib = "    " + str(wres1_attrib)
+                        wres2_attrib = "    " + str(wres2_attrib)
+                    print(
+                        f"{wres1_attrib}{(((len(wrestler1.name)) + 1) - len(str(wres1_attrib))) * ' '}|{wres2_attrib}{((len(wrestler2.name) + 1) - len(str(wres2_attrib))) * ' '}",
+                        sep="|",
+                        end="|\n",
+                    )
+
+        print(f" {'--' * border}")
+        print(
+            f"|  Overall   |  {wrestler1.get_overall_rating()}{(((len(wrestler1.name)) + 1) - len(str(wres1_attrib))) * ' '}|  {wrestler2.get_overall_rating()}{((len(wrestler2.name) - 1) - len(str(wrestler2.get_overall_rating()))) * ' '}",
+            end="|\n",
+        )
+        print(f" {'--' * border}")
+
     def display_stats_table(self) -> None:
         """
         Display this wrestler's stats in a formatted table for the CLI.
@@ -452,15 +467,9 @@ class Wrestler:
         print(f"| {'Overall':<10} | {overall:<6} |")
         print(border)
 
-def highlight(data):
-    return f"\033[47m    {data}   \033[00m"
 
-        print(f" {'--' * border}")
-        print(
-            f"|  Overall   |  {wrestler1.get_overall_rating()}{(((len(wrestler1.name)) + 1) - len(str(wres1_attrib))) * ' '}|  {wrestler2.get_overall_rating()}{((len(wrestler2.name) - 1) - len(str(wrestler2.get_overall_rating()))) * ' '}",
-            end="|\n",
-        )
-        print(f" {'--' * border}")
+# Wrestler methods by action id, for chooseAction
+_ACTIONS = tuple(getattr(Wrestler, name) for name in ACTION_NAMES)
 
 
 def highlight(data: int) -> str:
@@ -4,6 +4,11 @@ Main entry point for the Wrestling Simulator.
 This module provides the command-line interface for the wrestling simulator.
 """
 
+import sys
+
 from .cli.main import main
 
 __all__ = ["main"]
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+Stat schema for the wrestling simulator.
+
+This module contains SCHEMA, the one description of every wrestler stat: its
+range, what it does and a pair of example values. Wrestler attribute checks
+and training caps, roster generation and prompts, the batch validator, the
+shared-memory column layout and the roster scripts all read their ranges
+from it. The ranges themselves come from constants.py, so changing a limit
+there updates every path.
+
+Everything derived from the schema (lookup tables, messages, the column
+typecode) is built once at import, so using it costs a dict lookup.
+"""
+
+import random
+from array import array
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple
+
+from .constants import (
+    MAX_AGILITY,
+    MAX_GRAPPLE,
+    MAX_HEALTH,
+    MAX_POWER,
+    MAX_SPEED,
+    MAX_STAMINA,
+    MAX_STRENGTH,
+    MIN_AGILITY,
+    MIN_GRAPPLE,
+    MIN_HEALTH,
+    MIN_POWER,
+    MIN_SPEED,
+    MIN_STAMINA,
+    MIN_STRENGTH,
+)
+
+# Signed array typecodes from smallest to largest, for the column layout
+_TYPECODES = ("b", "h", "i", "q")
+
+
+class StatField(NamedTuple):
+    name: str  # Wrestler() argument and record key
+    attribute: str  # Wrestler attribute holding the value
+    low: int
+    high: int
+    purpose: str  # completes "This ..." in error messages
+    examples: Tuple[int, int]
+
+    @property
+    def allowed(self) -> str:
+        return f"{self.low}-{self.high}"
+
+    def error(self, value: Any) -> str:
+        """The message for an out-of-range or non-integer value."""
+        return (
+            f"Invalid {self.name} value: {value}. {self.name.capitalize()} must be "
+            f"between {self.low}-{self.high}. This {self.purpose}. "
+            f"Try a value like {self.examples[0]} or {self.examples[1]}."
+        )
+
+    def prompt(self) -> str:
+        """The question asked when a stat is entered by hand."""
+        return f"enter the wrestler's {self.name}(min:{self.low},max:{self.high}):"
+
+    def input_error(self) -> str:
+        """The hint printed after an invalid answer to prompt()."""
+        return (
+            f"❌ Invalid {self.name}! Please enter a number between "
+            f"{self.low}-{self.high} (e.g., {self.examples[0]} or {self.examples[1]})."
+        )
+
+
+class StatSchema:
+    def __init__(self, fields: Sequence[StatField]) -> None:
+        """
+        Args:
+            fields: The stats in Wrestler() argument order.
+        """
+        self.fields = tuple(fields)
+        self.names = tuple(field.name for field in self.fields)
+        self.attributes = tuple(field.attribute for field in self.fields)
+        self.by_name = {field.name: field for field in self.fields}
+        self.by_attribute = {field.attribute: field for field in self.fields}
+        # Smallest signed typecode that holds every range, for binary columns
+        widest = max(max(abs(f.low), abs(f.high)) for f in self.fields)
+        self.typecode = next(
+            code for code in _TYPECODES if widest < 1 << (8 * array(code).itemsize - 1)
+        )
+        self.itemsize = array(self.typecode).itemsize
+
+    def field(self, name: str) -> StatField:
+        """Returns a stat by name or attribute, e.g. "health" or "max_health"."""
+        field = self.by_name.get(name) or self.by_attribute.get(name)
+        if field is None:
+            raise ValueError(
+                f"Unknown stat '{name}'. Valid stats are: {', '.join(self.names)}."
+            )
+        return field
+
+    def random_values(self) -> List[int]:
+        """Draws one value per stat, in field order, with random.randint."""
+        return [random.randint(field.low, field.high) for field in self.fields]
+
+    def random_record(
+        self, name: str, gender: str, **ranges: Tuple[int, int]
+    ) -> Dict[str, Any]:
+        """
+        Draws a random wrestler record.
+
+        Args:
+            name (str): The wrestler's name.
+            gender (str): The wrestler's gender.
+            **ranges: Narrower (low, high) ranges for some stats, e.g.
+                ``strength=(80, 100)`` for a powerhouse.
+
+        Raises:
+            ValueError: If a range is unknown or reaches outside the schema.
+        """
+        for stat, (low, high) in ranges.items():
+            field = self.field(stat)
+            if not field.low <= low <= high <= field.high:
+                raise ValueError(
+                    f"Invalid range for {stat}: {low}-{high}. It must lie within "
+                    f"{field.allowed}."
+                )
+        record: Dict[str, Any] = {"name": name, "gender": gender}
+        for field in self.fields:
+            low, high = ranges.get(field.name, (field.low, field.high))
+            record[field.name] = random.randint(low, high)
+        return record
+
+    def random_columns(self, count: int) -> Dict[str, "array[int]"]:
+        """
+        Draws ``count`` random values per stat as typed arrays, much faster
+        than drawing wrestlers one at a time.
+        """
+        return {
+            field.name: array(
+                self.typecode,
+                random.choices(range(field.low, field.high + 1), k=count),
+            )
+            for field in self.fields
+        }
+
+
+SCHEMA = StatSchema(
+    (
+        StatField(
+            "strength",
+            "strength",
+            MIN_STRENGTH,
+            MAX_STRENGTH,
+            "determines damage resistance",
+            (70, 85),
+        ),
+        StatField(
+            "speed",
+            "speed",
+            MIN_SPEED,
+            MAX_SPEED,
+            "affects attack and reaction speed",
+            (65, 80),
+        ),
+        StatField(
+            "agility",
+            "agility",
+            MIN_AGILITY,
+            MAX_AGILITY,
+            "helps escape grapples and pins",
+            (50, 75),
+        ),
+        StatField(
+            "health",
+            "max_health",
+            MIN_HEALTH,
+            MAX_HEALTH,
+            "sets how much damage they can take",
+            (120, 160),
+        ),
+        StatField(
+            "power",
+            "power",
+            MIN_POWER,
+            MAX_POWER,
+            "determines attack damage",
+            (75, 90),
+        ),
+        StatField(
+            "grapple",
+            "grapple",
+            MIN_GRAPPLE,
+            MAX_GRAPPLE,
+            "affects grappling success",
+            (10, 15),
+        ),
+        StatField(
+            "stamina",
+            "stamina",
+            MIN_STAMINA,
+            MAX_STAMINA,
+            "controls special move frequency",
+            (60, 80),
+        ),
+    )
+)
@@ -0,0 +1,64 @@
+"""
+Storage for the wrestling simulator.
+
+This module contains persistent stores for simulation results, and roster
+file migration and merging. They are imported lazily, the first time each
+name is used.
+"""
+
+from .._lazy import attach
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .results_store import ResultsStore, MatchRecord
+    from .event_log import EventLogWriter, read_matches, replay
+    from .export import (
+        ResultsExporter,
+        CsvExporter,
+        ColumnarExporter,
+        open_exporter,
+        read_columns,
+    )
+    from .migration import migrate_file, migrate_directory, MigrationResult
+    from .merge import merge_rosters, MergeResult, RosterWriter
+
+__all__ = [
+    "ResultsStore",
+    "MatchRecord",
+    "EventLogWriter",
+    "read_matches",
+    "replay",
+    "ResultsExporter",
+    "CsvExporter",
+    "ColumnarExporter",
+    "open_exporter",
+    "read_columns",
+    "migrate_file",
+    "migrate_directory",
+    "MigrationResult",
+    "merge_rosters",
+    "MergeResult",
+    "RosterWriter",
+]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "ResultsStore": ".results_store",
+        "MatchRecord": ".results_store",
+        "EventLogWriter": ".event_log",
+        "read_matches": ".event_log",
+        "replay": ".event_log",
+        "ResultsExporter": ".export",
+        "CsvExporter": ".export",
+        "ColumnarExporter": ".export",
+        "open_exporter": ".export",
+        "read_columns": ".export",
+        "migrate_file": ".migration",
+        "migrate_directory": ".migration",
+        "MigrationResult": ".migration",
+        "merge_rosters": ".merge",
+        "MergeResult": ".merge",
+        "RosterWriter": ".merge",
+    },
+)
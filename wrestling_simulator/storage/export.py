@@ -0,0 +1,309 @@
+"""
+Streaming results export for the wrestling simulator.
+
+This module contains exporters that write one row per match for offline
+analysis: the pairing, both wrestlers' stats at the opening bell, the winner,
+the length of the match and the health each wrestler took off the other.
+Rows are buffered and written every ``chunk_rows`` matches, so memory stays
+flat however long a batch run goes on.
+
+    CsvExporter       CSV text, gzip-compressed when the path ends in ".gz"
+    ColumnarExporter  a compact binary file of typed columns, read back with
+                      read_columns()
+
+Attach an exporter to a Tournament with ``exporter=``, or call record() with
+the MatchResult of any play_match call.
+
+Columnar layout: the magic bytes b"WCOL1", a uint32 header length and a JSON
+header listing the columns and their array typecodes, then chunks:
+
+    uint32 rows, uint32 new names, the new names (uint32 length + utf-8),
+    then each column's values as raw little-endian arrays
+
+Wrestler names are stored once, as ids in order of first appearance.
+"""
+
+import abc
+import csv
+import gzip
+import json
+import struct
+import sys
+from array import array
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from ..core.match import MatchResult
+from ..core.wrestler import Wrestler
+from ..schema import SCHEMA
+
+MAGIC = b"WCOL1"
+DEFAULT_CHUNK_ROWS = 8192  # matches buffered before a write
+
+_NAME_COLUMNS = ("wrestler1", "wrestler2", "winner")
+_STAT_COLUMNS = tuple(
+    f"{side}_{name}" for side in ("wrestler1", "wrestler2") for name in SCHEMA.names
+)
+# Column name and array typecode; "i" and "I" are 4 bytes on every platform
+# this runs on, unlike "l"
+EXPORT_COLUMNS = (
+    ("tournament", "i"),
+    ("round", "i"),
+    ("wrestler1", "I"),
+    ("wrestler2", "I"),
+    *((column, SCHEMA.typecode) for column in _STAT_COLUMNS),
+    ("winner", "I"),
+    ("turns", "i"),
+    ("decision", "b"),
+    ("damage1", "i"),  # health wrestler1 took off wrestler2
+    ("damage2", "i"),
+)
+COLUMN_NAMES = tuple(name for name, _ in EXPORT_COLUMNS)
+_NAME_INDEXES = tuple(COLUMN_NAMES.index(name) for name in _NAME_COLUMNS)
+
+# One match in COLUMN_NAMES order, with wrestlers by name
+Row = Tuple[Any, ...]
+
+_UINT32 = struct.Struct("<I")
+
+
+def _snapshot(wrestler: Wrestler) -> List[int]:
+    # Schema stats do not change during a match, so this is the opening bell
+    return [getattr(wrestler, attribute) for attribute in SCHEMA.attributes]
+
+
+_Exporter = TypeVar("_Exporter", bound="ResultsExporter")
+
+
+class ResultsExporter(abc.ABC):
+    """Shared bookkeeping for the exporters; subclasses implement the writing."""
+
+    def __init__(self, chunk_rows: int) -> None:
+        if not isinstance(chunk_rows, int) or chunk_rows < 1:
+            raise ValueError(
+                f"Invalid chunk_rows: {chunk_rows}. It must be a positive integer. "
+                f"Try {DEFAULT_CHUNK_ROWS}."
+            )
+        self.chunk_rows = chunk_rows
+        self.rows = 0  # matches recorded
+        self.tournaments = 0
+        self._buffered = 0
+
+    def start_tournament(self) -> int:
+        """Returns a new tournament number for the ``tournament`` column."""
+        self.tournaments += 1
+        return self.tournaments
+
+    def record(
+        self,
+        player1: Wrestler,
+        player2: Wrestler,
+        result: MatchResult,
+        tournament: int = 0,
+        round: int = 0,
+    ) -> None:
+        """
+        Buffers one match; the buffer is written every chunk_rows matches.
+
+        Args:
+            player1 (Wrestler): The wrestler who acted first.
+            player2 (Wrestler): The other wrestler.
+            result (MatchResult): What play_match returned.
+            tournament (int): Optional number from start_tournament.
+            round (int): Optional round within the tournament.
+        """
+        first_won = result.winner is player1
+        self._append(
+            (
+                tournament,
+                round,
+                player1.name,
+                player2.name,
+                *_snapshot(player1),
+                *_snapshot(player2),
+                result.winner.name,
+                result.turns,
+                int(result.decision),
+                result.winner_damage if first_won else result.loser_damage,
+                result.loser_damage if first_won else result.winner_damage,
+            )
+        )
+        self.rows += 1
+        self._buffered += 1
+        if self._buffered >= self.chunk_rows:
+            self.flush()
+
+    @abc.abstractmethod
+    def _append(self, row: Row) -> None:
+        """Buffers one match's row."""
+
+    @abc.abstractmethod
+    def flush(self) -> None:
+        """Writes every buffered match."""
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Writes buffered matches and closes the file."""
+
+    def __enter__(self: _Exporter) -> _Exporter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class CsvExporter(ResultsExporter):
+    def __init__(
+        self,
+        path: str,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        compress: Optional[bool] = None,
+        compresslevel: int = 6,
+    ) -> None:
+        """
+        Args:
+            path (str): The file to write; an existing file is replaced.
+            chunk_rows (int): Matches buffered before a write.
+            compress (bool): gzip the output; defaults to whether the path
+                ends in ".gz".
+            compresslevel (int): gzip level from 1 (fast) to 9 (small).
+        """
+        super().__init__(chunk_rows)
+        self.path = path
+        if compress is None:
+            compress = path.endswith(".gz")
+        self._file: IO[str] = (
+            gzip.open(path, "wt", newline="", compresslevel=compresslevel)
+            if compress
+            else open(path, "w", newline="")
+        )
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(COLUMN_NAMES)
+        self._pending: List[Row] = []
+
+    def _append(self, row: Row) -> None:
+        self._pending.append(row)
+
+    def flush(self) -> None:
+        if self._pending:
+            self._writer.writerows(self._pending)
+            self._pending = []
+        self._buffered = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class ColumnarExporter(ResultsExporter):
+    def __init__(self, path: str, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> None:
+        """
+        Args:
+            path (str): The file to write; an existing file is replaced.
+            chunk_rows (int): Matches buffered before a chunk is written.
+        """
+        super().__init__(chunk_rows)
+        self.path = path
+        self._file = open(path, "wb")
+        header = json.dumps({"columns": EXPORT_COLUMNS}).encode("utf-8")
+        self._file.write(MAGIC + _UINT32.pack(len(header)) + header)
+        self._columns = [array(typecode) for _, typecode in EXPORT_COLUMNS]
+        self._ids: Dict[str, int] = {}
+        self._new_names: List[str] = []
+
+    def _name_id(self, name: str) -> int:
+        name_id = self._ids.get(name)
+        if name_id is None:
+            name_id = self._ids[name] = len(self._ids)
+            self._new_names.append(name)
+        return name_id
+
+    def _append(self, row: Row) -> None:
+        values = list(row)
+        for i in _NAME_INDEXES:
+            values[i] = self._name_id(values[i])
+        for column, value in zip(self._columns, values):
+            column.append(value)
+
+    def flush(self) -> None:
+        if not self._buffered:
+            self._file.flush()
+            return
+        out = self._file
+        out.write(_UINT32.pack(self._buffered) + _UINT32.pack(len(self._new_names)))
+        for name in self._new_names:
+            encoded = name.encode("utf-8")
+            out.write(_UINT32.pack(len(encoded)) + encoded)
+        for i, column in enumerate(self._columns):
+            if sys.byteorder == "big":
+                column.byteswap()
+            column.tofile(out)
+            self._columns[i] = array(column.typecode)
+        self._new_names = []
+        self._buffered = 0
+        out.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+def open_exporter(path: str, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> ResultsExporter:
+    """
+    Opens the exporter that suits a file name: ".csv" or ".csv.gz" for CSV,
+    anything else for the columnar format.
+    """
+    if path.endswith((".csv", ".csv.gz")):
+        return CsvExporter(path, chunk_rows)
+    return ColumnarExporter(path, chunk_rows)
+
+
+def iter_chunks(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Reads a columnar export back one chunk at a time, so a long run can be
+    analysed without loading it all.
+
+    Yields:
+        dict: Column name to values for the rows of one chunk. Name columns
+        hold strings, the rest hold typed arrays.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"'{path}' is not a columnar export (bad magic bytes).")
+        (length,) = _UINT32.unpack(f.read(4))
+        columns = [tuple(column) for column in json.loads(f.read(length))["columns"]]
+        names: List[str] = []
+        while True:
+            head = f.read(8)
+            if not head:
+                return
+            if len(head) < 8:
+                raise ValueError(f"Truncated columnar export '{path}'.")
+            rows, new_names = struct.unpack("<II", head)
+            for _ in range(new_names):
+                (size,) = _UINT32.unpack(f.read(4))
+                names.append(f.read(size).decode("utf-8"))
+            chunk: Dict[str, Any] = {}
+            for name, typecode in columns:
+                values = array(typecode)
+                values.fromfile(f, rows)
+                if sys.byteorder == "big":
+                    values.byteswap()
+                chunk[name] = (
+                    [names[i] for i in values] if name in _NAME_COLUMNS else values
+                )
+            yield chunk
+
+
+def read_columns(path: str) -> Dict[str, Any]:
+    """Reads a whole columnar export into one list or array per column."""
+    merged: Dict[str, Any] = {}
+    for chunk in iter_chunks(path):
+        for name, values in chunk.items():
+            if name in merged:
+                merged[name].extend(values)
+            else:
+                merged[name] = values
+    return merged
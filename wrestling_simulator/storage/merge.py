@@ -0,0 +1,141 @@
+"""
+Roster merging for the wrestling simulator.
+
+This module combines many roster files into one, e.g. for an
+interpromotional event. Sources are read one file at a time, in either
+roster file format, and every wrestler is checked against a hash index of
+(name, stats hash) keys, so a wrestler who appears in several rosters with
+the same stats is written once. The merged roster is written as it is
+produced, so only one source file and the index are ever in memory.
+
+The output is an ordinary roster pickle that Roster.load_roster reads. It is
+built by hand: a list opcode, then each wrestler's own pickle followed by an
+append, so no list of every wrestler is needed to write it.
+"""
+
+import pickle
+from typing import Any, Dict, Iterator, NamedTuple, Sequence, Set, Tuple
+
+from ..core.roster import Roster
+from ..core.wrestler import Wrestler
+from ..schema import SCHEMA
+from ..utils.file_utils import AtomicFile
+from .migration import detect_format, to_records
+
+# Wrestlers are pickled separately with protocol 2, which has no frames, so
+# their opcodes can be spliced into one list
+_PROTOCOL = 2
+_HEADER = pickle.PROTO + bytes([_PROTOCOL]) + pickle.EMPTY_LIST
+
+WrestlerKey = Tuple[str, int]
+
+
+class MergeResult(NamedTuple):
+    path: str
+    sources: int
+    read: int  # wrestlers in all the sources
+    written: int
+    duplicates: int  # wrestlers dropped as repeats of one already written
+    conflicts: int  # wrestlers kept under a name already written, other stats
+
+
+def wrestler_key(wrestler: Wrestler) -> WrestlerKey:
+    """The dedup key: the name and a hash of the gender and schema stats."""
+    stats = tuple(getattr(wrestler, attribute) for attribute in SCHEMA.attributes)
+    return wrestler.name, hash((wrestler.gender, stats))
+
+
+def iter_wrestlers(paths: Sequence[str]) -> Iterator[Tuple[str, Wrestler]]:
+    """
+    Yields (path, wrestler) for every wrestler in the roster files, one file
+    at a time. Each file is validated as a whole and its wrestlers rebuilt
+    from their stats, as migrate_file does.
+
+    Raises:
+        ValueError: If a file is not a roster or has invalid records.
+    """
+    for path in paths:
+        with open(path, "rb") as f:
+            try:
+                data = pickle.load(f)
+            except (pickle.UnpicklingError, EOFError) as e:
+                raise ValueError(f"'{path}' is not a roster file: {e}") from e
+        try:
+            records = to_records(data, detect_format(data))
+            wrestlers = Roster.from_records(records).roster
+        except ValueError as e:
+            raise ValueError(f"Roster '{path}': {e}") from e
+        del data, records  # keep only the built wrestlers while yielding
+        for wrestler in wrestlers:
+            yield path, wrestler
+
+
+class RosterWriter:
+    """Writes a roster file one wrestler at a time; the file appears on close."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.count = 0
+        self._file = AtomicFile(path)
+        self._file.write(_HEADER)
+
+    def write(self, wrestler: Wrestler) -> None:
+        # Strip the fragment's protocol header and stop opcode
+        self._file.write(pickle.dumps(wrestler, protocol=_PROTOCOL)[2:-1])
+        self._file.write(pickle.APPEND)
+        self.count += 1
+
+    def close(self) -> None:
+        """Finishes the file and moves it into place."""
+        if not self._file.closed:
+            self._file.write(pickle.STOP)
+            self._file.commit()
+
+    def abort(self) -> None:
+        """Discards the partly written file."""
+        self._file.discard()
+
+    def __enter__(self) -> "RosterWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def merge_rosters(paths: Sequence[str], output: str) -> MergeResult:
+    """
+    Merges roster files into one, dropping repeated wrestlers.
+
+    A wrestler is a repeat when one with the same name and the same stats
+    has already been written. Wrestlers who share a name but not stats are
+    all kept and counted as conflicts. Order is kept: sources in the order
+    given, wrestlers in file order.
+
+    Args:
+        paths (list): The roster files, in either roster file format.
+        output (str): The merged roster file; written atomically, and not
+            at all if a source is invalid.
+
+    Returns:
+        MergeResult: Counts of what was read, written and dropped.
+    """
+    if not paths:
+        raise ValueError("Nothing to merge: give at least one roster file.")
+    index: Set[WrestlerKey] = set()
+    names: Dict[str, int] = {}  # name to stat lines written under it
+    read = duplicates = 0
+    with RosterWriter(output) as writer:
+        for _, wrestler in iter_wrestlers(paths):
+            read += 1
+            key = wrestler_key(wrestler)
+            if key in index:
+                duplicates += 1
+                continue
+            index.add(key)
+            names[wrestler.name] = names.get(wrestler.name, 0) + 1
+            writer.write(wrestler)
+    conflicts = sum(count - 1 for count in names.values())
+    return MergeResult(output, len(paths), read, writer.count, duplicates, conflicts)
@@ -0,0 +1,246 @@
+"""
+Roster file migration for the wrestling simulator.
+
+Roster pickles have been written in two shapes over time: lists of Wrestler
+objects (Roster.save_roster, build-rosters) and lists of wrestler dicts
+(older roster scripts, some with a "technique" stat in place of agility).
+This module detects each file's shape and rewrites it in the canonical one:
+a list of freshly built Wrestler objects pickled with the highest protocol,
+which Roster.load_roster reads directly. Every record in a file is validated
+in one pass first, so a bad file is reported in full and left untouched.
+
+migrate_directory() spreads the files over a worker pool and appends one
+JSON line per file to a progress log as results arrive. A rerun skips every
+file the log shows as migrated and unchanged since, so an interrupted run
+can simply be started again.
+"""
+
+import json
+import os
+import pickle
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from ..constants import PICKLE_EXTENSION
+from ..core.roster import Roster
+from ..core.wrestler import Wrestler
+from ..schema import SCHEMA
+from ..utils.file_utils import write_atomic
+
+FORMAT_WRESTLERS = "wrestlers"  # a list of Wrestler objects, the canonical shape
+FORMAT_RECORDS = "records"  # a list of wrestler dicts
+PROGRESS_LOG = "migration.jsonl"  # default log name inside the directory
+
+# Statuses of a MigrationResult
+MIGRATED = "migrated"  # rewritten in the canonical format
+CURRENT = "current"  # already canonical, nothing written
+SKIPPED = "skipped"  # migrated by an earlier run and unchanged since
+INVALID = "invalid"  # readable, but some records fail validation
+UNREADABLE = "unreadable"  # not a pickle, or not a list of wrestlers
+
+# Record keys written by older scripts, and the stat they stand for now
+LEGACY_KEYS = {"technique": "agility"}
+
+
+class MigrationResult(NamedTuple):
+    path: str
+    format: str  # FORMAT_WRESTLERS, FORMAT_RECORDS, or "" if unreadable
+    status: str
+    wrestlers: int
+    message: str = ""
+
+
+def detect_format(data: Any) -> str:
+    """
+    Returns FORMAT_WRESTLERS or FORMAT_RECORDS for the unpickled contents of
+    a roster file.
+
+    Raises:
+        ValueError: If the data is neither shape, or mixes the two.
+    """
+    if not isinstance(data, list):
+        raise ValueError(f"Expected a list of wrestlers, found {type(data).__name__}.")
+    if all(isinstance(item, Wrestler) for item in data):
+        return FORMAT_WRESTLERS
+    if all(isinstance(item, Mapping) for item in data):
+        return FORMAT_RECORDS
+    kinds = sorted({type(item).__name__ for item in data})
+    raise ValueError(f"Expected a list of wrestlers, found {', '.join(kinds)}.")
+
+
+def _wrestler_record(wrestler: Wrestler) -> Dict[str, Any]:
+    # Only what the wrestler actually has, so a missing stat is reported as
+    # missing; health is the schema's name for max_health
+    state = vars(wrestler)
+    record = {key: state[key] for key in ("name", "gender") if key in state}
+    for field in SCHEMA.fields:
+        if field.attribute in state:
+            record[field.name] = state[field.attribute]
+    return record
+
+
+def _legacy_record(record: Mapping[str, Any]) -> Dict[str, Any]:
+    upgraded = dict(record)
+    for old, new in LEGACY_KEYS.items():
+        if old in upgraded and new not in upgraded:
+            upgraded[new] = upgraded.pop(old)
+    return upgraded
+
+
+def to_records(data: List[Any], fmt: str) -> List[Dict[str, Any]]:
+    """Converts a roster file's contents to wrestler records (dicts)."""
+    if fmt == FORMAT_WRESTLERS:
+        return [_wrestler_record(wrestler) for wrestler in data]
+    return [_legacy_record(record) for record in data]
+
+
+def canonical_bytes(records: Iterable[Mapping[str, Any]]) -> bytes:
+    """
+    Validates records in one pass and returns the canonical file contents.
+    Wrestlers are rebuilt from their stats, so match state such as lost
+    health is not carried over.
+
+    Raises:
+        ValueError: Listing every invalid or missing value.
+    """
+    roster = Roster.from_records(records)
+    return pickle.dumps(roster.roster, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def migrate_file(path: str, output: Optional[str] = None) -> MigrationResult:
+    """
+    Migrates one roster file to the canonical format.
+
+    Args:
+        path (str): The roster file.
+        output (str): Where to write it; defaults to replacing the file.
+            The write is atomic, and nothing is written for invalid files.
+
+    Returns:
+        MigrationResult: What was found and done; errors are reported here
+        rather than raised, so one bad file does not stop a batch.
+    """
+    output = path if output is None else output
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = pickle.loads(raw)
+        fmt = detect_format(data)
+    except Exception as e:  # any unpickling failure means an unusable file
+        return MigrationResult(path, "", UNREADABLE, 0, str(e) or type(e).__name__)
+    records = to_records(data, fmt)
+    try:
+        converted = canonical_bytes(records)
+    except ValueError as e:  # the validation report, listing every violation
+        return MigrationResult(path, fmt, INVALID, len(records), str(e))
+    if converted == raw and output == path:
+        return MigrationResult(path, fmt, CURRENT, len(records))
+    write_atomic(output, converted)
+    return MigrationResult(path, fmt, MIGRATED, len(records))
+
+
+def _migrate_task(paths: Tuple[str, str]) -> MigrationResult:
+    return migrate_file(*paths)
+
+
+def _file_key(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def read_progress(log_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Reads a progress log into the latest entry per file. A partly written
+    last line, left by an interrupted run, is ignored.
+    """
+    entries: Dict[str, Dict[str, Any]] = {}
+    if not os.path.exists(log_path):
+        return entries
+    with open(log_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            entries[entry["path"]] = entry
+    return entries
+
+
+def migrate_directory(
+    directory: str,
+    output_dir: Optional[str] = None,
+    workers: int = 1,
+    log_path: Optional[str] = None,
+) -> List[MigrationResult]:
+    """
+    Migrates every roster file in a directory.
+
+    Args:
+        directory (str): Where the roster files are.
+        output_dir (str): Where migrated files go; defaults to in place.
+        workers (int): Processes to migrate on; 1 runs in-process.
+        log_path (str): The progress log; defaults to PROGRESS_LOG in
+            output_dir (or directory). Entries are appended as files finish.
+
+    Returns:
+        list: A MigrationResult per roster file, sorted by file name. Files
+        the log shows as done are included with the status SKIPPED.
+    """
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError(
+            f"Invalid worker count: {workers}. Use 1 to run in-process "
+            f"or a higher number for a process pool."
+        )
+    if not os.path.isdir(directory):
+        raise FileNotFoundError(f"Roster directory '{directory}' not found.")
+    target = directory if output_dir is None else output_dir
+    os.makedirs(target, exist_ok=True)
+    if log_path is None:
+        log_path = os.path.join(target, PROGRESS_LOG)
+    done = read_progress(log_path)
+
+    results: List[MigrationResult] = []
+    tasks: List[Tuple[str, str]] = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(PICKLE_EXTENSION):
+            continue
+        path = os.path.join(directory, name)
+        output = os.path.join(target, name)
+        entry = done.get(name)
+        # The logged key is of the file as the migration left it, so any
+        # later change to it brings it back into the run
+        if (
+            entry is not None
+            and entry["status"] in (MIGRATED, CURRENT)
+            and os.path.exists(output)
+            and [entry["size"], entry["mtime_ns"]] == list(_file_key(path))
+        ):
+            results.append(
+                MigrationResult(path, entry["format"], SKIPPED, entry["wrestlers"])
+            )
+            continue
+        tasks.append((path, output))
+
+    with open(log_path, "a", encoding="utf-8") as log:
+        for result in _run(tasks, workers):
+            size, mtime_ns = _file_key(result.path)
+            entry = {
+                **result._asdict(),
+                "path": os.path.basename(result.path),
+                "size": size,
+                "mtime_ns": mtime_ns,
+            }
+            log.write(json.dumps(entry) + "\n")
+            log.flush()
+            results.append(result)
+    results.sort(key=lambda result: result.path)
+    return results
+
+
+def _run(tasks: List[Tuple[str, str]], workers: int) -> Iterable[MigrationResult]:
+    if workers > 1 and len(tasks) > 1:
+        from multiprocessing import Pool  # only needed for parallel runs
+
+        with Pool(min(workers, len(tasks))) as pool:
+            yield from pool.imap_unordered(_migrate_task, tasks)
+    else:
+        yield from map(_migrate_task, tasks)
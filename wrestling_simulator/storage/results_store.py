@@ -0,0 +1,295 @@
+"""
+SQLite results store for the wrestling simulator.
+
+This module contains the ResultsStore class which keeps match, tournament and
+bracket results in a SQLite database. The database runs in WAL mode and
+matches are buffered and written with executemany in a single transaction,
+so batch runs can insert well over 100k matches per second. Wrestlers are
+stored once and matches refer to them by integer id, which keeps the indexes
+small. Head-to-head and per-wrestler history lookups are served from indexes.
+"""
+
+import sqlite3
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+DEFAULT_BATCH_SIZE = 10000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS wrestlers (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS tournaments (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    participants INTEGER NOT NULL,
+    seed INTEGER,
+    winner TEXT,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    tournament_id INTEGER REFERENCES tournaments (id),
+    round INTEGER,
+    wrestler1 INTEGER NOT NULL REFERENCES wrestlers (id),
+    wrestler2 INTEGER NOT NULL REFERENCES wrestlers (id),
+    winner INTEGER NOT NULL REFERENCES wrestlers (id),
+    turns INTEGER NOT NULL,
+    seed INTEGER
+);
+CREATE TABLE IF NOT EXISTS brackets (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id),
+    round INTEGER NOT NULL,
+    slot INTEGER NOT NULL,
+    wrestler TEXT,
+    PRIMARY KEY (tournament_id, round, slot)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS matches_by_pair ON matches (wrestler1, wrestler2);
+CREATE INDEX IF NOT EXISTS matches_by_wrestler2 ON matches (wrestler2);
+CREATE INDEX IF NOT EXISTS matches_by_tournament ON matches (tournament_id, round)
+    WHERE tournament_id IS NOT NULL;
+"""
+
+_MATCH_COLUMNS = "id, tournament_id, round, wrestler1, wrestler2, winner, turns, seed"
+
+# (tournament_id, round, wrestler1, wrestler2, winner, turns, seed)
+MatchRow = Tuple[Optional[int], Optional[int], str, str, str, int, Optional[int]]
+# The same row with wrestler names replaced by their ids
+_IdRow = Tuple[Optional[int], Optional[int], int, int, int, int, Optional[int]]
+
+
+class MatchRecord(NamedTuple):
+    id: int
+    tournament_id: Optional[int]
+    round: Optional[int]
+    wrestler1: str
+    wrestler2: str
+    winner: str
+    turns: int
+    seed: Optional[int]
+
+
+class ResultsStore:
+    def __init__(
+        self, path: str = "results.db", batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> None:
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(
+                f"Invalid batch_size: {batch_size}. It must be a positive integer. "
+                f"Try {DEFAULT_BATCH_SIZE}."
+            )
+        self.path = path
+        self.batch_size = batch_size
+        self._pending: List[_IdRow] = []
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL only syncs at checkpoints, which is safe against corruption
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA cache_size=-65536")  # 64MB page cache
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+        self._ids: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+        for wrestler_id, name in self.conn.execute("SELECT id, name FROM wrestlers"):
+            self._ids[name] = wrestler_id
+            self._names[wrestler_id] = name
+
+    def _wrestler_id(self, name: str) -> int:
+        wrestler_id = self._ids.get(name)
+        if wrestler_id is None:
+            cursor = self.conn.execute(
+                "INSERT INTO wrestlers (name) VALUES (?)", (name,)
+            )
+            wrestler_id = int(cursor.lastrowid)  # type: ignore[arg-type]
+            self._ids[name] = wrestler_id
+            self._names[wrestler_id] = name
+        return wrestler_id
+
+    def start_tournament(
+        self, participants: int, name: Optional[str] = None, seed: Optional[int] = None
+    ) -> int:
+        """
+        Registers a new tournament.
+
+        Args:
+            participants (int): Number of entrants.
+            name (str): Optional label for the event.
+            seed (int): Optional RNG seed the tournament was run with.
+
+        Returns:
+            int: The tournament id to pass to record_match and record_bracket.
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO tournaments (name, participants, seed, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (name, participants, seed, time.time()),
+            )
+        return int(cursor.lastrowid)  # type: ignore[arg-type]
+
+    def finish_tournament(self, tournament_id: int, winner: str) -> None:
+        """Records the champion and writes any buffered matches."""
+        self.flush()
+        with self.conn:
+            self.conn.execute(
+                "UPDATE tournaments SET winner = ? WHERE id = ?",
+                (winner, tournament_id),
+            )
+
+    def record_bracket(
+        self, tournament_id: int, round: int, wrestlers: Iterable[Optional[str]]
+    ) -> None:
+        """
+        Stores the bracket for one round as a list of slots.
+
+        Args:
+            tournament_id (int): Id from start_tournament.
+            round (int): Round number, starting at 1.
+            wrestlers: Wrestler names in slot order; None marks an empty slot.
+        """
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO brackets (tournament_id, round, slot, wrestler) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (tournament_id, round, slot, wrestler)
+                    for slot, wrestler in enumerate(wrestlers)
+                ],
+            )
+
+    def record_match(
+        self,
+        wrestler1: str,
+        wrestler2: str,
+        winner: str,
+        turns: int,
+        seed: Optional[int] = None,
+        tournament_id: Optional[int] = None,
+        round: Optional[int] = None,
+    ) -> None:
+        """
+        Buffers one match result; the buffer is written every batch_size matches.
+
+        Args:
+            wrestler1 (str): Name of the first wrestler.
+            wrestler2 (str): Name of the second wrestler.
+            winner (str): Name of the winner.
+            turns (int): Length of the match in turns.
+            seed (int): Optional RNG seed the match was run with.
+            tournament_id (int): Optional id from start_tournament.
+            round (int): Optional round number within the tournament.
+        """
+        # ids start at 1, so a falsy lookup means the wrestler is new
+        ids = self._ids
+        self._pending.append(
+            (
+                tournament_id,
+                round,
+                ids.get(wrestler1) or self._wrestler_id(wrestler1),
+                ids.get(wrestler2) or self._wrestler_id(wrestler2),
+                ids.get(winner) or self._wrestler_id(winner),
+                turns,
+                seed,
+            )
+        )
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def record_matches(self, rows: Iterable[MatchRow]) -> None:
+        """
+        Writes many matches in one transaction, bypassing the buffer.
+
+        Args:
+            rows: Tuples of (tournament_id, round, wrestler1, wrestler2, winner,
+                turns, seed).
+        """
+        self.flush()
+        ids = self._wrestler_id
+        self._insert(
+            [
+                (t_id, rnd, ids(w1), ids(w2), ids(winner), turns, seed)
+                for t_id, rnd, w1, w2, winner, turns, seed in rows
+            ]
+        )
+
+    def flush(self) -> None:
+        """Writes every buffered match."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._insert(pending)
+
+    def _insert(self, rows: List[_IdRow]) -> None:
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO matches (tournament_id, round, wrestler1, wrestler2, "
+                "winner, turns, seed) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def _records(self, rows: Iterable[tuple]) -> List[MatchRecord]:
+        names = self._names
+        return [
+            MatchRecord(
+                match_id, t_id, rnd, names[w1], names[w2], names[w], turns, seed
+            )
+            for match_id, t_id, rnd, w1, w2, w, turns, seed in rows
+        ]
+
+    def head_to_head(self, wrestler1: str, wrestler2: str) -> List[MatchRecord]:
+        """
+        Returns every match between two wrestlers, in the order they were recorded.
+        """
+        self.flush()
+        id1, id2 = self._ids.get(wrestler1), self._ids.get(wrestler2)
+        if id1 is None or id2 is None:
+            return []
+        rows = self.conn.execute(
+            f"SELECT {_MATCH_COLUMNS} FROM matches WHERE wrestler1 = ? AND wrestler2 = ? "
+            f"UNION ALL "
+            f"SELECT {_MATCH_COLUMNS} FROM matches WHERE wrestler1 = ? AND wrestler2 = ? "
+            f"ORDER BY id",
+            (id1, id2, id2, id1),
+        )
+        return self._records(rows)
+
+    def wrestler_history(
+        self, wrestler: str, limit: Optional[int] = None
+    ) -> List[MatchRecord]:
+        """
+        Returns a wrestler's matches, most recent first.
+
+        Args:
+            wrestler (str): The wrestler's name.
+            limit (int): Optional maximum number of matches to return.
+        """
+        self.flush()
+        wrestler_id = self._ids.get(wrestler)
+        if wrestler_id is None:
+            return []
+        rows = self.conn.execute(
+            f"SELECT {_MATCH_COLUMNS} FROM matches WHERE wrestler1 = ? "
+            f"UNION ALL "
+            f"SELECT {_MATCH_COLUMNS} FROM matches WHERE wrestler2 = ? "
+            f"ORDER BY id DESC LIMIT ?",
+            (wrestler_id, wrestler_id, -1 if limit is None else limit),
+        )
+        return self._records(rows)
+
+    def wrestler_record(self, wrestler: str) -> Tuple[int, int]:
+        """Returns a wrestler's (wins, losses) across every stored match."""
+        history = self.wrestler_history(wrestler)
+        wins = sum(1 for match in history if match.winner == wrestler)
+        return wins, len(history) - wins
+
+    def close(self) -> None:
+        """Writes buffered matches and closes the database."""
+        self.flush()
+        self.conn.close()
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -2,14 +2,51 @@
 Utility functions for the wrestling simulator.
 
 This module contains helper functions and utilities used throughout the package.
+They are imported lazily, the first time each name is used.
 """
 
-from .file_utils import load_wrestler_names, get_data_path
-from .validation import validate_wrestler_stats, validate_tournament_size
+from .._lazy import attach
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .file_utils import load_wrestler_names, get_data_path, AtomicFile, write_atomic
+    from .validation import (
+        validate_wrestler_stats,
+        validate_tournament_size,
+        validate_records,
+        validate_columns,
+        ValidationReport,
+        Violation,
+    )
+    from .tables import TableWriter
 
 __all__ = [
     "load_wrestler_names",
     "get_data_path",
+    "AtomicFile",
+    "write_atomic",
     "validate_wrestler_stats",
     "validate_tournament_size",
+    "validate_records",
+    "validate_columns",
+    "ValidationReport",
+    "Violation",
+    "TableWriter",
 ]
+
+__getattr__, __dir__ = attach(
+    __name__,
+    {
+        "load_wrestler_names": ".file_utils",
+        "get_data_path": ".file_utils",
+        "AtomicFile": ".file_utils",
+        "write_atomic": ".file_utils",
+        "validate_wrestler_stats": ".validation",
+        "validate_tournament_size": ".validation",
+        "validate_records": ".validation",
+        "validate_columns": ".validation",
+        "ValidationReport": ".validation",
+        "Violation": ".validation",
+        "TableWriter": ".tables",
+    },
+)
@@ -3,7 +3,7 @@ File utility functions for the Wrestling Simulator.
 """
 
 import os
-from typing import List
+from typing import Any, List
 
 
 def get_data_path() -> str:
@@ -49,6 +49,9 @@ def load_wrestler_names_from_file(path: str) -> List[str]:
     """
     Load wrestler names from a user-supplied text file.
 
+    Blank lines and lines starting with "#" are skipped, as in
+    sample_wrestlers.txt.
+
     Args:
         path: Path to the text file containing wrestler names (one per line)
 
@@ -63,9 +66,65 @@ def load_wrestler_names_from_file(path: str) -> List[str]:
         raise FileNotFoundError(f"File not found: {path}")
 
     with open(path, "r", encoding="utf-8") as f:
-        names = [line.strip() for line in f if line.strip()]
+        names = [
+            name for name in map(str.strip, f) if name and not name.startswith("#")
+        ]
 
     if not names:
         raise ValueError("No valid wrestler names found in the file.")
 
     return names
+
+
+class AtomicFile:
+    """
+    A binary file that only appears at its path once it is complete.
+
+    Writes go to a temporary file next to the path; commit() syncs it to disk
+    and moves it into place, so an interruption never leaves a half-written
+    file. As a context manager it commits on success and discards on error.
+
+    Args:
+        path: Where the finished file goes
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.temp_path = f"{path}.tmp"
+        self.file = open(self.temp_path, "wb")
+
+    @property
+    def closed(self) -> bool:
+        return self.file.closed
+
+    def write(self, data: bytes) -> int:
+        return self.file.write(data)
+
+    def commit(self) -> None:
+        """Syncs the file and moves it into place."""
+        if not self.file.closed:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+            os.replace(self.temp_path, self.path)
+
+    def discard(self) -> None:
+        """Removes the partly written file."""
+        if not self.file.closed:
+            self.file.close()
+            os.remove(self.temp_path)
+
+    def __enter__(self) -> "AtomicFile":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: object) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Writes a whole file through AtomicFile."""
+    with AtomicFile(path) as f:
+        f.write(data)
@@ -0,0 +1,79 @@
+"""
+Streaming table output for the wrestling simulator.
+
+This module contains TableWriter, which writes rows to a text stream as CSV
+or as a Markdown table as they are produced. Nothing is kept once a row is
+written, so a table with a million rows costs no more memory than one with
+ten.
+"""
+
+import csv
+from typing import Any, Iterable, List, Sequence, TextIO
+
+TABLE_FORMATS = ("csv", "markdown")
+DEFAULT_PRECISION = 4  # decimal places for floats
+
+
+class TableWriter:
+    def __init__(
+        self,
+        stream: TextIO,
+        columns: Sequence[str],
+        fmt: str = "csv",
+        precision: int = DEFAULT_PRECISION,
+    ) -> None:
+        """
+        Writes the header straight away; rows follow with writerow().
+
+        Args:
+            stream (file): A text stream; open files need ``newline=""``
+                for CSV.
+            columns (list): The column headings.
+            fmt (str): "csv" or "markdown".
+            precision (int): Decimal places for float cells.
+        """
+        if fmt not in TABLE_FORMATS:
+            raise ValueError(
+                f"Invalid table format '{fmt}'. "
+                f"Valid formats are: {', '.join(TABLE_FORMATS)}."
+            )
+        self.stream = stream
+        self.columns = tuple(columns)
+        self.fmt = fmt
+        self.precision = precision
+        self.rows = 0
+        if fmt == "csv":
+            self._csv = csv.writer(stream)
+            self._csv.writerow(self.columns)
+        else:
+            stream.write(self._markdown_row(self.columns))
+            stream.write("|" + "---|" * len(self.columns) + "\n")
+
+    def _cells(self, row: Iterable[Any]) -> List[str]:
+        precision = self.precision
+        return [
+            f"{value:.{precision}f}" if isinstance(value, float) else str(value)
+            for value in row
+        ]
+
+    @staticmethod
+    def _markdown_row(cells: Iterable[str]) -> str:
+        return "| " + " | ".join(cell.replace("|", "\\|") for cell in cells) + " |\n"
+
+    def writerow(self, row: Sequence[Any]) -> None:
+        """Writes one row; it must have a value for every column."""
+        if len(row) != len(self.columns):
+            raise ValueError(
+                f"Row has {len(row)} values but the table has "
+                f"{len(self.columns)} columns."
+            )
+        if self.fmt == "csv":
+            self._csv.writerow(self._cells(row))
+        else:
+            self.stream.write(self._markdown_row(self._cells(row)))
+        self.rows += 1
+
+    def writerows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Writes rows from any iterable, e.g. a generator, one at a time."""
+        for row in rows:
+            self.writerow(row)
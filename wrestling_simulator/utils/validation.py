@@ -2,7 +2,204 @@
 Validation utility functions for the wrestling simulator.
 """
 
-from typing import Dict, Any, Callable, Tuple
+from array import array
+from operator import itemgetter
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from ..constants import VALID_GENDERS
+from ..schema import SCHEMA
+
+RECORD_FIELDS = ("name", "gender") + SCHEMA.names
+
+_GENDERS = frozenset(VALID_GENDERS)
+_INT_TYPECODES = frozenset("bBhHiIlLqQ")
+_MISSING = object()
+_MESSAGES: Dict[str, str] = {
+    "name": (
+        "Invalid name: {}. Name must be a string (e.g., 'The Rock' or 'Stone Cold')"
+    ),
+    "gender": "Invalid gender: {}. Gender must be 'male', 'female', or 'other'",
+}
+
+
+class Violation(NamedTuple):
+    row: int
+    field: str
+    value: Any  # None when the field is missing
+    allowed: str  # e.g. "40-100"
+
+
+class ValidationReport:
+    """Every violation found in a table of wrestler records."""
+
+    def __init__(self, rows: int, violations: List[Violation]) -> None:
+        self.rows = rows
+        self.violations = sorted(violations, key=lambda v: (v.row, _order(v.field)))
+
+    @property
+    def ok(self) -> bool:
+        return not self.violations
+
+    def __len__(self) -> int:
+        return len(self.violations)
+
+    def __iter__(self) -> Iterator[Violation]:
+        return iter(self.violations)
+
+    def bad_rows(self) -> List[int]:
+        """Returns the rows with at least one violation, in order."""
+        return sorted({violation.row for violation in self.violations})
+
+    def format(self, limit: Optional[int] = 20) -> str:
+        """
+        Describes the violations, one per line.
+
+        Args:
+            limit (int): Maximum number of lines; None lists every violation.
+        """
+        shown = self.violations if limit is None else self.violations[:limit]
+        lines = [
+            f"{len(self.violations)} invalid value(s) in "
+            f"{len(self.bad_rows())} of {self.rows} record(s):"
+        ]
+        for violation in shown:
+            if violation.allowed == "required":
+                lines.append(f"  row {violation.row}: {violation.field} is missing")
+            else:
+                lines.append(
+                    f"  row {violation.row}: {violation.field}={violation.value!r} "
+                    f"(allowed: {violation.allowed})"
+                )
+        if len(shown) < len(self.violations):
+            lines.append(f"  ... and {len(self.violations) - len(shown)} more")
+        return "\n".join(lines)
+
+    def raise_if_invalid(self) -> None:
+        """Raises ValueError describing every violation, if there are any."""
+        if self.violations:
+            raise ValueError(self.format())
+
+
+def _order(field: str) -> int:
+    return RECORD_FIELDS.index(field) if field in RECORD_FIELDS else len(RECORD_FIELDS)
+
+
+def _check_range(
+    field: str, low: int, high: int, values: Sequence[Any], out: List[Violation]
+) -> None:
+    allowed = f"{low}-{high}"
+    if isinstance(values, array) and values.typecode in _INT_TYPECODES:
+        if not values or (low <= min(values) and max(values) <= high):
+            return
+        bad = [i for i, v in enumerate(values) if not low <= v <= high]
+    else:
+        bad = [
+            i
+            for i, v in enumerate(values)
+            if not isinstance(v, int) or not low <= v <= high
+        ]
+    out.extend(Violation(i, field, values[i], allowed) for i in bad)
+
+
+def _check_columns(columns: Mapping[str, Sequence[Any]], out: List[Violation]) -> None:
+    names = columns.get("name")
+    if names is not None:
+        out.extend(
+            Violation(i, "name", v, "a string")
+            for i, v in enumerate(names)
+            if not isinstance(v, str)
+        )
+    genders = columns.get("gender")
+    if genders is not None:
+        allowed = "one of " + ", ".join(VALID_GENDERS)
+        out.extend(
+            Violation(i, "gender", v, allowed)
+            for i, v in enumerate(genders)
+            if v not in _GENDERS
+        )
+    for field in SCHEMA.fields:
+        values = columns.get(field.name)
+        if values is not None:
+            _check_range(field.name, field.low, field.high, values, out)
+
+
+def validate_columns(columns: Mapping[str, Sequence[Any]]) -> ValidationReport:
+    """
+    Validates wrestler stats stored column-wise, e.g. one ``array`` per stat.
+
+    Each column is checked in a single pass; integer arrays whose minimum and
+    maximum are in range are accepted without looking at each value.
+
+    Args:
+        columns: Field name -> values, all the same length. Fields that are
+            not present are not checked.
+
+    Returns:
+        ValidationReport: Every violation, ordered by row.
+    """
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(
+            f"Columns have different lengths: {sorted(lengths)}. "
+            f"Every column needs one value per wrestler."
+        )
+    rows = lengths.pop() if lengths else 0
+    violations: List[Violation] = []
+    _check_columns(columns, violations)
+    return ValidationReport(rows, violations)
+
+
+def validate_records(
+    records: Iterable[Mapping[str, Any]], required: bool = True
+) -> ValidationReport:
+    """
+    Validates a table of wrestler records (dicts with RECORD_FIELDS keys).
+
+    The records are split into columns once and each column is checked in a
+    single pass, so every problem in the table is reported together instead
+    of stopping at the first one. Extra keys are ignored.
+
+    Args:
+        records: The records, e.g. rows of an imported dataset.
+        required (bool): Report missing fields; False only checks the
+            fields each record has.
+
+    Returns:
+        ValidationReport: Every violation, ordered by row.
+    """
+    records = records if isinstance(records, Sequence) else list(records)
+    violations: List[Violation] = []
+    columns: Dict[str, List[Any]] = {}
+    for field in RECORD_FIELDS:
+        try:
+            columns[field] = list(map(itemgetter(field), records))
+            continue
+        except KeyError:
+            pass
+        # Some records lack the field: check the rest and map rows back
+        column = [record.get(field, _MISSING) for record in records]
+        present = [i for i, v in enumerate(column) if v is not _MISSING]
+        if required:
+            violations.extend(
+                Violation(i, field, None, "required")
+                for i, v in enumerate(column)
+                if v is _MISSING
+            )
+        found: List[Violation] = []
+        _check_columns({field: [column[i] for i in present]}, found)
+        violations.extend(v._replace(row=present[v.row]) for v in found)
+    _check_columns(columns, violations)
+    return ValidationReport(len(records), violations)
 
 
 def validate_wrestler_stats(stats: Dict[str, Any]) -> None:
@@ -10,60 +207,29 @@ def validate_wrestler_stats(stats: Dict[str, Any]) -> None:
     Validate wrestler statistics.
 
     Args:
-        stats: Dictionary containing wrestler stats
+        stats: Dictionary containing wrestler stats; missing stats are not checked
 
     Raises:
-        ValueError: If any stat is invalid
+        ValueError: If any stat is invalid, describing every invalid stat
     """
-    validations: Dict[str, Tuple[Callable[[Any], bool], str]] = {
-        "name": (
-            lambda x: isinstance(x, str),
-            "Name must be a string (e.g., 'The Rock' or 'Stone Cold')",
-        ),
-        "gender": (
-            lambda x: x in ["male", "female", "other"],
-            "Gender must be 'male', 'female', or 'other'",
-        ),
-        "strength": (
-            lambda x: isinstance(x, int) and 40 <= x <= 100,
-            "Strength must be between 40-100 (determines damage resistance, try 70 or 85)",
-        ),
-        "speed": (
-            lambda x: isinstance(x, int) and 30 <= x <= 100,
-            "Speed must be between 30-100 (affects attack speed, try 65 or 80)",
-        ),
-        "agility": (
-            lambda x: isinstance(x, int) and 10 <= x <= 100,
-            "Agility must be between 10-100 (helps escape moves, try 50 or 75)",
-        ),
-        "health": (
-            lambda x: isinstance(x, int) and 80 <= x <= 200,
-            "Health must be between 80-200 (total damage capacity, try 120 or 160)",
-        ),
-        "power": (
-            lambda x: isinstance(x, int) and 50 <= x <= 100,
-            "Power must be between 50-100 (attack damage output, try 75 or 90)",
-        ),
-        "grapple": (
-            lambda x: isinstance(x, int) and 1 <= x <= 20,
-            "Grapple must be between 1-20 (grappling success rate, try 10 or 15)",
-        ),
-        "stamina": (
-            lambda x: isinstance(x, int) and 30 <= x <= 100,
-            "Stamina must be between 30-100 (special move frequency, try 60 or 80)",
-        ),
-    }
-
-    for stat_name, (validator, error_msg) in validations.items():
-        if stat_name in stats:
-            if not validator(stats[stat_name]):
-                actual_value = stats[stat_name]
-                raise ValueError(f"Invalid {stat_name}: {actual_value}. {error_msg}")
+    report = validate_records([stats], required=False)
+    if not report.ok:
+        raise ValueError(
+            "\n".join(
+                (
+                    _MESSAGES[v.field].format(v.value)
+                    if v.field in _MESSAGES
+                    else SCHEMA.field(v.field).error(v.value)
+                )
+                for v in report
+            )
+        )
 
 
 def validate_tournament_size(size: int) -> None:
     """
-    Validate tournament size.
+    Validate tournament size. Any size from 4 up is accepted; sizes that
+    are not a power of 2 are padded out with byes for the top seeds.
 
     Args:
         size: Number of participants
@@ -82,22 +248,3 @@ def validate_tournament_size(size: int) -> None:
             f"Tournament size too small: {size}. "
             f"Tournament must have at least 4 participants. Try 4, 8, or 16."
         )
-
-    if size % 2 != 0:
-        raise ValueError(
-            f"Invalid tournament size: {size}. "
-            f"Tournament size must be even (divisible by 2). Try {size - 1} or {size + 1}."
-        )
-
-    # Check if it's a power of 2 (optional but common for tournaments)
-    if size & (size - 1) != 0:
-        # Find nearest power of 2
-        import math
-
-        lower = 2 ** math.floor(math.log2(size))
-        upper = 2 ** math.ceil(math.log2(size))
-        raise ValueError(
-            f"Invalid tournament size: {size}. "
-            f"Tournament size should be a power of 2 for proper bracket structure. "
-            f"Try {lower} or {upper} participants instead."
-        )